@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from packages.ml_api.api.validation import WeldingDataRequestSchema, validate_inputs
+
+BATCH_SIZES = [1, 10, 100, 1000, 10000]
+
+
+def _schema_per_row(inputs):
+    """Baseline: a fresh schema per request and one marshmallow load per row."""
+    schema = WeldingDataRequestSchema()
+    rows = [schema.load(item) for item in inputs["inputs"]]
+    features = config.ml_model_config.features
+    return np.array([[row[feature] for feature in features] for row in rows], dtype=np.float64)
+
+
+def _vectorised(inputs):
+    return validate_inputs(input_data=inputs)
+
+
+def _time_per_call(func, inputs, *, min_time: float = 0.5) -> float:
+    func(inputs)
+    repeats, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while elapsed < min_time:
+        func(inputs)
+        repeats += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / repeats
+
+
+def run_benchmark() -> None:
+    """Print the per-row cost of per-row marshmallow vs vectorised validation."""
+    print(f"{'rows':>8} {'marshmallow us/row':>19} {'vectorised us/row':>18} {'speedup':>8}")
+    for size in BATCH_SIZES:
+        # Decoded JSON: plain dicts of Python numbers
+        inputs = {"inputs": make_welding_frame(size, seed=0).to_dict(orient="records")}
+        baseline = _time_per_call(_schema_per_row, inputs)
+        vectorised = _time_per_call(_vectorised, inputs)
+        print(
+            f"{size:>8} {baseline * 1e6 / size:>19.2f} {vectorised * 1e6 / size:>18.2f} "
+            f"{baseline / vectorised:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
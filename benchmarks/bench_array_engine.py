@@ -0,0 +1,53 @@
+import sys
+import warnings
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+from benchmarks.bench_predict import _time_per_row
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.predict import _array_engine, _engine, make_prediction
+
+BATCH_SIZES = [1, 8, 64, 512]
+
+
+def run_benchmark() -> None:
+    """Compare the DataFrame pipeline with the array engine on small batches.
+
+    ``overhead`` is the array engine's cost per row beyond CatBoost tree
+    evaluation on already transformed data.
+    """
+    warnings.simplefilter("ignore")
+    print(
+        f"{'rows':>6} {'make_prediction(df)':>20} {'make_prediction(np)':>20} "
+        f"{'pipeline':>10} {'array':>10} {'trees':>10} {'overhead':>9}  (us/row)"
+    )
+    for batch_size in BATCH_SIZES:
+        frame = make_welding_frame(batch_size)[config.ml_model_config.features]
+        values = frame.to_numpy(dtype=float)
+        transformed = _array_engine.transform(values)
+
+        def trees_only(X):
+            return _array_engine.model.predict(
+                X, prediction_type="Probability", thread_count=_array_engine.thread_count
+            )
+
+        timings = [
+            _time_per_row(lambda X: make_prediction(input_data=X), frame),
+            _time_per_row(lambda X: make_prediction(input_data=X), values),
+            _time_per_row(_engine.predict, frame),
+            _time_per_row(_array_engine.predict, values),
+            _time_per_row(trees_only, transformed),
+        ]
+        timings = [value * 1e6 for value in timings]
+        print(
+            f"{batch_size:>6} {timings[0]:>20.2f} {timings[1]:>20.2f} {timings[2]:>10.2f} "
+            f"{timings[3]:>10.2f} {timings[4]:>10.2f} {timings[3] - timings[4]:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path; the API imports itself as ``catboost_ml``
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+sys.path.append(str(PACKAGE_ROOT.parent))
+
+import json
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.bench_batching import PORT, _client
+from benchmarks.synthetic import make_welding_frame
+
+CONCURRENCY = [1, 8, 32]
+ROWS_PER_REQUEST = [1, 500]
+REQUESTS = 800
+
+
+def _serve(mode: str, ready) -> None:
+    import logging
+    import warnings
+
+    warnings.simplefilter("ignore")
+    logging.disable(logging.CRITICAL)
+    from catboost_ml.packages.ml_api.api.config import Config
+
+    if mode == "flask":
+        from werkzeug.serving import make_server
+
+        from catboost_ml.packages.ml_api.api.app import create_app
+
+        server = make_server("127.0.0.1", PORT, create_app(config_object=Config), threaded=True)
+        ready.set()
+        server.serve_forever()
+    else:
+        import uvicorn
+
+        from catboost_ml.packages.ml_api.api.asgi import create_asgi_app
+
+        server = uvicorn.Server(uvicorn.Config(
+            create_asgi_app(config_object=Config),
+            host="127.0.0.1", port=PORT, log_level="error", access_log=False,
+        ))
+        threading.Timer(1.0, ready.set).start()
+        server.run()
+
+
+def _load_test(concurrency: int, rows: int):
+    # Fewer requests for large bodies keeps every run a few seconds long
+    n_requests = REQUESTS // max(1, rows // 10)
+    records = make_welding_frame(n_requests * rows, seed=0).to_dict(orient="records")
+    bodies = [
+        json.dumps({"inputs": records[i * rows:(i + 1) * rows]})
+        for i in range(n_requests)
+    ]
+    latencies = []
+    threads = [
+        threading.Thread(target=_client, args=(bodies[i::concurrency], latencies))
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(latencies) * rows / elapsed, np.percentile(latencies, 99)
+
+
+def run_benchmark() -> None:
+    """Print rows/s and p99 latency of the Flask and ASGI serving modes."""
+    context = multiprocessing.get_context("spawn")
+    print(f"{'mode':>6} {'rows/req':>9} {'clients':>8} {'rows/s':>9} {'p99 ms':>8}")
+    for mode in ("flask", "asgi"):
+        ready = context.Event()
+        server = context.Process(target=_serve, args=(mode, ready), daemon=True)
+        server.start()
+        try:
+            if not ready.wait(timeout=120):
+                raise RuntimeError("prediction server did not start")
+            time.sleep(0.5)
+            _load_test(4, 1)  # warm up
+            for rows in ROWS_PER_REQUEST:
+                for concurrency in CONCURRENCY:
+                    throughput, p99 = _load_test(concurrency, rows)
+                    print(f"{mode:>6} {rows:>9} {concurrency:>8} {throughput:>9.0f} {p99 * 1e3:>8.2f}")
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_dataset
+from classification_model.batch_score import score_file
+from classification_model.processing.resources import available_cpus
+
+
+def _baseline(input_path: Path, output_path: Path) -> None:
+    """The only option before: read the whole file and call make_prediction once."""
+    import pandas as pd
+
+    from classification_model.predict import make_prediction
+
+    data = pd.read_csv(input_path)
+    result = make_prediction(input_data=data)
+    proba = np.asarray(result["prediction_probabilities"])
+    pd.DataFrame({
+        "PIPE_NO": data["PIPE_NO"],
+        "prediction": result["predictions"],
+        "probability_0": proba[:, 0],
+        "probability_1": proba[:, 1],
+    }).to_csv(output_path, index=False)
+
+
+def run_benchmark(*, rows: int) -> None:
+    """Print rows/s of in-process scoring vs the sharded CLI across worker counts."""
+    warnings.simplefilter("ignore")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = Path(tmp_dir) / "to_score.csv"
+        make_welding_dataset(rows, seed=0).to_csv(input_path, index=False)
+        output_path = Path(tmp_dir) / "scored.csv"
+
+        print(f"{rows:,} rows, {available_cpus()} CPUs available")
+        print(f"{'mode':>22} {'seconds':>8} {'rows/s':>10}")
+        start = time.perf_counter()
+        _baseline(input_path, output_path)
+        elapsed = time.perf_counter() - start
+        print(f"{'make_prediction':>22} {elapsed:>8.2f} {rows / elapsed:>10.0f}")
+
+        worker_counts = sorted({1, min(2, available_cpus()), available_cpus()})
+        for n_workers in worker_counts:
+            with contextlib.redirect_stdout(io.StringIO()):
+                summary = score_file(
+                    input_path=input_path,
+                    output_path=output_path,
+                    n_workers=n_workers,
+                    id_columns=["PIPE_NO"],
+                )
+            label = f"batch_score x{summary['workers']}"
+            print(f"{label:>22} {summary['seconds']:>8.2f} {summary['rows_per_second']:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    run_benchmark(rows=parser.parse_args().rows)
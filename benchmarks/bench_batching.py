@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path; the API imports itself as ``catboost_ml``
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+sys.path.append(str(PACKAGE_ROOT.parent))
+
+import http.client
+import json
+import multiprocessing
+import threading
+import time
+import warnings
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_frame
+
+CONCURRENCY = [1, 8, 32]
+REQUESTS_PER_CLIENT = 200
+PORT = 5099
+
+
+def _serve(batching: bool, ready) -> None:
+    warnings.simplefilter("ignore")
+    import logging
+
+    from werkzeug.serving import make_server
+
+    from catboost_ml.packages.ml_api.api.app import create_app
+    from catboost_ml.packages.ml_api.api.config import Config
+
+    class BenchConfig(Config):
+        PREDICTION_BATCHING = batching
+
+    logging.disable(logging.CRITICAL)
+    server = make_server("127.0.0.1", PORT, create_app(config_object=BenchConfig), threaded=True)
+    ready.set()
+    server.serve_forever()
+
+
+def _client(bodies, latencies) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", PORT)
+    headers = {"Content-Type": "application/json"}
+    for body in bodies:
+        start = time.perf_counter()
+        connection.request("POST", "/v1/predict/classification", body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        assert response.status == 200, response.status
+    connection.close()
+
+
+def _load_test(concurrency: int):
+    frame = make_welding_frame(concurrency * REQUESTS_PER_CLIENT, seed=0)
+    records = frame.to_dict(orient="records")
+    bodies = [json.dumps({"inputs": [record]}) for record in records]
+    latencies = []
+    threads = [
+        threading.Thread(
+            target=_client,
+            args=(bodies[i::concurrency], latencies),
+        )
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+
+def run_benchmark() -> None:
+    """Print throughput and latency of single-row requests with batching off and on."""
+    context = multiprocessing.get_context("spawn")
+    print(f"{'batching':>9} {'clients':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for batching in (False, True):
+        ready = context.Event()
+        server = context.Process(target=_serve, args=(batching, ready), daemon=True)
+        server.start()
+        try:
+            if not ready.wait(timeout=120):
+                raise RuntimeError("prediction server did not start")
+            _load_test(4)  # warm up
+            for concurrency in CONCURRENCY:
+                throughput, p50, p99 = _load_test(concurrency)
+                print(
+                    f"{'on' if batching else 'off':>9} {concurrency:>8} {throughput:>8.0f} "
+                    f"{p50 * 1e3:>8.2f} {p99 * 1e3:>8.2f}"
+                )
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,121 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path; the API imports itself as ``catboost_ml``
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+sys.path.append(str(PACKAGE_ROOT.parent))
+
+import http.client
+import json
+import multiprocessing
+import time
+
+from benchmarks.bench_batching import PORT
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from packages.ml_api.api import bulk
+
+ROW_COUNTS = [100_000, 1_000_000, 5_000_000]
+SEND_CHUNK = 1 << 20
+# The JSON route holds the whole request in memory; skip it for larger runs
+JSON_MAX_ROWS = 1_000_000
+
+
+def _serve(ready) -> None:
+    import logging
+    import warnings
+
+    from werkzeug.serving import make_server
+
+    from catboost_ml.packages.ml_api.api.app import create_app
+    from catboost_ml.packages.ml_api.api.config import Config
+
+    warnings.simplefilter("ignore")
+    logging.disable(logging.CRITICAL)
+    server = make_server("127.0.0.1", PORT, create_app(config_object=Config), threaded=True)
+    ready.set()
+    server.serve_forever()
+
+
+def _peak_mib(pid: int, *, reset: bool = False) -> float:
+    """Peak RSS of ``pid`` in MiB; ``reset`` restarts the peak at the current RSS."""
+    if reset:
+        Path(f"/proc/{pid}/clear_refs").write_text("5")
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def _post(path: str, body: bytes, content_type: str) -> bytes:
+    connection = http.client.HTTPConnection("127.0.0.1", PORT)
+    chunks = (body[i:i + SEND_CHUNK] for i in range(0, len(body), SEND_CHUNK))
+    connection.request(
+        "POST", path, body=chunks, encode_chunked=True,
+        headers={"Content-Type": content_type, "Transfer-Encoding": "chunked"},
+    )
+    response = connection.getresponse()
+    data = response.read()
+    assert response.status == 200, data[:200]
+    connection.close()
+    return data
+
+
+def _json_columnar(frame):
+    body = json.dumps(frame.to_dict(orient="list")).encode()
+    return "/v1/predict/classification", body, "application/json"
+
+
+def _raw_float32(frame):
+    X = frame[config.ml_model_config.features].to_numpy(dtype="<f4")
+    body = bulk.RAW_HEADER.pack(bulk.RAW_MAGIC, X.shape[1]) + X.tobytes()
+    return "/v1/predict/classification/bulk", body, bulk.RAW_MIMETYPE
+
+
+def _arrow_stream(frame):
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(frame[config.ml_model_config.features], preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=65536)
+    return "/v1/predict/classification/bulk", sink.getvalue().to_pybytes(), bulk.ARROW_MIMETYPE
+
+
+def run_benchmark() -> None:
+    """Print throughput and server peak memory of JSON vs binary bulk scoring."""
+    encodings = {"json columnar": _json_columnar, "raw float32": _raw_float32}
+    if bulk.pa is not None:
+        encodings["arrow stream"] = _arrow_stream
+
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    server = context.Process(target=_serve, args=(ready,), daemon=True)
+    server.start()
+    try:
+        if not ready.wait(timeout=120):
+            raise RuntimeError("prediction server did not start")
+        print(f"{'rows':>9} {'encoding':>14} {'request MiB':>12} {'seconds':>8} {'rows/s':>10} {'server peak +MiB':>17}")
+        for rows in ROW_COUNTS:
+            frame = make_welding_frame(rows, seed=0)
+            for name, encode in encodings.items():
+                if name == "json columnar" and rows > JSON_MAX_ROWS:
+                    continue
+                path, body, content_type = encode(frame)
+                baseline = _peak_mib(server.pid, reset=True)
+                start = time.perf_counter()
+                _post(path, body, content_type)
+                elapsed = time.perf_counter() - start
+                growth = _peak_mib(server.pid) - baseline
+                print(
+                    f"{rows:>9} {name:>14} {len(body) / 2**20:>12.1f} {elapsed:>8.2f} "
+                    f"{rows / elapsed:>10.0f} {growth:>17.1f}"
+                )
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import contextlib
+import io
+import shutil
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from catboost import Pool
+from sklearn.base import clone
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import StratifiedKFold, train_test_split
+from sklearn.pipeline import Pipeline
+
+from benchmarks.synthetic import make_welding_dataset
+from classification_model.config.core import config
+from classification_model.cross_validate import run_cross_validation
+from classification_model.pipeline import classification_pipe
+from classification_model.processing import data_manager
+from classification_model.processing.resources import available_cpus
+
+N_ROWS = 200_000
+N_FOLDS = 5
+
+# Trees per fold; early stopping may keep fewer
+ITERATIONS = 200
+
+
+def _serial_retrains(data: pd.DataFrame) -> float:
+    """Baseline: one retrain per fold from raw rows, early-stopped on a split of its training rows."""
+    model_config = config.ml_model_config
+    X, y = data[model_config.features], data[model_config.target].to_numpy()
+    splitter = StratifiedKFold(n_splits=N_FOLDS, shuffle=True, random_state=model_config.random_state)
+    scores = []
+    for train_index, test_index in splitter.split(X, y):
+        fit_index, validation_index = train_test_split(
+            train_index,
+            test_size=model_config.test_size,
+            random_state=model_config.random_state,
+            stratify=y[train_index],
+        )
+        pipe = clone(classification_pipe)
+        pipe.set_params(classifier__allow_writing_files=False)
+        preprocessor = Pipeline(pipe.steps[:-1]).fit(X.iloc[fit_index], y[fit_index])
+        fit_pool = Pool(preprocessor.transform(X.iloc[fit_index]), label=y[fit_index])
+        validation_pool = Pool(
+            preprocessor.transform(X.iloc[validation_index]), label=y[validation_index]
+        )
+        classifier = pipe.named_steps["classifier"]
+        classifier.fit(fit_pool, eval_set=validation_pool)
+        proba = classifier.predict_proba(preprocessor.transform(X.iloc[test_index]))[:, 1]
+        scores.append(roc_auc_score(y[test_index], proba))
+    return float(np.mean(scores))
+
+
+def run_benchmark() -> None:
+    """Print the time of a k-fold evaluation: serial retrains against shared-pool cross-validation."""
+    warnings.simplefilter("ignore")
+    params = config.ml_model_config.catboost_params
+    saved = (
+        config.app_config.training_data_file,
+        data_manager.DATASET_CACHE_DIR,
+        params["iterations"],
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        data_manager.DATASET_CACHE_DIR = tmp_dir / "cache"
+        params["iterations"] = ITERATIONS
+        try:
+            data = make_welding_dataset(N_ROWS, seed=0)
+            csv_path = tmp_dir / "welds.csv"
+            data.to_csv(csv_path, index=False)
+            config.app_config.training_data_file = str(csv_path)
+            cpus = available_cpus()
+            print(f"{N_ROWS:,} rows, {N_FOLDS} folds, {ITERATIONS} iterations, {cpus} CPU(s)")
+            print(f"{'run':<34} {'seconds':>8} {'mean ROC AUC':>13}")
+
+            start = time.perf_counter()
+            auc = _serial_retrains(data)
+            print(f"{'serial retrains':<34} {time.perf_counter() - start:>8.1f} {auc:>13.4f}")
+
+            runs = [
+                ("cross-validation, cold cache", 1, True),
+                ("cross-validation, pools reused", 1, False),
+                (f"cross-validation, workers: {min(N_FOLDS, cpus)}", N_FOLDS, False),
+            ]
+            for name, n_workers, cold in runs:
+                if cold:
+                    shutil.rmtree(data_manager.DATASET_CACHE_DIR, ignore_errors=True)
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    report = run_cross_validation(
+                        n_folds=N_FOLDS, n_workers=n_workers, output=tmp_dir / "cv_report.json"
+                    )
+                print(
+                    f"{name:<34} {time.perf_counter() - start:>8.1f} "
+                    f"{report['summary']['roc_auc']['mean']:>13.4f}"
+                )
+        finally:
+            (
+                config.app_config.training_data_file,
+                data_manager.DATASET_CACHE_DIR,
+                params["iterations"],
+            ) = saved
+
+
+if __name__ == "__main__":
+    run_benchmark()
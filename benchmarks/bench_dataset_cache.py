@@ -0,0 +1,67 @@
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+from benchmarks.bench_load_dataset import _status_mib
+from benchmarks.synthetic import make_welding_dataset
+from classification_model.processing import data_manager as dm
+
+
+def _from_csv(file_name):
+    return dm.stream_train_test_split(file_name=file_name)
+
+
+def _from_cache(file_name):
+    return dm.columnar_train_test_split(dataset=dm.load_dataset_cached(file_name=file_name))
+
+
+STEPS = [
+    ("CSV stream split", _from_csv),
+    ("cache build + split (cold)", _from_cache),
+    ("cache map + split (warm)", _from_cache),
+]
+
+
+def _measure(step, file_name, cache_dir, queue):
+    dm.DATASET_CACHE_DIR = Path(cache_dir)
+    Path("/proc/self/clear_refs").write_text("5")
+    before = _status_mib("VmRSS")
+    start = time.perf_counter()
+    result = dict(STEPS)[step](file_name)
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, _status_mib("VmHWM") - before))
+    del result
+
+
+def run_benchmark(*, rows: int) -> None:
+    """Retrain start-up cost: parsing the CSV vs mapping the columnar cache."""
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = str(Path(tmp_dir) / "Dataset.csv")
+        make_welding_dataset(rows).to_csv(file_name, index=False)
+        print(f"{rows:,} rows, {Path(file_name).stat().st_size / 2**20:.1f} MiB CSV")
+        print(f"{'step':>28} {'seconds':>8} {'peak RSS MiB':>13}")
+        for step, _ in STEPS:
+            queue = ctx.Queue()
+            process = ctx.Process(
+                target=_measure, args=(step, file_name, Path(tmp_dir) / "cache", queue)
+            )
+            process.start()
+            process.join()
+            if process.exitcode != 0:
+                raise RuntimeError(f"{step} failed with exit code {process.exitcode}")
+            elapsed, peak_mib = queue.get()
+            print(f"{step:>28} {elapsed:>8.2f} {peak_mib:>13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=739_888)
+    run_benchmark(rows=parser.parse_args().rows)
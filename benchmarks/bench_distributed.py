@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import contextlib
+import io
+import tempfile
+import warnings
+
+from sklearn.metrics import roc_auc_score
+
+from benchmarks.synthetic import make_welding_dataset
+from classification_model.config.core import config
+from classification_model.distributed import run_distributed_training
+from classification_model.processing import data_manager
+from classification_model.train_pipeline import prepare_training_data
+
+N_ROWS = 400_000
+WORKER_COUNTS = [1, 2, 4]
+
+# Trees per worker; early stopping may keep fewer
+ITERATIONS = 300
+
+
+@contextlib.contextmanager
+def _scratch_dirs():
+    """Send the dataset cache and saved models to a temp dir, restoring them afterwards."""
+    params = config.ml_model_config.catboost_params
+    saved = (
+        config.app_config.training_data_file,
+        data_manager.DATASET_CACHE_DIR,
+        data_manager.TRAINED_MODEL_DIR,
+        params["iterations"],
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        (tmp_dir / "models").mkdir()
+        data_manager.DATASET_CACHE_DIR = tmp_dir / "cache"
+        data_manager.TRAINED_MODEL_DIR = tmp_dir / "models"
+        params["iterations"] = ITERATIONS
+        try:
+            yield tmp_dir
+        finally:
+            (
+                config.app_config.training_data_file,
+                data_manager.DATASET_CACHE_DIR,
+                data_manager.TRAINED_MODEL_DIR,
+                params["iterations"],
+            ) = saved
+
+
+def run_benchmark() -> None:
+    """Print wall time, per-worker fit time and ROC AUC against the number of workers.
+
+    All workers run on this machine and share its CPUs, so wall time here
+    does not fall with more workers on a single-CPU box. The slowest
+    worker's CPU time estimates the fit's critical path when every worker
+    has a host of its own; the summed CPU time is the total compute spent.
+    """
+    warnings.simplefilter("ignore")
+    with _scratch_dirs() as tmp_dir:
+        csv_path = tmp_dir / "welds.csv"
+        make_welding_dataset(N_ROWS, seed=0).to_csv(csv_path, index=False)
+        config.app_config.training_data_file = str(csv_path)
+        # Build the dataset cache and pools up front, so no run pays for them
+        data = prepare_training_data()
+        y_eval = data.eval_pool.get_label()
+        print(f"{N_ROWS:,} rows, {data.train_pool.num_row():,} in the train pool")
+
+        print(
+            f"{'workers':>7} {'wall s':>7} {'slowest worker CPU s':>21} {'summed CPU s':>13} "
+            f"{'trees':>6} {'ROC AUC':>8}"
+        )
+        for n_workers in WORKER_COUNTS:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run = run_distributed_training(n_workers=n_workers, launch="local")
+            auc = roc_auc_score(y_eval, run.classifier.predict_proba(data.eval_pool)[:, 1])
+            print(
+                f"{n_workers:>7} {run.seconds:>7.1f} "
+                f"{max(worker.cpu_seconds for worker in run.workers):>21.1f} "
+                f"{sum(worker.cpu_seconds for worker in run.workers):>13.1f} "
+                f"{run.classifier.tree_count_:>6} {auc:>8.4f}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,56 @@
+import pickle
+import sys
+import warnings
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+from benchmarks.bench_predict import _time_per_row
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.pipeline import check_pipeline_parity, fold_scaler
+from classification_model.predict import _classification_pipe
+from classification_model.processing.engine import ArrayEngine, PipelineEngine
+
+BATCH_SIZES = [1, 100, 10000]
+
+
+def run_benchmark() -> None:
+    """Parity and latency of the folded pipeline against the persisted one."""
+    warnings.simplefilter("ignore")
+    features = config.ml_model_config.features
+    folded_pipe = fold_scaler(_classification_pipe)
+
+    parity = check_pipeline_parity(
+        reference=_classification_pipe,
+        candidate=folded_pipe,
+        X=make_welding_frame(500_000, seed=1)[features],
+    )
+    print(f"parity: {parity}")
+    print(
+        f"pickle size: {len(pickle.dumps(_classification_pipe)):,} B -> "
+        f"{len(pickle.dumps(folded_pipe)):,} B"
+    )
+
+    engines = {
+        "pipeline": (PipelineEngine(_classification_pipe), PipelineEngine(folded_pipe)),
+        "array": (
+            ArrayEngine(_classification_pipe, features=features),
+            ArrayEngine(folded_pipe, features=features),
+        ),
+    }
+    print(f"{'engine':>9} {'rows':>6} {'scaled us/row':>14} {'folded us/row':>14}")
+    for name, (scaled, folded) in engines.items():
+        for batch_size in BATCH_SIZES:
+            X = make_welding_frame(batch_size)[features]
+            if name == "array":
+                X = X.to_numpy(dtype=float)
+            before = _time_per_row(scaled.predict, X) * 1e6
+            after = _time_per_row(folded.predict, X) * 1e6
+            print(f"{name:>9} {batch_size:>6} {before:>14.2f} {after:>14.2f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import contextlib
+import io
+import tempfile
+import time
+import warnings
+
+import pandas as pd
+
+from benchmarks.synthetic import make_welding_dataset
+from classification_model import __version__ as _version
+from classification_model.config.core import config
+from classification_model.processing import data_manager
+from classification_model.train_pipeline import run_incremental_training, run_training
+
+HISTORY_ROWS = 100_000
+BATCH_ROWS = [5_000, 20_000, 80_000]
+
+
+@contextlib.contextmanager
+def _scratch_dirs():
+    """Send the dataset cache and saved models to a temp dir, restoring them afterwards."""
+    saved = (
+        config.app_config.training_data_file,
+        data_manager.DATASET_CACHE_DIR,
+        data_manager.TRAINED_MODEL_DIR,
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        (tmp_dir / "models").mkdir()
+        data_manager.DATASET_CACHE_DIR = tmp_dir / "cache"
+        data_manager.TRAINED_MODEL_DIR = tmp_dir / "models"
+        try:
+            yield tmp_dir
+        finally:
+            (
+                config.app_config.training_data_file,
+                data_manager.DATASET_CACHE_DIR,
+                data_manager.TRAINED_MODEL_DIR,
+            ) = saved
+
+
+def _timed_training(csv_path: Path) -> float:
+    config.app_config.training_data_file = str(csv_path)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_training()
+    return time.perf_counter() - start
+
+
+def run_benchmark() -> None:
+    """Print the cost of updating a model on new batches against a full retrain."""
+    warnings.simplefilter("ignore")
+    history = make_welding_dataset(HISTORY_ROWS, seed=0)
+    with _scratch_dirs() as tmp_dir:
+        history_path = tmp_dir / "history.csv"
+        history.to_csv(history_path, index=False)
+        base_seconds = _timed_training(history_path)
+        print(f"Base model on {HISTORY_ROWS:,} rows trained in {base_seconds:.1f}s")
+
+        print(f"{'new rows':>9} {'update s':>9} {'trees':>6} {'AUC before':>11} {'AUC after':>10}")
+        for n_rows in BATCH_ROWS:
+            batch_path = tmp_dir / f"batch-{n_rows}.csv"
+            make_welding_dataset(n_rows, seed=n_rows).to_csv(batch_path, index=False)
+            with contextlib.redirect_stdout(io.StringIO()):
+                # Always continue from the base model, so updates are comparable
+                update = run_incremental_training(
+                    file_name=str(batch_path), base_version=_version
+                )
+            print(
+                f"{n_rows:>9,} {update.seconds:>9.2f} {update.trees_added:>6} "
+                f"{update.base_auc:>11.4f} {update.updated_auc:>10.4f}"
+            )
+
+        combined_path = tmp_dir / "combined.csv"
+        pd.concat([history, pd.read_csv(tmp_dir / f"batch-{BATCH_ROWS[-1]}.csv")]).to_csv(
+            combined_path, index=False
+        )
+        retrain_seconds = _timed_training(combined_path)
+        print(
+            f"Full retrain on {HISTORY_ROWS + BATCH_ROWS[-1]:,} rows: {retrain_seconds:.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
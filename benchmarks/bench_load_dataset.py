@@ -0,0 +1,81 @@
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+from benchmarks.synthetic import make_welding_dataset
+from classification_model.config.core import config
+from classification_model.processing import data_manager as dm
+
+
+def _baseline(file_name):
+    """The original path: full read_csv, drop PIPE_NO, train_test_split."""
+    from sklearn.model_selection import train_test_split
+    data = dm.load_dataset(file_name=file_name).drop(columns=["PIPE_NO"])
+    return train_test_split(
+        data[config.ml_model_config.features],
+        data[config.ml_model_config.target],
+        test_size=config.ml_model_config.test_size,
+        random_state=config.ml_model_config.random_state,
+        stratify=data[config.ml_model_config.target],
+    )
+
+
+LOADERS = {
+    "read_csv + train_test_split": _baseline,
+    "load_dataset_chunked": lambda file_name: dm.load_dataset_chunked(file_name=file_name),
+    "stream_train_test_split": lambda file_name: dm.stream_train_test_split(file_name=file_name),
+}
+
+
+def _status_mib(field: str) -> float:
+    """Read a memory field (e.g. VmRSS, VmHWM) of this process in MiB."""
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1]) / 1024
+    raise KeyError(field)
+
+
+def _measure(name, file_name, queue):
+    # Reset the peak RSS high-water mark so import-time peaks do not count
+    Path("/proc/self/clear_refs").write_text("5")
+    before = _status_mib("VmRSS")
+    start = time.perf_counter()
+    result = LOADERS[name](file_name)
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, _status_mib("VmHWM") - before))
+    del result
+
+
+def run_benchmark(*, rows: int) -> None:
+    """Load time and peak RSS growth of each loader, each in a fresh process.
+
+    Peak RSS is read from /proc, so the benchmark is Linux-only.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = str(Path(tmp_dir) / "Dataset.csv")
+        make_welding_dataset(rows).to_csv(file_name, index=False)
+        print(f"{rows:,} rows, {Path(file_name).stat().st_size / 2**20:.1f} MiB CSV")
+        print(f"{'loader':>28} {'seconds':>8} {'peak RSS MiB':>13}")
+        for name in LOADERS:
+            queue = ctx.Queue()
+            process = ctx.Process(target=_measure, args=(name, file_name, queue))
+            process.start()
+            process.join()
+            if process.exitcode != 0:
+                raise RuntimeError(f"{name} failed with exit code {process.exitcode}")
+            elapsed, peak_mib = queue.get()
+            print(f"{name:>28} {elapsed:>8.2f} {peak_mib:>13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=739_888)
+    run_benchmark(rows=parser.parse_args().rows)
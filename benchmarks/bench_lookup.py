@@ -0,0 +1,56 @@
+import sys
+import warnings
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import numpy as np
+
+from benchmarks.bench_predict import _time_per_row
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.processing.lookup import LookupTableModel
+
+BATCH_SIZES = [1, 8, 32, 128, 1024, 16384]
+
+
+def run_benchmark() -> None:
+    """Compare lookup-table scoring with CatBoost on already transformed rows.
+
+    ``hybrid`` is what ``inference_config.engine: lookup`` serves: tables up
+    to ``lookup_max_rows`` rows and CatBoost above.
+    """
+    warnings.simplefilter("ignore")
+    from classification_model.predict import _array_engine
+
+    catboost_model = _array_engine.model
+    lookup_model = LookupTableModel.from_catboost(catboost_model)
+    hybrid = LookupTableModel.from_catboost(
+        catboost_model,
+        fallback=catboost_model,
+        max_rows=config.inference_config.lookup_max_rows,
+    )
+    print(
+        f"{catboost_model.tree_count_} trees; tables {lookup_model.bucket_bits.nbytes / 1e6:.2f} MB "
+        f"+ leaves {lookup_model.leaf_values.nbytes / 1e6:.2f} MB"
+    )
+    print(f"{'rows':>6} {'predict_proba':>14} {'lookup':>10} {'hybrid':>10} {'speedup':>8}  (us/row)")
+    for batch_size in BATCH_SIZES:
+        frame = make_welding_frame(batch_size)[config.ml_model_config.features]
+        X = _array_engine.transform(frame.to_numpy(dtype=np.float64))
+        timings = [
+            _time_per_row(catboost_model.predict_proba, X),
+            _time_per_row(lookup_model.predict, X),
+            _time_per_row(hybrid.predict, X),
+        ]
+        timings = [value * 1e6 for value in timings]
+        print(
+            f"{batch_size:>6} {timings[0]:>14.2f} {timings[1]:>10.2f} {timings[2]:>10.2f} "
+            f"{timings[0] / timings[2]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,67 @@
+import sys
+import logging
+import time
+import warnings
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.processing import metrics
+from packages.ml_api.api.config import log_payload
+
+REPEATS = 5000
+
+
+def _time_per_call(func, repeats: int = REPEATS) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def run_benchmark() -> None:
+    """Cost of the instrumentation, disabled and enabled, and of payload logging."""
+    warnings.simplefilter("ignore")
+    from classification_model.predict import make_prediction
+
+    row = np.array([[318, 7798, 365, 7177, 9507]], dtype=np.float64)
+
+    def predict():
+        return make_prediction(input_data=row)
+
+    def timed_stage():
+        with metrics.stage("parse"):
+            pass
+
+    print(f"{'':>34} {'disabled':>9} {'enabled':>9}  (us/call)")
+    timings = {}
+    for on in (False, True):
+        metrics.enable(on)
+        timings[on] = (_time_per_call(timed_stage, 100_000), _time_per_call(predict))
+    metrics.enable(False)
+    print(f"{'one stage timer':>34} {timings[False][0]:>9.2f} {timings[True][0]:>9.2f}")
+    print(f"{'make_prediction, 1 row':>34} {timings[False][1]:>9.2f} {timings[True][1]:>9.2f}")
+
+    # A handler that drops records still pays for formatting them
+    logger = logging.getLogger("bench_metrics")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    frame = make_welding_frame(1000)[config.ml_model_config.features]
+    payload = {"inputs": frame.to_dict(orient="records")}
+    eager = _time_per_call(lambda: logger.debug(f"Inputs: {payload}"), 200)
+    print(f"\nlogging a 1000-row payload per request: f-string {eager:,.0f} us")
+    for rate in (0.0, 0.01):
+        sampled = _time_per_call(lambda: log_payload(logger, "Inputs", payload, sample_rate=rate), 200)
+        print(f"log_payload, sample_rate={rate}: {sampled:,.1f} us")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,105 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import time
+import warnings
+
+import numpy as np
+
+WORKERS = 4
+
+
+def _smaps_mib(pid: int) -> dict:
+    """Private (unshared) and proportional set size of a process in MiB."""
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":")
+        fields[name] = int(value.split()[0]) / 1024
+    return {"uss": fields["Private_Clean"] + fields["Private_Dirty"], "pss": fields["Pss"]}
+
+
+def _load(source: str):
+    from classification_model import __version__ as _version
+    from classification_model.config.core import config
+    from classification_model.processing.data_manager import load_model_artifact, load_pipeline
+    from classification_model.processing.engine import ArrayEngine
+
+    if source == "artifact":
+        return ArrayEngine.from_artifact(*load_model_artifact())
+    pipeline = load_pipeline(file_name=f"{config.app_config.pipeline_save_file}{_version}.pkl")
+    return ArrayEngine(pipeline, features=config.ml_model_config.features)
+
+
+def _worker(engine, source, X, ready, done) -> None:
+    if engine is None:
+        engine = _load(source)
+    engine.predict(X)
+    ready.put(os.getpid())
+    done.wait()
+
+
+def _probe(source: str, preload: bool) -> dict:
+    """Load time, then per-worker memory of forked workers that each score a batch."""
+    warnings.simplefilter("ignore")
+    start = time.perf_counter()
+    engine = _load(source) if preload else None
+    load_seconds = time.perf_counter() - start
+
+    X = np.random.default_rng(0).uniform(0, 10_000, size=(1000, 5))
+    context = multiprocessing.get_context("fork")
+    ready, done = context.Queue(), context.Event()
+    workers = [
+        context.Process(target=_worker, args=(engine, source, X, ready, done))
+        for _ in range(WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    pids = [ready.get(timeout=120) for _ in workers]
+    memory = [_smaps_mib(pid) for pid in pids]
+    done.set()
+    for worker in workers:
+        worker.join()
+    return {
+        "load_seconds": load_seconds,
+        "worker_uss": float(np.mean([m["uss"] for m in memory])),
+        "worker_pss": float(np.mean([m["pss"] for m in memory])),
+    }
+
+
+def run_benchmark() -> None:
+    """Print load time and per-worker memory for pickle vs native artifact."""
+    print(f"{WORKERS} forked workers per run")
+    print(f"{'source':>9} {'loaded':>12} {'load s':>7} {'worker USS MiB':>15} {'worker PSS MiB':>15}")
+    for source in ("pickle", "artifact"):
+        for preload in (False, True):
+            output = subprocess.run(
+                [sys.executable, __file__, "--probe", source] + (["--preload"] if preload else []),
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            loaded = "before fork" if preload else "per worker"
+            load = f"{result['load_seconds']:.3f}" if preload else "-"
+            print(
+                f"{source:>9} {loaded:>12} {load:>7} "
+                f"{result['worker_uss']:>15.1f} {result['worker_pss']:>15.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--probe", choices=["pickle", "artifact"])
+    parser.add_argument("--preload", action="store_true")
+    args = parser.parse_args()
+    if args.probe:
+        print(json.dumps(_probe(args.probe, args.preload)))
+    else:
+        run_benchmark()
@@ -0,0 +1,125 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import argparse
+import contextlib
+import io
+import json
+import resource
+import subprocess
+import tempfile
+import time
+import warnings
+
+ROW_COUNTS = [1_000_000, 2_500_000, 5_000_000, 10_000_000]
+
+# In-memory training is only run up to this size; beyond it the machine
+# this was written on (6 GiB) starts to swap or kill the process
+IN_MEMORY_MAX_ROWS = 5_000_000
+
+# Budget of an extra out-of-core run on the largest dataset, small enough to sample
+SMALL_BUDGET_MB = 1024
+
+# Trees per run; memory hardly depends on the number of trees
+ITERATIONS = 50
+
+GENERATE_CHUNK_ROWS = 1_000_000
+
+
+def _write_dataset(path: Path, n_rows: int) -> None:
+    """Write a synthetic training CSV one bounded chunk at a time."""
+    from benchmarks.synthetic import make_welding_dataset
+
+    with open(path, "w") as csv_file:
+        for index, start in enumerate(range(0, n_rows, GENERATE_CHUNK_ROWS)):
+            chunk = make_welding_dataset(min(GENERATE_CHUNK_ROWS, n_rows - start), seed=index)
+            chunk["PIPE_NO"] = chunk["PIPE_NO"].str.replace("P", f"P{index:03d}-", regex=False)
+            chunk.to_csv(csv_file, header=index == 0, index=False)
+
+
+def _train(mode: str, csv_path: str, ram_budget_mb: int) -> None:
+    """Child process: train once in scratch directories and print the peak RSS as JSON."""
+    warnings.simplefilter("ignore")
+    from classification_model.config.core import config
+    from classification_model.processing import data_manager
+    from classification_model import train_pipeline
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        (tmp_dir / "models").mkdir()
+        config.app_config.training_data_file = csv_path
+        config.out_of_core_config.ram_budget_mb = ram_budget_mb
+        data_manager.DATASET_CACHE_DIR = tmp_dir / "cache"
+        data_manager.TRAINED_MODEL_DIR = tmp_dir / "models"
+        train_pipeline.classification_pipe.named_steps["classifier"].set_params(
+            iterations=ITERATIONS, train_dir=str(tmp_dir / "catboost_info")
+        )
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            if mode == "out-of-core":
+                train_pipeline.run_out_of_core_training()
+            else:
+                train_pipeline.run_training()
+        seconds = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"peak_rss_mb": peak_mb, "seconds": seconds}))
+
+
+def _run_child(mode: str, csv_path: Path, ram_budget_mb: int):
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(csv_path), str(ram_budget_mb)],
+        capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        return None
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark() -> None:
+    """Print peak RSS against dataset rows for in-memory and out-of-core training."""
+    from classification_model.config.core import config
+    from classification_model.train_pipeline import out_of_core_max_rows
+
+    budget_mb = config.out_of_core_config.ram_budget_mb
+    print(
+        f"{'rows':>11} {'mode':>12} {'budget MiB':>11} {'trained rows':>13} "
+        f"{'peak RSS MiB':>13} {'seconds':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in ROW_COUNTS:
+            csv_path = Path(tmp_dir) / f"welds-{n_rows}.csv"
+            _write_dataset(csv_path, n_rows)
+            runs = [("out-of-core", budget_mb)]
+            if n_rows <= IN_MEMORY_MAX_ROWS:
+                runs.insert(0, ("in-memory", budget_mb))
+            if n_rows == ROW_COUNTS[-1]:
+                runs.append(("out-of-core", SMALL_BUDGET_MB))
+            for mode, ram_budget_mb in runs:
+                result = _run_child(mode, csv_path, ram_budget_mb)
+                trained = n_rows
+                if mode == "out-of-core":
+                    trained = min(n_rows, out_of_core_max_rows(ram_budget_mb=ram_budget_mb))
+                budget = f"{ram_budget_mb}" if mode == "out-of-core" else "-"
+                if result is None:
+                    print(f"{n_rows:>11,} {mode:>12} {budget:>11} {trained:>13,} {'failed':>13}")
+                    continue
+                print(
+                    f"{n_rows:>11,} {mode:>12} {budget:>11} {trained:>13,} "
+                    f"{result['peak_rss_mb']:>13.0f} {result['seconds']:>8.1f}"
+                )
+            csv_path.unlink()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "CSV", "BUDGET_MB"))
+    args = parser.parse_args()
+    if args.child:
+        _train(args.child[0], args.child[1], int(args.child[2]))
+    else:
+        run_benchmark()
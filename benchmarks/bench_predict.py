@@ -0,0 +1,49 @@
+import sys
+import time
+import warnings
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.predict import _classification_pipe, _engine
+
+BATCH_SIZES = [1, 10, 100, 1000, 10000]
+
+
+def _two_pass(X):
+    """Baseline: the pipeline is evaluated once for labels and once for probabilities."""
+    return _classification_pipe.predict(X), _classification_pipe.predict_proba(X)
+
+
+def _single_pass(X):
+    return _engine.predict(X)
+
+
+def _time_per_row(func, X, *, min_time: float = 0.5) -> float:
+    func(X)
+    repeats, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while elapsed < min_time:
+        func(X)
+        repeats += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / repeats / len(X)
+
+
+def run_benchmark() -> None:
+    """Print the per-row latency of two-pass vs single-pass prediction."""
+    warnings.simplefilter("ignore")
+    print(f"{'rows':>8} {'two-pass us/row':>16} {'single-pass us/row':>19} {'speedup':>8}")
+    for batch_size in BATCH_SIZES:
+        X = make_welding_frame(batch_size)[config.ml_model_config.features]
+        before = _time_per_row(_two_pass, X) * 1e6
+        after = _time_per_row(_single_pass, X) * 1e6
+        print(f"{batch_size:>8} {before:>16.2f} {after:>19.2f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
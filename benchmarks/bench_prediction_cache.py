@@ -0,0 +1,64 @@
+import sys
+import time
+import warnings
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.processing.cache import CachedEngine, PredictionCache
+
+REQUESTS = 20_000
+SETPOINTS = 2_000
+
+# Share of requests with a reading jittered off its setpoint by a few units
+JITTERED = 0.5
+
+
+def make_request_stream(*, seed: int = 0) -> np.ndarray:
+    """Single-row requests drawn from recurring setpoints, Zipf-weighted."""
+    rng = np.random.default_rng(seed)
+    setpoints = make_welding_frame(SETPOINTS, seed=seed)[config.ml_model_config.features]
+    weights = 1 / np.arange(1, SETPOINTS + 1)
+    picks = rng.choice(SETPOINTS, size=REQUESTS, p=weights / weights.sum())
+    rows = setpoints.to_numpy(dtype=np.float64)[picks]
+    jitter = rng.random(REQUESTS) < JITTERED
+    rows[jitter] += rng.integers(-3, 4, size=(jitter.sum(), rows.shape[1]))
+    return rows
+
+
+def _run(engine, rows: np.ndarray) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        engine.predict(row[np.newaxis])
+    return (time.perf_counter() - start) / len(rows) * 1e6
+
+
+def run_benchmark() -> None:
+    """Per-request latency and hit rate of the prediction cache on 1-row requests."""
+    warnings.simplefilter("ignore")
+    from classification_model.predict import _array_engine
+
+    rows = make_request_stream()
+    print(f"{REQUESTS:,} requests over {SETPOINTS:,} setpoints, {JITTERED:.0%} jittered")
+    print(f"{'engine':>16} {'us/request':>11} {'hit rate':>9} {'saved s':>8}")
+    print(f"{'uncached':>16} {_run(_array_engine, rows):>11.1f} {'-':>9} {'-':>8}")
+    for key in ("values", "buckets"):
+        engine = CachedEngine(
+            _array_engine, cache=PredictionCache(max_size=100_000, ttl_seconds=3600), key=key
+        )
+        micros = _run(engine, rows)
+        stats = engine.cache.stats()
+        print(
+            f"{'cached ' + key:>16} {micros:>11.1f} "
+            f"{stats['hit_rate']:>9.1%} {stats['seconds_saved']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.processing.preprocessors import DataValidator, FeatureEngineer
+
+N_ROWS = 1_000_000
+REPEATS = 5
+
+
+def _copying_validator(X, feature_ranges):
+    """Baseline: frame copy, a clip per column and batch medians."""
+    X = X.copy()
+    for feature, ranges in feature_ranges.items():
+        if feature in X.columns:
+            X[feature] = np.clip(X[feature], float(ranges["min"]), float(ranges["max"]))
+    return X.fillna(X.median())
+
+
+def _copying_engineer(X):
+    X = X.copy()
+    X["power_efficiency"] = X["PM_R"] / (X["DV_R"] * X["DA_R"] / 1000)
+    X["wire_feed_ratio"] = X["AV_R"] / X["AA_R"]
+    X["voltage_current_ratio"] = X["DV_R"] / X["DA_R"]
+    return X
+
+
+def _measure(func):
+    """Best wall time over ``REPEATS`` calls and the peak memory allocated by one call."""
+    func()
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def run_benchmark() -> None:
+    """Print latency and peak memory of the old and new transforms on 1M rows."""
+    feature_ranges = config.ml_model_config.feature_ranges
+    data = make_welding_frame(N_ROWS, seed=0).astype(np.float64)
+    data.iloc[::1000, 0] = np.nan
+    validator = DataValidator(feature_ranges=feature_ranges).fit(data)
+    engineer = FeatureEngineer()
+    validated = validator.transform(data)
+    print(f"{N_ROWS:,} rows, input frame {data.memory_usage().sum() / 2**20:.1f} MiB")
+
+    cases = [
+        ("DataValidator", lambda: _copying_validator(data, feature_ranges), lambda: validator.transform(data)),
+        ("FeatureEngineer", lambda: _copying_engineer(validated), lambda: engineer.transform(validated)),
+    ]
+    print(f"{'transform':<16} {'before ms':>10} {'after ms':>9} {'speedup':>8} {'before MiB':>11} {'after MiB':>10}")
+    for name, before, after in cases:
+        before_s, before_peak = _measure(before)
+        after_s, after_peak = _measure(after)
+        print(
+            f"{name:<16} {before_s * 1e3:>10.1f} {after_s * 1e3:>9.1f} {before_s / after_s:>7.2f}x "
+            f"{before_peak / 2**20:>11.1f} {after_peak / 2**20:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
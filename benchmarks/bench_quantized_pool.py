@@ -0,0 +1,82 @@
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+from sklearn.base import clone
+
+from benchmarks.synthetic import make_welding_dataset
+from classification_model import train_pipeline
+from classification_model.config.core import config
+from classification_model.pipeline import classification_pipe
+from classification_model.processing import data_manager as dm
+
+
+def _legacy_retrain(params: dict):
+    """pandas frames straight into Pipeline.fit: CatBoost re-quantizes every time."""
+    start = time.perf_counter()
+    X_train, _, y_train, _ = dm.columnar_train_test_split(
+        dataset=dm.load_dataset_cached(file_name=config.app_config.training_data_file)
+    )
+    pipe = clone(classification_pipe)
+    pipe.set_params(**{f"classifier__{name}": value for name, value in params.items()})
+    prepared = time.perf_counter()
+    pipe.fit(X_train, y_train)
+    return prepared - start, time.perf_counter() - prepared, pipe[-1].tree_count_
+
+
+def _native_retrain(params: dict):
+    start = time.perf_counter()
+    data = train_pipeline.prepare_training_data()
+    prepared = time.perf_counter()
+    classifier = train_pipeline.fit_classifier(
+        train_pool=data.train_pool,
+        eval_pool=data.eval_pool,
+        class_names=data.class_names,
+        **params,
+    )
+    return prepared - start, time.perf_counter() - prepared, classifier.tree_count_
+
+
+def run_benchmark(*, rows: int, iterations: int) -> None:
+    """Wall-clock per retrain with and without the reusable quantized pools.
+
+    ``prep`` covers the split, preprocessing and pool handling; the legacy
+    path quantizes inside ``fit``. With ``--iterations`` the tree count is
+    fixed and early stopping disabled so only data handling differs; with
+    ``--iterations 0`` the configured ``catboost_params`` are used as they
+    are, where only the pool path honours ``early_stopping_rounds``.
+    """
+    warnings.simplefilter("ignore")
+    params = {"iterations": iterations, "early_stopping_rounds": None} if iterations else {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = str(Path(tmp_dir) / "Dataset.csv")
+        make_welding_dataset(rows).to_csv(file_name, index=False)
+        config.app_config.training_data_file = file_name
+        dm.DATASET_CACHE_DIR = Path(tmp_dir) / "cache"
+        # Build the columnar cache up front so only the pool handling differs
+        dm.columnar_train_test_split(dataset=dm.load_dataset_cached(file_name=file_name))
+
+        print(f"{rows:,} rows, {iterations or 'configured'} iterations")
+        print(f"{'variant':>38} {'prep s':>7} {'fit s':>7} {'total s':>8} {'trees':>6}")
+        for name, retrain in [
+            ("DataFrame fit (quantize every run)", _legacy_retrain),
+            ("Pool fit, cold (quantize + save)", _native_retrain),
+            ("Pool fit, warm (load quantized pool)", _native_retrain),
+        ]:
+            prep, fit, trees = retrain(params)
+            print(f"{name:>38} {prep:>7.2f} {fit:>7.2f} {prep + fit:>8.2f} {trees:>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=739_888)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    run_benchmark(rows=args.rows, iterations=args.iterations)
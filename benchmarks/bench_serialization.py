@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import json
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_frame
+from packages.ml_api.api import serialization
+from packages.ml_api.api.validation import validate_inputs
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+
+
+def _cpu_ms(func, *, min_time: float = 0.5) -> float:
+    """CPU milliseconds per call of ``func``."""
+    func()
+    repeats, start = 0, time.process_time()
+    while time.process_time() - start < min_time:
+        func()
+        repeats += 1
+    return (time.process_time() - start) / repeats * 1e3
+
+
+def _stdlib_round_trip(body: bytes, labels: np.ndarray, proba: np.ndarray):
+    """Baseline: stdlib decoder and encoder with ``tolist`` results."""
+    def decode():
+        return validate_inputs(input_data=json.loads(body))
+
+    def encode():
+        return json.dumps({
+            "predictions": labels.tolist(),
+            "prediction_probabilities": proba.tolist(),
+            "version": "0.1.0",
+            "errors": None,
+        }).encode()
+
+    return decode, encode
+
+
+def _fast_round_trip(body: bytes, labels: np.ndarray, proba: np.ndarray):
+    def decode():
+        return validate_inputs(input_data=serialization.loads(body))
+
+    def encode():
+        return serialization.dumps({
+            "predictions": labels,
+            "prediction_probabilities": proba,
+            "version": "0.1.0",
+            "errors": None,
+        })
+
+    return decode, encode
+
+
+def run_benchmark() -> None:
+    """Print payload size and CPU time of request decoding and response encoding."""
+    if serialization.orjson is None:
+        print("orjson is not installed; both columns use the stdlib encoder")
+    print(
+        f"{'rows':>8} {'variant':>15} {'request KiB':>12} {'response KiB':>13} "
+        f"{'decode ms':>10} {'encode ms':>10}"
+    )
+    rng = np.random.default_rng(0)
+    for rows in ROW_COUNTS:
+        frame = make_welding_frame(rows, seed=0)
+        row_body = json.dumps({"inputs": frame.to_dict(orient="records")}).encode()
+        column_body = json.dumps(frame.to_dict(orient="list")).encode()
+        proba_1 = rng.random(rows)
+        proba = np.column_stack([1 - proba_1, proba_1])
+        labels = (proba_1 > 0.5).astype(np.int64)
+
+        variants = [
+            ("stdlib rows", row_body, _stdlib_round_trip),
+            ("fast rows", row_body, _fast_round_trip),
+            ("fast columnar", column_body, _fast_round_trip),
+        ]
+        for name, body, round_trip in variants:
+            decode, encode = round_trip(body, labels, proba)
+            print(
+                f"{rows:>8} {name:>15} {len(body) / 1024:>12.0f} {len(encode()) / 1024:>13.0f} "
+                f"{_cpu_ms(decode):>10.2f} {_cpu_ms(encode):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import json
+import os
+import statistics
+import subprocess
+
+RUNS = 5
+
+# Each probe runs in a fresh interpreter and prints its timings as JSON
+PREDICT_PROBE = """
+import json, time, warnings
+warnings.simplefilter("ignore")
+start = time.perf_counter()
+import numpy as np
+from classification_model.predict import make_prediction
+imported = time.perf_counter()
+make_prediction(input_data=np.array([[318, 7798, 365, 7177, 9507]], dtype=np.float64))
+predicted = time.perf_counter()
+make_prediction(input_data=np.array([[318, 7798, 365, 7177, 9507]], dtype=np.float64))
+print(json.dumps({
+    "import": imported - start,
+    "first prediction": predicted - imported,
+    "second prediction": time.perf_counter() - predicted,
+}))
+"""
+
+API_PROBE = """
+import json, logging, time, warnings
+warnings.simplefilter("ignore")
+logging.disable(logging.CRITICAL)
+start = time.perf_counter()
+from catboost_ml.packages.ml_api.api.app import create_app
+from catboost_ml.packages.ml_api.api.config import Config
+client = create_app(config_object=Config).test_client()
+assert client.get("/health").status_code == 200
+healthy = time.perf_counter()
+while client.get("/ready").status_code != 200:
+    time.sleep(0.005)
+print(json.dumps({"app /health": healthy - start, "app /ready": time.perf_counter() - start}))
+"""
+
+
+def _probe(code: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PACKAGE_ROOT), str(PACKAGE_ROOT.parent)]))
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark() -> None:
+    """Print median cold-start timings over fresh interpreters."""
+    samples = {}
+    for _ in range(RUNS):
+        for code in (PREDICT_PROBE, API_PROBE):
+            for name, seconds in _probe(code).items():
+                samples.setdefault(name, []).append(seconds)
+    print(f"{'stage':>18} {'median ms':>10}")
+    for name, values in samples.items():
+        print(f"{name:>18} {statistics.median(values) * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
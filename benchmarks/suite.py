@@ -0,0 +1,350 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path; the API imports itself as ``catboost_ml``
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+sys.path.append(str(PACKAGE_ROOT.parent))
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import typing as t
+import warnings
+
+import numpy as np
+
+from benchmarks.synthetic import make_welding_dataset, make_welding_frame
+from classification_model.config.core import config
+
+# Relative slowdown of a case's median time reported as a regression
+DEFAULT_THRESHOLD = 0.15
+
+# Seed of every synthetic input, so runs on different commits time the same data
+SEED = 0
+
+PREDICTION_BATCH_SIZES = [1, 10, 100, 1_000, 10_000, 100_000, 1_000_000]
+TRAINING_ROWS = [2_000, 20_000]
+
+# Trees fitted by the training cases; the shipped model is trained with far more
+TRAINING_ITERATIONS = 100
+
+
+class Case(t.NamedTuple):
+    """One benchmark: ``setup`` builds its inputs and returns the call to time."""
+    name: str
+    setup: t.Callable[[], t.Callable[[], t.Any]]
+    rows: int
+    # Part of ``--quick`` runs
+    quick: bool
+    min_time: float
+    min_repeats: int
+
+
+CASES: t.List[Case] = []
+
+
+def case(name: str, *, rows: int, quick: bool = True, min_time: float = 0.5, min_repeats: int = 5):
+    def register(setup):
+        CASES.append(Case(name, setup, rows, quick, min_time, min_repeats))
+        return setup
+    return register
+
+
+def _preprocessing_frame(n_rows: int):
+    data = make_welding_frame(n_rows, seed=SEED).astype(np.float64)
+    # A few missing values so the median fill does real work
+    data.iloc[::1000, 0] = np.nan
+    return data
+
+
+@case("DataValidator.transform", rows=100_000)
+def _data_validator():
+    from classification_model.processing.preprocessors import DataValidator
+
+    validator = DataValidator(feature_ranges=config.ml_model_config.feature_ranges)
+    data = _preprocessing_frame(100_000)
+    validator.fit(data)
+    return lambda: validator.transform(data)
+
+
+@case("FeatureEngineer.transform", rows=100_000)
+def _feature_engineer():
+    from classification_model.processing.preprocessors import FeatureEngineer
+
+    engineer = FeatureEngineer()
+    data = make_welding_frame(100_000, seed=SEED).astype(np.float64)
+    engineer.fit(data)
+    return lambda: engineer.transform(data)
+
+
+@case("validate_inputs[package]", rows=10_000)
+def _validate_inputs_package():
+    from classification_model.processing.validation import validate_inputs
+
+    data = make_welding_frame(10_000, seed=SEED)
+    return lambda: validate_inputs(input_data=data)
+
+
+@case("validate_inputs[api]", rows=10_000)
+def _validate_inputs_api():
+    from packages.ml_api.api.validation import validate_inputs
+
+    inputs = {"inputs": make_welding_frame(10_000, seed=SEED).to_dict(orient="records")}
+    return lambda: validate_inputs(input_data=inputs)
+
+
+def _prediction_case(batch_size: int):
+    def setup():
+        from classification_model.predict import make_prediction
+
+        X = make_welding_frame(batch_size, seed=SEED)[config.ml_model_config.features]
+        X = X.to_numpy(dtype=np.float64)
+        return lambda: make_prediction(input_data=X, as_numpy=True)
+    return setup
+
+
+for _batch_size in PREDICTION_BATCH_SIZES:
+    case(
+        f"make_prediction[{_batch_size}]",
+        rows=_batch_size,
+        quick=_batch_size <= 10_000,
+        min_repeats=3 if _batch_size < 1_000_000 else 1,
+    )(_prediction_case(_batch_size))
+
+
+def _flask_case(n_rows: int):
+    def setup():
+        from catboost_ml.packages.ml_api.api.app import create_app
+        from catboost_ml.packages.ml_api.api.config import TestingConfig
+
+        class BenchmarkConfig(TestingConfig):
+            MODEL_WARM_UP = False
+            PREDICTION_BATCHING = False
+            PREDICTION_CACHE = False
+            METRICS_ENABLED = False
+            PAYLOAD_LOG_SAMPLE_RATE = 0.0
+
+        client = create_app(config_object=BenchmarkConfig).test_client()
+        body = json.dumps({"inputs": make_welding_frame(n_rows, seed=SEED).to_dict(orient="records")})
+
+        def post():
+            response = client.post(
+                "/v1/predict/classification", data=body, content_type="application/json"
+            )
+            assert response.status_code == 200, response.get_data(as_text=True)
+        return post
+    return setup
+
+
+for _n_rows in [1, 100]:
+    case(f"flask_predict[{_n_rows}]", rows=_n_rows)(_flask_case(_n_rows))
+
+
+def _training_case(n_rows: int):
+    def setup():
+        return lambda: _train_in_scratch_dirs(n_rows)
+    return setup
+
+
+def _train_in_scratch_dirs(n_rows: int) -> None:
+    """``run_training`` on synthetic data, with every file it writes kept in a temp dir.
+
+    The shipped model in ``trained_models`` is never touched. Each call
+    starts from an empty dataset cache, so it times the whole run: CSV
+    conversion, quantization, fitting, parity checks and saving.
+    """
+    from classification_model import pipeline, train_pipeline
+    from classification_model.processing import data_manager
+
+    classifier = pipeline.classification_pipe.named_steps["classifier"]
+    saved_params = classifier.get_params()
+    saved_paths = (
+        config.app_config.training_data_file,
+        data_manager.DATASET_CACHE_DIR,
+        data_manager.TRAINED_MODEL_DIR,
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        csv_path = tmp_dir / "Dataset.csv"
+        make_welding_dataset(n_rows, seed=SEED).to_csv(csv_path, index=False)
+        (tmp_dir / "models").mkdir()
+        try:
+            config.app_config.training_data_file = str(csv_path)
+            data_manager.DATASET_CACHE_DIR = tmp_dir / "cache"
+            data_manager.TRAINED_MODEL_DIR = tmp_dir / "models"
+            classifier.set_params(
+                iterations=TRAINING_ITERATIONS, thread_count=-1, train_dir=str(tmp_dir / "catboost_info")
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                train_pipeline.run_training()
+        finally:
+            classifier.set_params(**saved_params)
+            (
+                config.app_config.training_data_file,
+                data_manager.DATASET_CACHE_DIR,
+                data_manager.TRAINED_MODEL_DIR,
+            ) = saved_paths
+
+
+for _n_rows in TRAINING_ROWS:
+    case(
+        f"run_training[{_n_rows}]",
+        rows=_n_rows,
+        quick=_n_rows <= 2_000,
+        min_time=0.0,
+        min_repeats=3,
+    )(_training_case(_n_rows))
+
+
+def measure(func: t.Callable[[], t.Any], *, min_time: float, min_repeats: int) -> t.Dict[str, t.Any]:
+    """Time ``func`` after one warm-up call, until both ``min_time`` and ``min_repeats`` are reached."""
+    func()
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_repeats or time.perf_counter() - start < min_time:
+        call_start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - call_start)
+    return {
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "repeats": len(times),
+    }
+
+
+def _git_commit() -> t.Optional[str]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def environment() -> t.Dict[str, t.Any]:
+    """Commit, library versions and machine a run was made on."""
+    import catboost
+    import pandas
+    import sklearn
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pandas.__version__,
+        "catboost": catboost.__version__,
+        "sklearn": sklearn.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_suite(*, quick: bool = False, name_filter: str = None) -> t.Dict[str, t.Any]:
+    """Run the selected cases and return the results with the run's environment."""
+    warnings.simplefilter("ignore")
+    results = {}
+    for bench_case in CASES:
+        if quick and not bench_case.quick:
+            continue
+        if name_filter and name_filter not in bench_case.name:
+            continue
+        timing = measure(
+            bench_case.setup(), min_time=bench_case.min_time, min_repeats=bench_case.min_repeats
+        )
+        timing["rows"] = bench_case.rows
+        timing["rows_per_s"] = bench_case.rows / timing["median_s"]
+        results[bench_case.name] = timing
+        print(
+            f"{bench_case.name:<32} {timing['median_s'] * 1e3:>12.3f} ms "
+            f"{timing['rows_per_s']:>14,.0f} rows/s ({timing['repeats']} repeats)"
+        )
+    return {"environment": environment(), "quick": quick, "results": results}
+
+
+def compare_results(
+    base: t.Dict[str, t.Any], head: t.Dict[str, t.Any], *, threshold: float = DEFAULT_THRESHOLD
+) -> t.List[t.Dict[str, t.Any]]:
+    """Median time of every case in either run, head relative to base.
+
+    A case is a ``regression`` when its head median exceeds the base median
+    by more than ``threshold``, an ``improvement`` when it is that much
+    faster, and ``added`` or ``removed`` when only one run has it.
+    """
+    base_results, head_results = base["results"], head["results"]
+    rows = []
+    for name in list(base_results) + [name for name in head_results if name not in base_results]:
+        before = base_results.get(name, {}).get("median_s")
+        after = head_results.get(name, {}).get("median_s")
+        if before is None or after is None:
+            status, ratio = ("added" if before is None else "removed"), None
+        else:
+            ratio = after / before
+            if ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 / (1 + threshold):
+                status = "improvement"
+            else:
+                status = "ok"
+        rows.append({"name": name, "base_s": before, "head_s": after, "ratio": ratio, "status": status})
+    return rows
+
+
+def _print_comparison(rows: t.List[t.Dict[str, t.Any]]) -> None:
+    print(f"{'case':<32} {'base ms':>12} {'head ms':>12} {'ratio':>7}  status")
+    for row in rows:
+        base = f"{row['base_s'] * 1e3:.3f}" if row["base_s"] is not None else "-"
+        head = f"{row['head_s'] * 1e3:.3f}" if row["head_s"] is not None else "-"
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        print(f"{row['name']:<32} {base:>12} {head:>12} {ratio:>7}  {row['status']}")
+
+
+def main(argv: t.Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the training and inference paths.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and write the results as JSON.")
+    run_parser.add_argument("--output", type=Path, help="JSON file for the results.")
+    run_parser.add_argument("--quick", action="store_true", help="Skip the largest cases.")
+    run_parser.add_argument("--filter", help="Only run cases whose name contains this text.")
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files.")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("head", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = run_suite(quick=args.quick, name_filter=args.filter)
+        if args.output:
+            args.output.write_text(json.dumps(report, indent=2))
+            print(f"Results written to {args.output}")
+        return 0
+
+    rows = compare_results(
+        json.loads(args.base.read_text()), json.loads(args.head.read_text()), threshold=args.threshold
+    )
+    _print_comparison(rows)
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
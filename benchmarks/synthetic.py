@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from classification_model.config.core import config
+
+
+def make_welding_frame(n_rows: int, *, seed: int = 0) -> pd.DataFrame:
+    """Generate synthetic welding readings on the integer grid of ``feature_ranges``."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for feature in config.ml_model_config.features:
+        ranges = config.ml_model_config.feature_ranges[feature]
+        data[feature] = rng.integers(ranges["min"], ranges["max"] + 1, size=n_rows)
+    return pd.DataFrame(data)
+
+
+def make_welding_dataset(n_rows: int, *, seed: int = 0) -> pd.DataFrame:
+    """Synthetic training frame with ``PIPE_NO`` and a learnable binary target."""
+    rng = np.random.default_rng(seed)
+    data = make_welding_frame(n_rows, seed=seed)
+    score = (
+        (data["DV_R"] - 350) / 150
+        + (data["PM_R"] - 9500) / 2500
+        + rng.normal(scale=0.5, size=n_rows)
+    )
+    data.insert(0, "PIPE_NO", [f"P{i:07d}" for i in range(n_rows)])
+    data[config.ml_model_config.target] = (score > -0.5).astype(int)
+    return data
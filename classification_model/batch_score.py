@@ -0,0 +1,226 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import time
+import typing as t
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from classification_model import __version__ as _version
+from classification_model.config.core import config
+from classification_model.processing.data_manager import DEFAULT_CHUNK_SIZE, iter_dataset_chunks
+from classification_model.processing.resources import available_cpus
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 5.0
+
+OUTPUT_COLUMNS = ["prediction", "probability_0", "probability_1"]
+
+# Scoring engine and ID columns, set once per worker process by the pool initializer
+_worker_engine = None
+_worker_id_columns = None
+
+
+def _init_worker(thread_count: int, id_columns: t.List[str]) -> None:
+    global _worker_engine, _worker_id_columns
+    from classification_model.predict import load_model
+
+    _worker_engine = load_model().array_engine
+    _worker_engine.thread_count = thread_count
+    _worker_id_columns = id_columns
+
+
+def _csv_rows(columns: t.Iterable[list]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(zip(*columns))
+    return buffer.getvalue().encode()
+
+
+def _score_chunk(chunk: pd.DataFrame) -> t.Tuple[int, bytes]:
+    """Score a chunk and format its output rows, so workers share the CSV cost too."""
+    X = chunk[config.ml_model_config.features].to_numpy(dtype=np.float64)
+    labels, proba = _worker_engine.predict(X)
+    columns = [chunk[column].tolist() for column in _worker_id_columns]
+    return len(chunk), _csv_rows(columns + [labels.tolist()] + proba.T.tolist())
+
+
+def iter_input_chunks(
+    *, input_path: Path, columns: t.List[str], chunksize: int, skip_rows: int = 0
+) -> t.Iterator[pd.DataFrame]:
+    """Stream ``columns`` of a CSV or Parquet file in chunks of ``chunksize`` rows."""
+    if input_path.suffix != ".parquet":
+        yield from iter_dataset_chunks(
+            file_name=str(input_path), columns=columns, chunksize=chunksize, skip_rows=skip_rows
+        )
+        return
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Scoring Parquet files requires pyarrow to be installed")
+    for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunksize, columns=columns):
+        if skip_rows >= batch.num_rows:
+            skip_rows -= batch.num_rows
+            continue
+        yield batch.slice(skip_rows).to_pandas()
+        skip_rows = 0
+
+
+def checkpoint_path_for(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.name}.checkpoint.json")
+
+
+def _source_fingerprint(input_path: Path, *, chunksize: int, id_columns: t.List[str]) -> t.Dict:
+    """Identify the input, model and settings a checkpoint belongs to.
+
+    The output columns follow ``id_columns`` and checkpoints are taken per
+    chunk, so both must match to resume.
+    """
+    stat = input_path.stat()
+    return {
+        "input": str(input_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "model_version": _version,
+        "chunksize": chunksize,
+        "id_columns": id_columns,
+    }
+
+
+def _write_checkpoint(path: Path, checkpoint: t.Dict) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(checkpoint))
+    os.replace(tmp_path, path)
+
+
+def score_file(
+    *,
+    input_path: t.Union[str, Path],
+    output_path: t.Union[str, Path],
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    n_workers: int = None,
+    id_columns: t.Sequence[str] = (),
+    resume: bool = False,
+) -> t.Dict:
+    """Score a CSV or Parquet file and write the predictions to a CSV file.
+
+    Chunks are scored on a pool of worker processes that each load the
+    model once, and written in input order with ``id_columns`` copied
+    through. At most two chunks per worker are in flight, so memory does
+    not grow with the file. After every written chunk a checkpoint
+    records the rows done and the output size, so ``resume`` continues an
+    interrupted run from the last complete chunk.
+    """
+    input_path, output_path = Path(input_path).resolve(), Path(output_path)
+    features = config.ml_model_config.features
+    id_columns = list(id_columns)
+    checkpoint_path = checkpoint_path_for(output_path)
+    source = _source_fingerprint(input_path, chunksize=chunksize, id_columns=id_columns)
+
+    rows_done, output_bytes = 0, 0
+    if resume and checkpoint_path.exists():
+        checkpoint = json.loads(checkpoint_path.read_text())
+        if checkpoint["source"] != source:
+            raise ValueError(
+                f"{checkpoint_path} was written for a different input file, model version, "
+                "chunksize or id_columns"
+            )
+        rows_done, output_bytes = checkpoint["rows_done"], checkpoint["output_bytes"]
+        print(f"Resuming after {rows_done:,} rows")
+
+    cpus = available_cpus()
+    n_workers = max(1, min(n_workers or cpus, cpus))
+    chunks = iter_input_chunks(
+        input_path=input_path,
+        columns=id_columns + features,
+        chunksize=chunksize,
+        skip_rows=rows_done,
+    )
+
+    start = last_report = time.perf_counter()
+    rows_scored = 0
+    with open(output_path, "r+b" if output_bytes else "wb") as output, ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(max(1, cpus // n_workers), id_columns),
+    ) as executor:
+        # Drop anything written after the last checkpoint
+        output.truncate(output_bytes)
+        output.seek(output_bytes)
+        if not output_bytes:
+            output.write(_csv_rows([[name] for name in id_columns + OUTPUT_COLUMNS]))
+        pending = deque()
+
+        def write_oldest() -> None:
+            nonlocal rows_done, rows_scored, last_report
+            n_rows, rows = pending.popleft().result()
+            output.write(rows)
+            output.flush()
+            os.fsync(output.fileno())
+
+            rows_done += n_rows
+            rows_scored += n_rows
+            _write_checkpoint(checkpoint_path, {
+                "source": source,
+                "rows_done": rows_done,
+                "output_bytes": output.tell(),
+            })
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                print(f"{rows_done:,} rows scored, {rows_scored / (now - start):,.0f} rows/s")
+                last_report = now
+
+        for chunk in chunks:
+            pending.append(executor.submit(_score_chunk, chunk))
+            if len(pending) >= 2 * n_workers:
+                write_oldest()
+        while pending:
+            write_oldest()
+
+    elapsed = time.perf_counter() - start
+    checkpoint_path.unlink(missing_ok=True)
+    summary = {
+        "rows": rows_done,
+        "rows_scored": rows_scored,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows_scored / elapsed) if elapsed else None,
+        "workers": n_workers,
+    }
+    print(
+        f"Scored {rows_scored:,} rows in {elapsed:.1f}s "
+        f"({summary['rows_per_second']:,} rows/s) with {n_workers} workers"
+    )
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a CSV or Parquet file with the saved pipeline.")
+    parser.add_argument("input_path")
+    parser.add_argument("output_path")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--n-workers", type=int)
+    parser.add_argument("--id-columns", nargs="*", default=[])
+    parser.add_argument("--resume", action="store_true", help="Continue from the last checkpoint.")
+    args = parser.parse_args()
+    score_file(
+        input_path=args.input_path,
+        output_path=args.output_path,
+        chunksize=args.chunksize,
+        n_workers=args.n_workers,
+        id_columns=args.id_columns,
+        resume=args.resume,
+    )
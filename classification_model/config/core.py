@@ -4,7 +4,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Sequence
 
 from pydantic import BaseModel
-from strictyaml import YAML, load, Map, Str, Int, Float, Seq, Bool
+from strictyaml import YAML, load, Map, Str, Int, Float, Seq, Bool, Enum
+from strictyaml import Optional as OptionalKey
 
 import classification_model
 
@@ -13,7 +14,23 @@ PACKAGE_ROOT = Path(classification_model.__file__).resolve().parent
 ROOT = PACKAGE_ROOT.parent
 CONFIG_FILE_PATH = PACKAGE_ROOT / "config.yml"
 DATASET_DIR = PACKAGE_ROOT / "datasets"
+DATASET_CACHE_DIR = DATASET_DIR / "cache"
 TRAINED_MODEL_DIR = PACKAGE_ROOT / "trained_models"
+TUNING_DIR = PACKAGE_ROOT / "tuning"
+
+# Types of the CatBoost parameters that can be configured or tuned
+CATBOOST_PARAM_TYPES = {
+    "iterations": Int(),
+    "learning_rate": Float(),
+    "depth": Int(),
+    "l2_leaf_reg": Int(),
+    "border_count": Int(),
+    "thread_count": Int(),
+    "random_seed": Int(),
+    "verbose": Bool(),
+    "eval_metric": Str(),
+    "early_stopping_rounds": Int(),
+}
 
 
 class AppConfig(BaseModel):
@@ -35,16 +52,91 @@ class ModelConfig(BaseModel):
     features: List[str]
     test_size: float
     random_state: int
+    decision_threshold: float = 0.5
     categorical_features: List[str] = []  # Default to empty list
     numerical_vars: List[str]
     catboost_params: Dict
     feature_ranges: Dict
 
 
+class InferenceConfig(BaseModel):
+    """
+    How loaded models score requests.
+    """
+    engine: str
+    lookup_max_rows: int
+
+
+class RegistryConfig(BaseModel):
+    """
+    Model versions kept on disk and in memory.
+    """
+    keep_versions: int
+    max_loaded: int
+
+
+class TuningConfig(BaseModel):
+    """
+    Hyperparameter search settings.
+    """
+    strategy: str
+    n_trials: int
+    n_workers: int
+    halving_factor: int
+    min_iterations: int
+    search_space: Dict[str, List]
+
+
+class IncrementalConfig(BaseModel):
+    """
+    Continued training of a saved model on new batches.
+    """
+    max_new_trees: int
+    learning_rate: float
+    holdout_size: float
+    max_auc_drop: float
+
+
+class OutOfCoreConfig(BaseModel):
+    """
+    Training on datasets larger than memory.
+    """
+    ram_budget_mb: int
+    chunk_rows: int
+    validator_sample_rows: int
+
+
+class DistributedConfig(BaseModel):
+    """
+    Data-parallel training across worker processes or hosts.
+    """
+    n_workers: int
+    launch: str
+    host: str
+    port: int
+    timeout_s: int
+
+
+class CrossValidationConfig(BaseModel):
+    """
+    Stratified k-fold cross-validation settings.
+    """
+    n_folds: int
+    n_workers: int
+    threshold_steps: int
+
+
 class Config(BaseModel):
     """Master config object."""
     app_config: AppConfig
     ml_model_config: ModelConfig  # Переименовано из model_config
+    inference_config: InferenceConfig
+    registry_config: RegistryConfig
+    tuning_config: TuningConfig
+    incremental_config: IncrementalConfig
+    out_of_core_config: OutOfCoreConfig
+    distributed_config: DistributedConfig
+    cv_config: CrossValidationConfig
 
 
 def find_config_file() -> Path:
@@ -72,19 +164,9 @@ def fetch_config_from_yaml(cfg_path: Path = None) -> YAML:
             "features": Seq(Str()),
             "test_size": Float(),
             "random_state": Int(),
+            "decision_threshold": Float(),
             "numerical_vars": Seq(Str()),
-            "catboost_params": Map({
-                "iterations": Int(),
-                "learning_rate": Float(),
-                "depth": Int(),
-                "l2_leaf_reg": Int(),
-                "border_count": Int(),
-                "thread_count": Int(),
-                "random_seed": Int(),
-                "verbose": Bool(),
-                "eval_metric": Str(),
-                "early_stopping_rounds": Int(),
-            }),
+            "catboost_params": Map(CATBOOST_PARAM_TYPES),
             "feature_ranges": Map({
                 "DV_R": Map({"min": Int(), "max": Int()}),
                 "DA_R": Map({"min": Int(), "max": Int()}),
@@ -93,6 +175,49 @@ def fetch_config_from_yaml(cfg_path: Path = None) -> YAML:
                 "PM_R": Map({"min": Int(), "max": Int()}),
             }),
         }),
+        "inference_config": Map({
+            "engine": Enum(["catboost", "lookup"]),
+            "lookup_max_rows": Int(),
+        }),
+        "registry_config": Map({
+            "keep_versions": Int(),
+            "max_loaded": Int(),
+        }),
+        "tuning_config": Map({
+            "strategy": Enum(["grid", "random", "halving"]),
+            "n_trials": Int(),
+            "n_workers": Int(),
+            "halving_factor": Int(),
+            "min_iterations": Int(),
+            # Candidate values per parameter, typed like catboost_params
+            "search_space": Map({
+                OptionalKey(name): Seq(validator)
+                for name, validator in CATBOOST_PARAM_TYPES.items()
+            }),
+        }),
+        "incremental_config": Map({
+            "max_new_trees": Int(),
+            "learning_rate": Float(),
+            "holdout_size": Float(),
+            "max_auc_drop": Float(),
+        }),
+        "out_of_core_config": Map({
+            "ram_budget_mb": Int(),
+            "chunk_rows": Int(),
+            "validator_sample_rows": Int(),
+        }),
+        "distributed_config": Map({
+            "n_workers": Int(),
+            "launch": Enum(["local", "external"]),
+            "host": Str(),
+            "port": Int(),
+            "timeout_s": Int(),
+        }),
+        "cv_config": Map({
+            "n_folds": Int(),
+            "n_workers": Int(),
+            "threshold_steps": Int(),
+        }),
     })
 
     if cfg_path:
@@ -111,9 +236,17 @@ def create_and_validate_config(parsed_config: YAML = None) -> Config:
     _config = Config(
         app_config=AppConfig(**data["app_config"]),
         ml_model_config=ModelConfig(**data["model_config"]),
+        inference_config=InferenceConfig(**data["inference_config"]),
+        registry_config=RegistryConfig(**data["registry_config"]),
+        tuning_config=TuningConfig(**data["tuning_config"]),
+        incremental_config=IncrementalConfig(**data["incremental_config"]),
+        out_of_core_config=OutOfCoreConfig(**data["out_of_core_config"]),
+        distributed_config=DistributedConfig(**data["distributed_config"]),
+        cv_config=CrossValidationConfig(**data["cv_config"]),
     )
 
     return _config
 
 
+# Parsed at import: predict.py and pipeline.py read it while being imported.
 config = create_and_validate_config()
\ No newline at end of file
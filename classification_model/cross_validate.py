@@ -0,0 +1,297 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import argparse
+import json
+import multiprocessing
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import (
+    accuracy_score,
+    average_precision_score,
+    f1_score,
+    log_loss,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+from sklearn.model_selection import StratifiedKFold, train_test_split
+from sklearn.pipeline import Pipeline
+
+from classification_model.config.core import TUNING_DIR, config, fetch_config_from_yaml
+from classification_model.pipeline import classification_pipe
+from classification_model.processing.data_manager import (
+    QUANTIZATION_PARAMS,
+    ColumnarDataset,
+    build_quantized_pools,
+    load_dataset_cached,
+    load_quantized_pools,
+    open_columnar_cache,
+    quantized_pool_path,
+)
+from classification_model.processing.resources import available_cpus
+from classification_model.train_pipeline import fit_classifier
+
+# Metrics summarised over the folds, in report order
+FOLD_METRICS = ("roc_auc", "pr_auc", "log_loss", "accuracy", "precision", "recall", "f1")
+
+# Memory-mapped dataset cache, opened once per worker process by the pool initializer
+_worker_data = None
+
+
+def _init_worker(cache_path: str, class_names: t.List[int]) -> None:
+    """Map the columnar dataset cache instead of receiving the rows pickled."""
+    global _worker_data
+    _worker_data = (open_columnar_cache(Path(cache_path)), class_names)
+
+
+def _rows(dataset: ColumnarDataset, index: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame(np.asarray(dataset.X)[index], columns=dataset.features, copy=False)
+
+
+def _run_fold(fold: t.Dict) -> t.Dict:
+    """Fit one fold in a worker and predict its held-out rows.
+
+    The preprocessing and the quantization borders are fitted on the
+    fold's training rows, and early stopping watches a validation split
+    of them, so the held-out rows are only ever scored.
+    """
+    dataset, class_names = _worker_data
+    y = np.asarray(dataset.y)
+    fit_index, validation_index = fold["fit_index"], fold["validation_index"]
+    start = time.perf_counter()
+    preprocessor = Pipeline(clone(classification_pipe).steps[:-1]).fit(
+        _rows(dataset, fit_index), y[fit_index]
+    )
+    pools = load_quantized_pools(path=fold["pool_path"])
+    if pools is None:
+        pools = build_quantized_pools(
+            path=fold["pool_path"],
+            X_train=preprocessor.transform(_rows(dataset, fit_index)),
+            y_train=y[fit_index],
+            X_eval=preprocessor.transform(_rows(dataset, validation_index)),
+            y_eval=y[validation_index],
+            quantization=fold["quantization"],
+        )
+    classifier = fit_classifier(
+        train_pool=pools[0],
+        eval_pool=pools[1],
+        class_names=class_names,
+        allow_writing_files=False,
+        **fold["params"],
+    )
+    # Scored as float32, the precision the pools were quantized from
+    X_test = np.asarray(preprocessor.transform(_rows(dataset, fold["test_index"])), dtype=np.float32)
+    return {
+        "fold": fold["fold"],
+        "trees": classifier.tree_count_,
+        "seconds": round(time.perf_counter() - start, 3),
+        "proba": classifier.predict_proba(X_test)[:, 1],
+    }
+
+
+def fold_metrics(
+    *, y_true: np.ndarray, proba: np.ndarray, class_names: t.List[int], threshold: float
+) -> t.Dict[str, float]:
+    """Ranking metrics of the positive-class probabilities and label metrics at ``threshold``."""
+    negative, positive = class_names
+    y_pred = np.where(proba > threshold, positive, negative)
+    return {
+        "roc_auc": roc_auc_score(y_true, proba),
+        "pr_auc": average_precision_score(y_true, proba, pos_label=positive),
+        "log_loss": log_loss(y_true, proba, labels=class_names),
+        "accuracy": accuracy_score(y_true, y_pred),
+        "precision": precision_score(y_true, y_pred, pos_label=positive, zero_division=0),
+        "recall": recall_score(y_true, y_pred, pos_label=positive, zero_division=0),
+        "f1": f1_score(y_true, y_pred, pos_label=positive, zero_division=0),
+    }
+
+
+def threshold_curve(
+    *, y_true: np.ndarray, proba: np.ndarray, positive: int, thresholds: np.ndarray
+) -> t.List[t.Dict[str, float]]:
+    """Precision, recall and F1 of predicting ``positive`` when ``proba > threshold``.
+
+    Counts for every threshold come from binary searches in the sorted
+    probabilities of each class, instead of a confusion matrix per threshold.
+    """
+    is_positive = y_true == positive
+    positives = np.sort(proba[is_positive])
+    negatives = np.sort(proba[~is_positive])
+    true_positives = len(positives) - np.searchsorted(positives, thresholds, side="right")
+    false_positives = len(negatives) - np.searchsorted(negatives, thresholds, side="right")
+    predicted = true_positives + false_positives
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(predicted > 0, true_positives / predicted, 0.0)
+        recall = true_positives / max(len(positives), 1)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+    return [
+        {
+            "threshold": round(float(threshold), 6),
+            "precision": float(p),
+            "recall": float(r),
+            "f1": float(f),
+            "predicted_positive_rate": float(n / len(proba)),
+        }
+        for threshold, p, r, f, n in zip(thresholds, precision, recall, f1, predicted)
+    ]
+
+
+def run_cross_validation(
+    *,
+    n_folds: int = None,
+    n_workers: int = None,
+    params: t.Dict = None,
+    output: Path = None,
+) -> t.Dict:
+    """Stratified k-fold cross-validation with the folds fitted in parallel.
+
+    Workers memory-map the dataset cache when they start rather than
+    receiving rows. Each fold carves a stratified validation split
+    (``test_size`` of its training rows) for early stopping, fits the
+    preprocessing and the quantization borders on the rest, and scores
+    its held-out rows with the resulting model; nothing fitted sees the
+    held-out rows. The quantized pools of every fold are saved next to
+    the dataset cache and reused by later runs with the same quantization
+    (evaluating a tuning candidate, say). As in ``tune``, CPUs are split
+    evenly between the workers and passed as ``thread_count``.
+
+    ``params`` override ``catboost_params`` (a candidate config's, say).
+    The report, with per-fold metrics and timing, their mean and standard
+    deviation, out-of-fold metrics and the out-of-fold threshold curve,
+    is written as JSON to ``output`` (by default
+    ``TUNING_DIR/cv_report.json``) and returned.
+    """
+    settings = config.cv_config
+    model_config = config.ml_model_config
+    n_folds = n_folds or settings.n_folds
+    params = {**model_config.catboost_params, **(params or {})}
+    start = time.perf_counter()
+
+    dataset = load_dataset_cached(file_name=config.app_config.training_data_file)
+    y = np.asarray(dataset.y)
+    class_names = np.unique(y).tolist()
+    quantization = {name: params[name] for name in QUANTIZATION_PARAMS if name in params}
+
+    splitter = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=model_config.random_state)
+    folds = list(splitter.split(np.zeros(len(y)), y))
+    cpus = available_cpus()
+    n_workers = max(1, min(n_workers or settings.n_workers, cpus, n_folds))
+    thread_budget = max(1, cpus // n_workers)
+
+    tasks = []
+    for fold, (train_index, test_index) in enumerate(folds):
+        fit_index, validation_index = train_test_split(
+            train_index,
+            test_size=model_config.test_size,
+            random_state=model_config.random_state,
+            stratify=y[train_index],
+        )
+        tasks.append({
+            "fold": fold,
+            # Sorted, so rows are gathered from the memory map in file order
+            "fit_index": np.sort(fit_index),
+            "validation_index": np.sort(validation_index),
+            "test_index": test_index,
+            "pool_path": quantized_pool_path(
+                dataset=dataset,
+                quantization=quantization,
+                split={"cross_validation": {"n_folds": n_folds, "fold": fold}},
+            ),
+            "quantization": quantization,
+            "params": {**params, "thread_count": thread_budget},
+        })
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(str(dataset.path), class_names),
+    ) as executor:
+        results = list(executor.map(_run_fold, tasks))
+
+    threshold = model_config.decision_threshold
+    out_of_fold = np.empty(len(y), dtype=np.float64)
+    fold_reports = []
+    for result, task in zip(results, tasks):
+        test_index = task["test_index"]
+        out_of_fold[test_index] = result["proba"]
+        fold_reports.append({
+            "fold": result["fold"],
+            "train_rows": len(task["fit_index"]),
+            "validation_rows": len(task["validation_index"]),
+            "test_rows": len(test_index),
+            "trees": result["trees"],
+            "seconds": result["seconds"],
+            **fold_metrics(
+                y_true=y[test_index], proba=result["proba"],
+                class_names=class_names, threshold=threshold,
+            ),
+        })
+
+    curve = threshold_curve(
+        y_true=y,
+        proba=out_of_fold,
+        positive=class_names[1],
+        thresholds=np.linspace(0.0, 1.0, settings.threshold_steps),
+    )
+    report = {
+        "rows": len(y),
+        "n_folds": n_folds,
+        "workers": n_workers,
+        "threads_per_fold": thread_budget,
+        "decision_threshold": threshold,
+        "params": params,
+        "seconds": round(time.perf_counter() - start, 3),
+        "folds": fold_reports,
+        "summary": {
+            metric: {
+                "mean": float(np.mean([fold[metric] for fold in fold_reports])),
+                "std": float(np.std([fold[metric] for fold in fold_reports])),
+            }
+            for metric in FOLD_METRICS + ("trees", "seconds")
+        },
+        "out_of_fold": fold_metrics(
+            y_true=y, proba=out_of_fold, class_names=class_names, threshold=threshold
+        ),
+        "best_f1_threshold": max(curve, key=lambda point: point["f1"]),
+        "threshold_curve": curve,
+    }
+
+    output = output or TUNING_DIR / "cv_report.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    for metric in FOLD_METRICS:
+        summary = report["summary"][metric]
+        print(f"{metric:>10}: {summary['mean']:.4f} +/- {summary['std']:.4f}")
+    print(
+        f"{n_folds} folds on {n_workers} workers in {report['seconds']:.1f}s; "
+        f"report written to {output}"
+    )
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stratified k-fold cross-validation over cv_config.")
+    parser.add_argument(
+        "--config", type=Path, metavar="FILE",
+        help="Evaluate the catboost_params of another config file (e.g. tuning/config_candidate.yml).",
+    )
+    parser.add_argument("--n-folds", type=int)
+    parser.add_argument("--n-workers", type=int)
+    parser.add_argument("--output", type=Path, help="Where to write the JSON report.")
+    args = parser.parse_args()
+    candidate_params = None
+    if args.config:
+        candidate_params = dict(fetch_config_from_yaml(args.config).data["model_config"]["catboost_params"])
+    run_cross_validation(
+        n_folds=args.n_folds, n_workers=args.n_workers, params=candidate_params, output=args.output
+    )
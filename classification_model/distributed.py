@@ -0,0 +1,275 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import argparse
+import os
+import secrets
+import subprocess
+import tempfile
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Client, Connection, Listener
+
+import numpy as np
+from catboost import CatBoostClassifier, Pool, sum_models
+
+from classification_model.config.core import config
+from classification_model.processing.resources import available_cpus
+from classification_model.train_pipeline import (
+    finish_training,
+    fit_classifier,
+    prepare_training_data,
+)
+
+# Shared secret of the coordinator and its workers. Set it on every host
+# for launch: external; local workers are given a random one
+AUTHKEY_ENV = "DISTRIBUTED_TRAINING_AUTHKEY"
+
+# Seconds between attempts of a worker to reach a coordinator not yet listening
+CONNECT_RETRY_S = 1.0
+
+
+class WorkerResult(t.NamedTuple):
+    """What one worker trained on its shard."""
+    shard: int
+    rows: int
+    trees: int
+    # Wall and CPU time spent fitting, without start-up and transfer. Local
+    # workers share the machine's CPUs, so CPU time is the closer estimate
+    # of the fit time on a host of the worker's own
+    seconds: float
+    cpu_seconds: float
+
+
+class DistributedRun(t.NamedTuple):
+    """Outcome of one distributed training run."""
+    classifier: CatBoostClassifier
+    workers: t.List[WorkerResult]
+    seconds: float
+
+
+def _authkey(*, launch: str) -> bytes:
+    key = os.environ.get(AUTHKEY_ENV)
+    if key is None:
+        if launch == "external":
+            raise ValueError(f"Set {AUTHKEY_ENV} on the coordinator and every worker host")
+        key = secrets.token_hex(16)
+    return key.encode()
+
+
+def write_shards(*, train_pool: Pool, n_shards: int, path: Path) -> t.List[Path]:
+    """Split a quantized pool into ``n_shards`` strided shards saved under ``path``.
+
+    Row ``i`` goes to shard ``i % n_shards``, so every shard keeps the class
+    balance of the (already shuffled) split. Slices keep the pool's
+    quantization borders, which lets the shard models be summed.
+    """
+    n_rows = train_pool.num_row()
+    shard_paths = []
+    for shard in range(n_shards):
+        shard_path = path / f"shard-{shard}.bin"
+        train_pool.slice(np.arange(shard, n_rows, n_shards)).save(str(shard_path))
+        shard_paths.append(shard_path)
+    return shard_paths
+
+
+def combine_models(models: t.List[CatBoostClassifier], *, path: Path) -> CatBoostClassifier:
+    """Average the shard models into one classifier.
+
+    ``sum_models`` concatenates the trees and scales their leaf values by
+    the weights, so the combined model predicts the mean of the shard
+    models' raw scores.
+    """
+    combined = sum_models(models, weights=[1 / len(models)] * len(models))
+    combined.save_model(str(path))
+    classifier = CatBoostClassifier()
+    classifier.load_model(str(path))
+    return classifier
+
+
+def _serve_worker(conn: Connection, task: t.Dict, *, deadline: float) -> t.Dict:
+    """Send a worker its task and wait for the model it trained."""
+    with conn:
+        conn.send(task)
+        if not conn.poll(max(0.0, deadline - time.monotonic())):
+            raise TimeoutError(f"Worker for shard {task['shard']} did not finish in time")
+        return conn.recv()
+
+
+def _launch_local_workers(*, address: t.Tuple[str, int], n_workers: int, authkey: bytes):
+    env = {**os.environ, AUTHKEY_ENV: authkey.decode()}
+    command = [
+        sys.executable, str(Path(__file__).resolve()),
+        "worker", "--coordinator", f"{address[0]}:{address[1]}",
+    ]
+    return [subprocess.Popen(command, env=env) for _ in range(n_workers)]
+
+
+def run_distributed_training(*, n_workers: int = None, launch: str = None) -> DistributedRun:
+    """Train on ``n_workers`` shards of the training pool in parallel and save the average.
+
+    The coordinator prepares the data like ``run_training`` (quantized pools
+    from the dataset cache), splits the train pool into shards and sends each
+    worker one shard, the eval pool for early stopping and the
+    ``catboost_params`` to fit with. Workers are processes on this machine
+    (``launch: local``, with the CPUs split between them) or processes
+    started on other hosts that connect to ``host:port`` (``launch:
+    external``). The returned shard models are averaged with
+    ``combine_models`` and saved through ``finish_training``.
+    """
+    settings = config.distributed_config
+    n_workers = n_workers or settings.n_workers
+    launch = launch or settings.launch
+    if launch == "external" and settings.port == 0:
+        raise ValueError("launch: external needs a fixed distributed_config.port")
+    authkey = _authkey(launch=launch)
+    start = time.perf_counter()
+    deadline = time.monotonic() + settings.timeout_s
+
+    data = prepare_training_data()
+    params = dict(config.ml_model_config.catboost_params)
+    if launch == "local":
+        # Workers share this machine: split its CPUs between them
+        params["thread_count"] = max(1, available_cpus() // n_workers)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        shard_paths = write_shards(train_pool=data.train_pool, n_shards=n_workers, path=tmp_dir)
+        eval_bytes = (data.pool_path / "eval.bin").read_bytes()
+
+        processes = []
+        with Listener((settings.host, settings.port), authkey=authkey) as listener:
+            print(f"Coordinator listening on {listener.address[0]}:{listener.address[1]}")
+            if launch == "local":
+                processes = _launch_local_workers(
+                    address=listener.address, n_workers=n_workers, authkey=authkey
+                )
+            # accept() has no timeout; closing the listener makes it raise
+            timer = threading.Timer(max(0.0, deadline - time.monotonic()), listener.close)
+            timer.start()
+            try:
+                with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                    futures = []
+                    for shard, shard_path in enumerate(shard_paths):
+                        try:
+                            conn = listener.accept()
+                        except OSError:
+                            raise TimeoutError(
+                                f"Only {shard} of {n_workers} workers connected in time"
+                            ) from None
+                        task = {
+                            "shard": shard,
+                            "train": shard_path.read_bytes(),
+                            "eval": eval_bytes,
+                            "class_names": data.class_names,
+                            "params": params,
+                        }
+                        futures.append(executor.submit(_serve_worker, conn, task, deadline=deadline))
+                    replies = [future.result() for future in futures]
+            except BaseException:
+                # Workers still waiting for a task would otherwise retry until timeout_s
+                for process in processes:
+                    process.terminate()
+                raise
+            finally:
+                timer.cancel()
+                for process in processes:
+                    process.wait()
+
+        models = []
+        for shard, reply in enumerate(replies):
+            model_path = tmp_dir / f"model-{shard}.cbm"
+            model_path.write_bytes(reply["model"])
+            model = CatBoostClassifier()
+            model.load_model(str(model_path))
+            models.append(model)
+        classifier = combine_models(models, path=tmp_dir / "combined.cbm")
+
+    workers = [
+        WorkerResult(
+            shard=shard,
+            rows=reply["rows"],
+            trees=reply["trees"],
+            seconds=reply["seconds"],
+            cpu_seconds=reply["cpu_seconds"],
+        )
+        for shard, reply in enumerate(replies)
+    ]
+    for worker in workers:
+        print(
+            f"Shard {worker.shard}: {worker.rows:,} rows, {worker.trees} trees "
+            f"in {worker.seconds:.1f}s ({worker.cpu_seconds:.1f}s CPU)"
+        )
+    finish_training(data=data, classifier=classifier)
+    return DistributedRun(
+        classifier=classifier, workers=workers, seconds=time.perf_counter() - start
+    )
+
+
+def _connect(address: t.Tuple[str, int], *, authkey: bytes, timeout_s: float) -> Connection:
+    deadline = time.monotonic() + timeout_s
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(CONNECT_RETRY_S)
+
+
+def run_worker(*, coordinator: str) -> None:
+    """Connect to a coordinator, train on the shard it sends and return the model."""
+    host, port = coordinator.rsplit(":", 1)
+    conn = _connect(
+        (host, int(port)),
+        authkey=os.environ[AUTHKEY_ENV].encode(),
+        timeout_s=config.distributed_config.timeout_s,
+    )
+    with conn, tempfile.TemporaryDirectory() as tmp_dir:
+        task = conn.recv()
+        tmp_dir = Path(tmp_dir)
+        (tmp_dir / "train.bin").write_bytes(task["train"])
+        (tmp_dir / "eval.bin").write_bytes(task["eval"])
+        train_pool = Pool(f"quantized://{tmp_dir / 'train.bin'}")
+        eval_pool = Pool(f"quantized://{tmp_dir / 'eval.bin'}")
+
+        start, cpu_start = time.perf_counter(), time.process_time()
+        classifier = fit_classifier(
+            train_pool=train_pool,
+            eval_pool=eval_pool,
+            class_names=task["class_names"],
+            allow_writing_files=False,
+            **task["params"],
+        )
+        seconds, cpu_seconds = time.perf_counter() - start, time.process_time() - cpu_start
+        classifier.save_model(str(tmp_dir / "model.cbm"))
+        conn.send({
+            "model": (tmp_dir / "model.cbm").read_bytes(),
+            "rows": train_pool.num_row(),
+            "trees": classifier.tree_count_,
+            "seconds": seconds,
+            "cpu_seconds": cpu_seconds,
+        })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Data-parallel training over distributed_config.")
+    subparsers = parser.add_subparsers(dest="role")
+    coordinator_parser = subparsers.add_parser("coordinator", help="Shard the data, collect and save the model.")
+    coordinator_parser.add_argument("--n-workers", type=int)
+    coordinator_parser.add_argument("--launch", choices=["local", "external"])
+    worker_parser = subparsers.add_parser("worker", help="Train one shard for a coordinator.")
+    worker_parser.add_argument("--coordinator", required=True, metavar="HOST:PORT")
+    args = parser.parse_args()
+    if args.role == "worker":
+        run_worker(coordinator=args.coordinator)
+    else:
+        run_distributed_training(
+            n_workers=getattr(args, "n_workers", None), launch=getattr(args, "launch", None)
+        )
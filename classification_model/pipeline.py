@@ -1,4 +1,6 @@
+import json
 import sys
+import tempfile
 from pathlib import Path
 
 # Add the package root to Python path
@@ -23,4 +25,76 @@ classification_pipe = Pipeline([
     ('classifier', CatBoostClassifier( 
         **config.ml_model_config.catboost_params
     ))
-])
\ No newline at end of file
+])
+
+
+def _raw_border(border: float, mean: float, scale: float) -> float:
+    """Translate a split border on a standardised feature into raw units.
+
+    Returns the largest float32 raw value that still goes left of the split, so
+    ``raw > result`` agrees with CatBoost's ``float32(scaled) > border`` for
+    every float32 input rather than only up to rounding.
+    """
+    scaled_border = np.float32(border)
+
+    def goes_right(value) -> bool:
+        return np.float32((np.float64(value) - mean) / scale) > scaled_border
+
+    raw = np.float32(np.float64(scaled_border) * scale + mean)
+    while goes_right(raw):
+        raw = np.nextafter(raw, np.float32(-np.inf))
+    while not goes_right(np.nextafter(raw, np.float32(np.inf))):
+        raw = np.nextafter(raw, np.float32(np.inf))
+    return float(raw)
+
+
+def fold_scaler(pipeline: Pipeline) -> Pipeline:
+    """Fold the fitted StandardScaler into the classifier's split borders.
+
+    Trees only compare features against thresholds and standardisation is
+    monotonic per feature, so rewriting every border back into raw units gives
+    the same splits without scaling at inference time. Returns a new pipeline
+    without the ``scaler`` step; the input pipeline is left untouched.
+    """
+    if "scaler" not in pipeline.named_steps:
+        return pipeline
+
+    scaler = pipeline.named_steps["scaler"]
+    classifier = pipeline.named_steps["classifier"]
+    n_features = scaler.n_features_in_
+    means = scaler.mean_ if scaler.mean_ is not None else np.zeros(n_features)
+    scales = scaler.scale_ if scaler.scale_ is not None else np.ones(n_features)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / "model.json"
+        classifier.save_model(str(model_path), format="json")
+        model = json.loads(model_path.read_text())
+
+        for feature in model["features_info"].get("float_features", []):
+            index = feature["flat_feature_index"]
+            feature["borders"] = [
+                _raw_border(border, means[index], scales[index])
+                for border in feature.get("borders", [])
+            ]
+
+        model_path.write_text(json.dumps(model))
+        folded_classifier = CatBoostClassifier()
+        folded_classifier.load_model(str(model_path), format="json")
+
+    return Pipeline([
+        ('data_validator', pipeline.named_steps['data_validator']),
+        ('classifier', folded_classifier),
+    ])
+
+
+def check_pipeline_parity(*, reference: Pipeline, candidate: Pipeline, X: pd.DataFrame) -> dict:
+    """Compare two pipelines' probabilities and labels on the same data."""
+    reference_proba = reference.predict_proba(X)
+    candidate_proba = candidate.predict_proba(X)
+    return {
+        "rows": len(X),
+        "max_abs_diff": float(np.abs(reference_proba - candidate_proba).max()),
+        "label_mismatches": int(
+            (reference_proba.argmax(axis=1) != candidate_proba.argmax(axis=1)).sum()
+        ),
+    }
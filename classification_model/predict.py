@@ -1,41 +1,298 @@
+import threading
 import typing as t
-from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
 from classification_model import __version__ as _version
 from classification_model.config.core import config
-from classification_model.processing.data_manager import load_pipeline
-from classification_model.processing.validation import validate_inputs
+from classification_model.processing.data_manager import (
+    TRAINED_MODEL_DIR,
+    ModelNotFoundError,
+    ModelRegistry,
+    available_model_versions,
+    load_lookup_model,
+    load_model_artifact,
+    load_pipeline,
+    model_file_names,
+)
+from classification_model.processing import metrics
+from classification_model.processing.cache import CachedEngine, PredictionCache
+from classification_model.processing.engine import ArrayEngine, PipelineEngine
+from classification_model.processing.lookup import LookupTableModel
+from classification_model.processing.validation import (
+    validate_array_inputs,
+    validate_inputs,
+)
 
 pipeline_file_name = f"{config.app_config.pipeline_save_file}{_version}.pkl"
-_classification_pipe = load_pipeline(file_name=pipeline_file_name)
+
+
+class _LoadedModel(t.NamedTuple):
+    array_engine: ArrayEngine
+    source: str
+    version: str
+    # Front end for request scoring when the prediction cache is enabled
+    cached_engine: t.Optional[CachedEngine] = None
+
+    @property
+    def request_engine(self) -> t.Union[ArrayEngine, CachedEngine]:
+        return self.array_engine if self.cached_engine is None else self.cached_engine
+
+
+class _LoadedPipeline(t.NamedTuple):
+    pipeline: t.Any
+    engine: PipelineEngine
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+# Keyword arguments for the prediction cache of each loaded model, or None
+_cache_settings = None
+
+
+def _warm(engine: ArrayEngine) -> None:
+    """Score one mid-range row so lazy CatBoost and NumPy set-up happens now."""
+    ranges = config.ml_model_config.feature_ranges
+    row = [
+        (ranges[f]["min"] + ranges[f]["max"]) / 2 if f in ranges else 0.0
+        for f in config.ml_model_config.features
+    ]
+    engine.predict(np.array([row], dtype=np.float64))
+
+
+def _lookup_model(model, version: str) -> LookupTableModel:
+    """Lookup tables saved for ``version``, or compiled now for older models."""
+    max_rows = config.inference_config.lookup_max_rows
+    lookup_model = load_lookup_model(version=version, fallback=model, max_rows=max_rows)
+    if lookup_model is None:
+        lookup_model = LookupTableModel.from_catboost(model, fallback=model, max_rows=max_rows)
+    return lookup_model
+
+
+def _load_version(version: str) -> _LoadedModel:
+    """Build and warm the array engine of a saved model version.
+
+    The native ``.cbm`` artifact is preferred: it loads without sklearn or
+    unpickling, and when it is loaded before a server forks its workers
+    the model's tree buffers stay shared between them. Models saved before
+    the artifact existed fall back to the pickled pipeline. With
+    ``inference_config.engine: lookup`` small batches are scored from the
+    model's lookup tables instead of by CatBoost.
+    """
+    threshold = config.ml_model_config.decision_threshold
+    artifact = load_model_artifact(version=version)
+    if artifact is not None:
+        engine = ArrayEngine.from_artifact(*artifact, threshold=threshold)
+        source = "artifact"
+    else:
+        file_name = model_file_names(version)[0]
+        if not (TRAINED_MODEL_DIR / file_name).is_file():
+            raise ModelNotFoundError(f"Model version {version} is not available")
+        engine = ArrayEngine(
+            load_pipeline(file_name=file_name),
+            features=config.ml_model_config.features,
+            threshold=threshold,
+        )
+        source = "pickle"
+    if config.inference_config.engine == "lookup":
+        engine.model = _lookup_model(engine.model, version)
+    _warm(engine)
+    cached_engine = None
+    if _cache_settings is not None:
+        settings = dict(_cache_settings)
+        key = settings.pop("key")
+        cached_engine = CachedEngine(engine, cache=PredictionCache(**settings), key=key)
+    return _LoadedModel(
+        array_engine=engine, source=source, version=version, cached_engine=cached_engine
+    )
+
+
+registry = ModelRegistry(
+    loader=_load_version,
+    default_version=_version,
+    max_loaded=config.registry_config.max_loaded,
+    versions=available_model_versions,
+)
+
+
+def enable_prediction_cache(
+    *, max_size: int, ttl_seconds: float, key: str = "buckets"
+) -> None:
+    """Put an LRU prediction cache in front of every model loaded from now on.
+
+    Each loaded model version gets its own cache of up to ``max_size``
+    rows, so activating or reloading a model never serves results cached
+    for another. Call it before the first model is loaded.
+    """
+    global _cache_settings
+    _cache_settings = {"max_size": max_size, "ttl_seconds": ttl_seconds, "key": key}
+
+
+def cache_stats() -> t.Dict[str, t.Dict]:
+    """Prediction cache statistics of each loaded model version."""
+    return {
+        version: model.cached_engine.cache.stats()
+        for version, model in registry.loaded_models().items()
+        if model.cached_engine is not None
+    }
+
+
+def load_model(version: str = None) -> _LoadedModel:
+    """The model for ``version``, by default the active one, loaded on first use.
+
+    Importing this module does not load anything, so processes can serve
+    liveness checks straight away. A model is only served once it has
+    scored a warm-up row, and concurrent first callers wait for a single
+    load. Unknown versions raise ``ModelNotFoundError``.
+    """
+    return registry.get(version)
+
+
+def activate_model(version: str, *, reload: bool = False) -> _LoadedModel:
+    """Load and warm ``version``, then switch new requests over to it."""
+    return registry.activate(version, reload=reload)
+
+
+def load_pipeline_model() -> _LoadedPipeline:
+    """Unpickle the full sklearn pipeline, for callers that need its steps."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                pipeline = load_pipeline(file_name=pipeline_file_name)
+                _pipeline = _LoadedPipeline(
+                    pipeline=pipeline,
+                    engine=PipelineEngine(
+                        pipeline, threshold=config.ml_model_config.decision_threshold
+                    ),
+                )
+    return _pipeline
+
+
+def is_model_loaded() -> bool:
+    return registry.is_loaded()
+
+
+def warm_up(*, background: bool = False) -> t.Optional[threading.Thread]:
+    """Load and warm the model now rather than on the first request.
+
+    With ``background`` the load runs on a daemon thread, which is returned.
+    """
+    if background:
+        thread = threading.Thread(target=load_model, name="model-warm-up", daemon=True)
+        thread.start()
+        return thread
+    load_model()
+    return None
+
+
+# Names that used to be bound at import time, now resolved on first access
+_LAZY_ATTRIBUTES = {
+    "_classification_pipe": lambda: load_pipeline_model().pipeline,
+    "_engine": lambda: load_pipeline_model().engine,
+    "_array_engine": lambda: load_model().array_engine,
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def make_prediction(
     *,
-    input_data: t.Union[pd.DataFrame, dict],
+    input_data: t.Union[pd.DataFrame, dict, np.ndarray],
+    as_numpy: bool = False,
+    version: str = None,
 ) -> dict:
-    """Make a prediction using a saved model pipeline."""
-    
-    data = pd.DataFrame(input_data)
-    validated_data, errors = validate_inputs(input_data=data)
-    results = {"predictions": None, "version": _version, "errors": errors}
+    """Make a prediction using a saved model pipeline.
+
+    A NumPy matrix with columns in ``config.ml_model_config.features`` order
+    skips DataFrame validation. Either way the validated rows are scored
+    as a float matrix by the array engine. With ``as_numpy`` the
+    predictions are returned as arrays instead of lists, for encoders that
+    write NumPy buffers directly. ``version`` selects a saved model other
+    than the active one.
+    """
+
+    if isinstance(input_data, np.ndarray):
+        validated_data, errors = validate_array_inputs(input_data=input_data)
+    else:
+        data = pd.DataFrame(input_data)
+        validated_data, errors = validate_inputs(input_data=data)
+        validated_data = validated_data[config.ml_model_config.features].to_numpy(dtype=np.float64)
+
+    results = {"predictions": None, "version": version or registry.active_version, "errors": errors}
 
     if not errors:
-        predictions = _classification_pipe.predict(
-            X=validated_data[config.ml_model_config.features]
-        )
-        
-        predictions_proba = _classification_pipe.predict_proba(
-            X=validated_data[config.ml_model_config.features]
+        metrics.observe_size(
+            "prediction_request_rows", len(validated_data), help="Rows per prediction request."
         )
+        model = load_model(version)
+        predictions, predictions_proba = model.request_engine.predict(validated_data)
         results = {
-            "predictions": predictions.tolist(),
-            "prediction_probabilities": predictions_proba.tolist(),
-            "version": _version,
+            "predictions": predictions if as_numpy else predictions.tolist(),
+            "prediction_probabilities": predictions_proba if as_numpy else predictions_proba.tolist(),
+            "version": model.version,
             "errors": errors,
         }
 
-    return results
\ No newline at end of file
+    return results
+
+
+def make_batch_prediction(
+    *, inputs: t.Sequence[np.ndarray], as_numpy: bool = False
+) -> t.List[dict]:
+    """Score several independent requests with a single engine call.
+
+    Each matrix is validated on its own, so an invalid request only fails
+    itself. The valid ones are stacked, scored in one vectorised pass and
+    split back into one ``make_prediction``-style result per input, all
+    scored by the active model.
+    """
+    validated = [validate_array_inputs(input_data=matrix) for matrix in inputs]
+    valid = [data for data, errors in validated if not errors]
+
+    model_version = registry.active_version
+    if valid:
+        model = load_model()
+        model_version = model.version
+        predictions, predictions_proba = model.request_engine.predict(np.concatenate(valid))
+        offsets = np.cumsum([len(data) for data in valid])[:-1]
+        prediction_parts = iter(np.split(predictions, offsets))
+        proba_parts = iter(np.split(predictions_proba, offsets))
+
+    results = []
+    for _, errors in validated:
+        if errors:
+            results.append({"predictions": None, "version": model_version, "errors": errors})
+        else:
+            predictions, predictions_proba = next(prediction_parts), next(proba_parts)
+            results.append({
+                "predictions": predictions if as_numpy else predictions.tolist(),
+                "prediction_probabilities": predictions_proba if as_numpy else predictions_proba.tolist(),
+                "version": model_version,
+                "errors": errors,
+            })
+    return results
+
+
+def make_bulk_prediction(
+    *, chunks: t.Iterable[np.ndarray], version: str = None
+) -> t.Iterator[np.ndarray]:
+    """Yield the class probabilities of each chunk of a bulk scoring stream.
+
+    Unlike ``make_prediction`` no row is ever dropped, so output row ``i``
+    always belongs to input row ``i``. Values are clipped to the feature
+    ranges and missing values filled as the pipeline's data validator
+    does, with its fitted medians; for models saved before the validator
+    learned them, a chunk with missing values raises ``MissingMediansError``.
+    The whole stream is scored by the model that was active, or selected by
+    ``version``, when it started.
+    """
+    array_engine = load_model(version).array_engine
+    for chunk in chunks:
+        yield array_engine.predict_proba(chunk)
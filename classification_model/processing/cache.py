@@ -0,0 +1,174 @@
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+import numpy as np
+
+from classification_model.processing import metrics
+from classification_model.processing.engine import ArrayEngine
+from classification_model.processing.lookup import BorderIndex
+
+# Ways to key a cached row: the clipped and scaled feature values, or the
+# CatBoost border bucket of every feature
+CACHE_KEYS = ("values", "buckets")
+
+
+class PredictionCache:
+    """Thread-safe LRU map from row keys to class probabilities with a TTL.
+
+    Entries older than ``ttl_seconds`` count as misses and are dropped when
+    looked up; beyond ``max_size`` entries the least recently used go first.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.seconds_saved = 0.0
+        # Model calls for rows the cache missed, and their mean duration,
+        # used to estimate the time saved by each fully cached request
+        self.model_calls = 0
+        self.mean_call_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: t.Sequence[bytes]) -> t.List[t.Optional[np.ndarray]]:
+        """Cached rows for ``keys``, with None for misses."""
+        now = self._clock()
+        found = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] <= now:
+                    del self._entries[key]
+                    entry = None
+                if entry is None:
+                    found.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    found.append(entry[1])
+            hits = sum(row is not None for row in found)
+            self.hits += hits
+            self.misses += len(found) - hits
+        return found
+
+    def put_many(self, keys: t.Sequence[bytes], rows: np.ndarray) -> None:
+        expires = self._clock() + self.ttl_seconds
+        with self._lock:
+            for key, row in zip(keys, rows):
+                self._entries[key] = (expires, row)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def record_call(self, seconds: float) -> None:
+        with self._lock:
+            self.model_calls += 1
+            self.mean_call_seconds += (seconds - self.mean_call_seconds) / self.model_calls
+
+    def record_saved(self) -> None:
+        """Count one request answered without calling the model."""
+        with self._lock:
+            self.seconds_saved += self.mean_call_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "seconds_saved": self.seconds_saved,
+            }
+
+
+class CachedEngine:
+    """``ArrayEngine`` front end that scores each distinct row once per TTL.
+
+    With ``key="buckets"`` a row is keyed on the CatBoost border bucket of
+    each (clipped and scaled) feature. Every split in the model compares a
+    feature with one of those borders, so rows in the same buckets reach
+    the same leaf in every tree and share one entry exactly. ``"values"``
+    keys on the clipped and scaled values themselves. Missing values are
+    filled before keying with the validator's fitted medians.
+
+    The cache belongs to one loaded model, so a new model version or a
+    reload starts with an empty one.
+    """
+
+    def __init__(self, engine: ArrayEngine, *, cache: PredictionCache, key: str = "buckets"):
+        if key not in CACHE_KEYS:
+            raise ValueError(f"Cache key must be one of {CACHE_KEYS}, got {key!r}")
+        self.engine = engine
+        self.cache = cache
+        self.key = key
+        self.classes_ = engine.classes_
+        self.threshold = engine.threshold
+        self._border_index = None
+        if key == "buckets":
+            borders = engine.model.get_borders()
+            self._border_index = BorderIndex([
+                borders.get(index, []) for index in range(len(engine.features))
+            ])
+
+    def _keys(self, X: np.ndarray) -> t.List[bytes]:
+        if self.key == "values":
+            return [row.tobytes() for row in X]
+        buckets = self._border_index.bucket_codes(X).astype(np.int16)
+        return [row.tobytes() for row in buckets]
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Return the class probabilities, scoring only rows not in the cache."""
+        X = self.engine.transform(X)
+        keys = self._keys(X)
+        with metrics.stage("cache_lookup"):
+            cached = self.cache.get_many(keys)
+        missing = [index for index, row in enumerate(cached) if row is None]
+        if not missing:
+            self.cache.record_saved()
+            return np.stack(cached)
+
+        start = time.perf_counter()
+        scored = self.engine.evaluate(X[missing])
+        self.cache.record_call(time.perf_counter() - start)
+        # Callers own the returned array, so the cache keeps its own rows
+        self.cache.put_many([keys[index] for index in missing], scored.copy())
+        if len(missing) == len(keys):
+            return scored
+
+        proba = np.empty((len(keys), scored.shape[1]), dtype=scored.dtype)
+        for index, row in enumerate(cached):
+            if row is not None:
+                proba[index] = row
+        proba[missing] = scored
+        return proba
+
+    def labels_from_proba(self, proba: np.ndarray) -> np.ndarray:
+        return self.engine.labels_from_proba(proba)
+
+    def predict(self, X: np.ndarray) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Return ``(labels, probabilities)`` for a raw feature matrix."""
+        proba = self.predict_proba(X)
+        return self.labels_from_proba(proba), proba
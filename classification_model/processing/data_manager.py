@@ -1,29 +1,711 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from functools import partial
 import joblib
+import numpy as np
 import pandas as pd 
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from classification_model import __version__ as _version
-from classification_model.config.core import DATASET_DIR, TRAINED_MODEL_DIR, config
+from classification_model.config.core import (
+    DATASET_CACHE_DIR,
+    DATASET_DIR,
+    TRAINED_MODEL_DIR,
+    config,
+)
+
+# CatBoost and sklearn.model_selection are only needed for training and
+# take seconds to import, so they are imported where they are used
+if TYPE_CHECKING:
+    from catboost import CatBoostClassifier, Pool
+
+    from classification_model.processing.lookup import LookupTableModel
+
+# Rows parsed per chunk by the streaming loaders
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Bump when the layout of the columnar cache changes
+CACHE_FORMAT_VERSION = 1
+
+# Bytes hashed from each end of the source file for the cache key
+CACHE_HASH_SPAN = 1 << 20
+
+# CatBoost parameters that change how a pool is quantized
+QUANTIZATION_PARAMS = ("border_count", "feature_border_type", "nan_mode")
+
+# Bump when the layout of the model artifact sidecar changes
+ARTIFACT_FORMAT_VERSION = 1
+
 
 def load_dataset(*, file_name: str) -> pd.DataFrame: 
-    dataframe = pd.read_csv(Path(f"{DATASET_DIR}/{file_name}"))
+    dataframe = pd.read_csv(DATASET_DIR / file_name)
     return dataframe
 
-def save_pipeline(*, pipeline_to_persist) -> None:
+
+def dataset_dtypes() -> Dict[str, str]:
+    """Compact parse dtypes for the columns used in training.
+
+    Sensor readings fit in float32 and the quality label in int8; every
+    other column (e.g. ``PIPE_NO``) is skipped at parse time.
+    """
+    dtypes = {feature: "float32" for feature in config.ml_model_config.features}
+    dtypes[config.ml_model_config.target] = "int8"
+    return dtypes
+
+
+def iter_dataset_chunks(
+    *,
+    file_name: str,
+    columns: List[str] = None,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    skip_rows: int = 0,
+) -> Iterator[pd.DataFrame]:
+    """Stream the training file in chunks with compact dtypes.
+
+    ``file_name`` is resolved against ``DATASET_DIR``; absolute paths are
+    used as they are. Columns outside the model schema keep the dtypes
+    pandas infers, and the first ``skip_rows`` data rows are skipped.
+    """
+    dtypes = dataset_dtypes()
+    columns = columns or list(dtypes)
+    return pd.read_csv(
+        DATASET_DIR / file_name,
+        usecols=columns,
+        dtype={column: dtypes[column] for column in columns if column in dtypes},
+        chunksize=chunksize,
+        skiprows=range(1, skip_rows + 1) if skip_rows else None,
+    )
+
+
+def load_dataset_chunked(*, file_name: str, chunksize: int = DEFAULT_CHUNK_SIZE) -> pd.DataFrame:
+    """Load the features and target with compact dtypes, chunk by chunk."""
+    return pd.concat(
+        iter_dataset_chunks(file_name=file_name, chunksize=chunksize),
+        ignore_index=True,
+    )
+
+
+def _split_indices(y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row indices of the configured stratified train/test split."""
+    from sklearn.model_selection import train_test_split
+
+    return train_test_split(
+        np.arange(len(y), dtype=np.int64),
+        test_size=config.ml_model_config.test_size,
+        random_state=config.ml_model_config.random_state,
+        stratify=y,
+    )
+
+
+def stream_train_test_split(
+    *, file_name: str, chunksize: int = DEFAULT_CHUNK_SIZE
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    """Stratified train/test split that never holds the full frame twice.
+
+    The target column is read first (one byte per row) to draw the same
+    stratified split as ``sklearn.model_selection.train_test_split`` with the
+    configured ``test_size`` and ``random_state``. The features are then
+    streamed in chunks and scattered straight into preallocated train and
+    test matrices, in the order ``train_test_split`` would return them.
+    """
+    features = config.ml_model_config.features
+    target = config.ml_model_config.target
+
+    y = np.concatenate([
+        chunk[target].to_numpy()
+        for chunk in iter_dataset_chunks(file_name=file_name, columns=[target], chunksize=chunksize)
+    ])
+    train_index, test_index = _split_indices(y)
+
+    # Destination row of every source row; -1 marks the other split
+    position_dtype = np.int32 if len(y) < np.iinfo(np.int32).max else np.int64
+    train_position = np.full(len(y), -1, dtype=position_dtype)
+    train_position[train_index] = np.arange(len(train_index), dtype=position_dtype)
+    test_position = np.full(len(y), -1, dtype=position_dtype)
+    test_position[test_index] = np.arange(len(test_index), dtype=position_dtype)
+    n_train, n_test = len(train_index), len(test_index)
+    del train_index, test_index
+
+    X_train = np.empty((n_train, len(features)), dtype=np.float32)
+    X_test = np.empty((n_test, len(features)), dtype=np.float32)
+
+    start = 0
+    for chunk in iter_dataset_chunks(file_name=file_name, columns=features, chunksize=chunksize):
+        values = chunk[features].to_numpy()
+        stop = start + len(values)
+        for destination, positions in ((X_train, train_position), (X_test, test_position)):
+            chunk_positions = positions[start:stop]
+            selected = chunk_positions >= 0
+            destination[chunk_positions[selected]] = values[selected]
+        start = stop
+
+    y_train = np.empty(n_train, dtype=y.dtype)
+    y_train[train_position[train_position >= 0]] = y[train_position >= 0]
+    y_test = np.empty(n_test, dtype=y.dtype)
+    y_test[test_position[test_position >= 0]] = y[test_position >= 0]
+
+    return (
+        pd.DataFrame(X_train, columns=features, copy=False),
+        pd.DataFrame(X_test, columns=features, copy=False),
+        pd.Series(y_train, name=target),
+        pd.Series(y_test, name=target),
+    )
+
+
+class ColumnarDataset(NamedTuple):
+    """Memory-mapped training data from the columnar cache."""
+    X: np.ndarray
+    y: np.ndarray
+    features: List[str]
+    target: str
+    path: Path
+
+
+def dataset_cache_key(*, file_name: str) -> str:
+    """Key identifying the source file and the configured columns.
+
+    Covers the file size and mtime plus a hash of its first and last MiB,
+    so a stale cache is detected without re-reading the whole file, and the
+    features, target and dtypes taken from ``config.yml``.
+    """
+    source = DATASET_DIR / file_name
+    stat = source.stat()
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "version": CACHE_FORMAT_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "features": config.ml_model_config.features,
+        "target": config.ml_model_config.target,
+        "dtypes": dataset_dtypes(),
+    }, sort_keys=True).encode())
+    with open(source, "rb") as source_file:
+        digest.update(source_file.read(CACHE_HASH_SPAN))
+        if stat.st_size > CACHE_HASH_SPAN:
+            source_file.seek(max(CACHE_HASH_SPAN, stat.st_size - CACHE_HASH_SPAN))
+            digest.update(source_file.read())
+    return digest.hexdigest()[:16]
+
+
+def _count_rows(path: Path) -> int:
+    """Count data rows of a CSV file from its line breaks."""
+    lines, last = 0, b"\n"
+    with open(path, "rb") as source_file:
+        for block in iter(lambda: source_file.read(1 << 22), b""):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        lines += 1
+    return lines - 1
+
+
+def _write_npy_header(npy_file, *, dtype, shape: Tuple[int, ...]) -> None:
+    np.lib.format.write_array_header_2_0(npy_file, {
+        "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+        "fortran_order": False,
+        "shape": shape,
+    })
+
+
+def _write_columnar_cache(*, file_name: str, cache_path: Path, chunksize: int) -> None:
+    """Stream the CSV into ``X.npy``/``y.npy`` and publish the directory atomically.
+
+    Chunks are appended with plain file writes rather than through a
+    memory map, so building the cache of a dataset larger than memory
+    never holds more than one chunk.
+    """
+    features = config.ml_model_config.features
+    target = config.ml_model_config.target
+    n_rows = _count_rows(DATASET_DIR / file_name)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    build_path = Path(tempfile.mkdtemp(dir=cache_path.parent, prefix=".build-"))
+    try:
+        start = 0
+        with open(build_path / "X.npy", "wb") as X_file, open(build_path / "y.npy", "wb") as y_file:
+            _write_npy_header(X_file, dtype=np.float32, shape=(n_rows, len(features)))
+            _write_npy_header(y_file, dtype=np.int8, shape=(n_rows,))
+            for chunk in iter_dataset_chunks(file_name=file_name, chunksize=chunksize):
+                X_file.write(chunk[features].to_numpy(dtype=np.float32).tobytes())
+                y_file.write(chunk[target].to_numpy(dtype=np.int8).tobytes())
+                start += len(chunk)
+        if start != n_rows:
+            raise ValueError(
+                f"Expected {n_rows} rows in {file_name} but parsed {start}; "
+                "blank or multi-line records are not supported by the cache"
+            )
+
+        (build_path / "meta.json").write_text(json.dumps({
+            "source": str(DATASET_DIR / file_name),
+            "rows": n_rows,
+            "features": features,
+            "target": target,
+        }))
+        try:
+            os.rename(build_path, cache_path)
+        except OSError:
+            # Another process published the same cache first
+            if not (cache_path / "meta.json").is_file():
+                raise
+    finally:
+        shutil.rmtree(build_path, ignore_errors=True)
+
+
+def _cache_prefix(*, file_name: str) -> str:
+    """Name shared by every cache of one source file, whatever its contents.
+
+    The stem keeps the directory readable; the hash of the resolved source
+    path tells apart files with the same stem (``welds.csv`` in two
+    directories, or ``welds.csv`` and ``welds-2023.csv``).
+    """
+    source = str((DATASET_DIR / file_name).resolve())
+    return f"{Path(file_name).stem}-{hashlib.sha256(source.encode()).hexdigest()[:8]}-"
+
+
+def open_columnar_cache(cache_path: Path) -> Optional[ColumnarDataset]:
+    """Memory-map a published cache, or None if it is missing.
+
+    Another process may remove a cache it considers stale at any moment;
+    once mapped, the files stay readable until they are closed.
+    """
+    try:
+        meta = json.loads((cache_path / "meta.json").read_text())
+        X = np.load(cache_path / "X.npy", mmap_mode="r")
+        y = np.load(cache_path / "y.npy", mmap_mode="r")
+    except FileNotFoundError:
+        return None
+    return ColumnarDataset(
+        X=X, y=y, features=meta["features"], target=meta["target"], path=cache_path
+    )
+
+
+def load_dataset_cached(*, file_name: str, chunksize: int = DEFAULT_CHUNK_SIZE) -> ColumnarDataset:
+    """Memory-map the training data from its columnar cache.
+
+    The first call streams the CSV into one float32 ``.npy`` matrix for the
+    features and an int8 vector for the target under ``DATASET_CACHE_DIR``.
+    Later calls map those files read-only with no parsing or copying, and
+    every process training on the same data shares the page cache. Caches
+    left behind by older versions of the same file are removed.
+    """
+    prefix = _cache_prefix(file_name=file_name)
+    cache_path = DATASET_CACHE_DIR / f"{prefix}{dataset_cache_key(file_name=file_name)}"
+
+    dataset = open_columnar_cache(cache_path)
+    if dataset is None:
+        _write_columnar_cache(file_name=file_name, cache_path=cache_path, chunksize=chunksize)
+        stale_name = re.compile(re.escape(prefix) + r"[0-9a-f]{16}")
+        for stale_path in DATASET_CACHE_DIR.iterdir():
+            if stale_path != cache_path and stale_name.fullmatch(stale_path.name):
+                shutil.rmtree(stale_path, ignore_errors=True)
+        dataset = open_columnar_cache(cache_path)
+        if dataset is None:
+            raise FileNotFoundError(f"Columnar cache {cache_path} was removed while loading it")
+    return dataset
+
+
+def columnar_train_test_split(
+    *, dataset: ColumnarDataset
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    """The configured stratified split, gathered straight from the memory map.
+
+    The split indices are cached next to the data per ``test_size`` and
+    ``random_state``, as drawing them costs more than mapping the data.
+    """
+    X, y = np.asarray(dataset.X), np.asarray(dataset.y)
+    split_path = dataset.path / (
+        f"split-{config.ml_model_config.test_size}-{config.ml_model_config.random_state}.npz"
+    )
+    if split_path.is_file():
+        with np.load(split_path) as split:
+            train_index, test_index = split["train"], split["test"]
+    else:
+        train_index, test_index = _split_indices(y)
+        with tempfile.NamedTemporaryFile(dir=dataset.path, suffix=".npz", delete=False) as split_file:
+            np.savez(split_file, train=train_index, test=test_index)
+        os.replace(split_file.name, split_path)
+    return (
+        pd.DataFrame(X[train_index], columns=dataset.features, copy=False),
+        pd.DataFrame(X[test_index], columns=dataset.features, copy=False),
+        pd.Series(y[train_index], name=dataset.target),
+        pd.Series(y[test_index], name=dataset.target),
+    )
+
+
+def quantized_pool_path(
+    *, dataset: ColumnarDataset, quantization: Dict, split: Dict = None
+) -> Path:
+    """Directory of the quantized train/eval pools for a dataset cache.
+
+    Keyed on the split settings, the clip ranges applied before quantization
+    and the quantization parameters, next to the dataset cache it was built
+    from (so it is dropped together with a stale dataset cache). ``split``
+    describes a split other than ``columnar_train_test_split``'s.
+    """
+    digest = hashlib.sha256(json.dumps({
+        "version": CACHE_FORMAT_VERSION,
+        "test_size": config.ml_model_config.test_size,
+        "random_state": config.ml_model_config.random_state,
+        "feature_ranges": config.ml_model_config.feature_ranges,
+        "quantization": quantization,
+        **({"split": split} if split else {}),
+    }, sort_keys=True).encode())
+    return dataset.path / f"pool-{digest.hexdigest()[:16]}"
+
+
+def load_quantized_pools(*, path: Path) -> Optional[Tuple["Pool", "Pool"]]:
+    """Load previously saved quantized train/eval pools, if any."""
+    from catboost import Pool
+
+    if not (path / "eval.bin").is_file():
+        return None
+    return (
+        Pool(f"quantized://{path / 'train.bin'}"),
+        Pool(f"quantized://{path / 'eval.bin'}"),
+    )
+
+
+def build_quantized_pools(
+    *,
+    path: Path,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_eval: np.ndarray,
+    y_eval: np.ndarray,
+    quantization: Dict,
+) -> Tuple["Pool", "Pool"]:
+    """Quantize train/eval pools once and save them under ``path``.
+
+    The eval pool reuses the train borders, as CatBoost requires for an
+    ``eval_set``. Both are written to a scratch directory that is renamed
+    into place, then loaded back from disk.
+    """
+    from catboost import Pool
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    build_path = Path(tempfile.mkdtemp(dir=path.parent, prefix=".build-"))
+    try:
+        train_pool = Pool(np.ascontiguousarray(X_train, dtype=np.float32), label=y_train)
+        train_pool.quantize(**quantization)
+        train_pool.save(str(build_path / "train.bin"))
+        train_pool.save_quantization_borders(str(build_path / "borders.tsv"))
+        del train_pool
+
+        eval_pool = Pool(np.ascontiguousarray(X_eval, dtype=np.float32), label=y_eval)
+        eval_pool.quantize(input_borders=str(build_path / "borders.tsv"))
+        eval_pool.save(str(build_path / "eval.bin"))
+        del eval_pool
+
+        try:
+            os.rename(build_path, path)
+        except OSError:
+            # Another process published the same pools first
+            if not (path / "eval.bin").is_file():
+                raise
+    finally:
+        shutil.rmtree(build_path, ignore_errors=True)
+
+    return load_quantized_pools(path=path)
+
+
+# Where a streaming split sends each row
+SPLIT_TRAIN, SPLIT_EVAL, SPLIT_DROPPED = 0, 1, 2
+
+
+def iter_columnar_chunks(
+    *, dataset: ColumnarDataset, chunksize: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Read ``(X, y)`` chunks of a columnar cache with plain file reads.
+
+    Slicing the memory map would leave every page read mapped into the
+    process, so resident memory would grow to the size of the dataset;
+    reads keep it at one chunk.
+    """
+    n_rows, n_features = dataset.X.shape
+    with open(dataset.path / "X.npy", "rb") as X_file, open(dataset.path / "y.npy", "rb") as y_file:
+        X_file.seek(dataset.X.offset)
+        y_file.seek(dataset.y.offset)
+        for start in range(0, n_rows, chunksize):
+            count = min(chunksize, n_rows - start)
+            X = np.fromfile(X_file, dtype=dataset.X.dtype, count=count * n_features)
+            yield X.reshape(count, n_features), np.fromfile(y_file, dtype=dataset.y.dtype, count=count)
+
+
+def streaming_split_quotas(
+    *, class_counts: np.ndarray, test_size: float, max_rows: int = None
+) -> np.ndarray:
+    """Rows of each class to keep and drop in the train and eval splits.
+
+    Row ``c`` holds ``(train kept, train dropped, eval kept, eval dropped)``
+    for class ``c``. Every class is split with ``test_size``; when the
+    classes add up to more than ``max_rows``, both splits of every class
+    are sampled down by the same fraction, so the sample stays stratified.
+    """
+    class_counts = np.asarray(class_counts, dtype=np.int64)
+    n_eval = np.rint(class_counts * test_size).astype(np.int64)
+    n_train = class_counts - n_eval
+    keep = 1.0 if not max_rows else min(1.0, max_rows / max(1, class_counts.sum()))
+    kept_train = np.floor(n_train * keep).astype(np.int64)
+    kept_eval = np.floor(n_eval * keep).astype(np.int64)
+    return np.stack([kept_train, n_train - kept_train, kept_eval, n_eval - kept_eval], axis=1)
+
+
+def iter_streaming_split(
+    *,
+    dataset: ColumnarDataset,
+    test_size: float,
+    random_state: int,
+    max_rows: int = None,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Stratified train/eval split of a columnar cache, one chunk at a time.
+
+    Yields ``(X, y, split)`` per chunk, where ``split`` holds ``SPLIT_TRAIN``,
+    ``SPLIT_EVAL`` or ``SPLIT_DROPPED`` for every row. The class counts are
+    read first (one byte per row); after that each chunk draws how many of
+    its rows of every class go to each quota of ``streaming_split_quotas``
+    from a multivariate hypergeometric distribution over what is left, so
+    the totals are exact while only one chunk is ever in memory. The split
+    is the same on every pass for a given ``random_state`` and ``chunksize``.
+    """
+    class_counts = np.zeros(0, dtype=np.int64)
+    for _, y in iter_columnar_chunks(dataset=dataset, chunksize=chunksize):
+        counts = np.bincount(y, minlength=len(class_counts))
+        counts[:len(class_counts)] += class_counts
+        class_counts = counts
+    remaining = streaming_split_quotas(
+        class_counts=class_counts, test_size=test_size, max_rows=max_rows
+    )
+    quota_splits = np.array([SPLIT_TRAIN, SPLIT_DROPPED, SPLIT_EVAL, SPLIT_DROPPED], dtype=np.int8)
+
+    rng = np.random.default_rng(random_state)
+    for X, y in iter_columnar_chunks(dataset=dataset, chunksize=chunksize):
+        split = np.empty(len(y), dtype=np.int8)
+        for label in np.unique(y):
+            rows = np.flatnonzero(y == label)
+            drawn = rng.multivariate_hypergeometric(remaining[label], len(rows))
+            remaining[label] -= drawn
+            split[rows] = rng.permutation(np.repeat(quota_splits, drawn))
+        yield X, y, split
+
+
+def build_streamed_pools(
+    *,
+    path: Path,
+    chunks: Iterable[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    quantization: Dict,
+) -> Tuple["Pool", "Pool"]:
+    """Quantize train/eval pools from a stream of preprocessed chunks.
+
+    ``chunks`` yields ``(X, y, split)`` like ``iter_streaming_split``, with
+    ``X`` already preprocessed. Rows are appended to tab-separated train
+    and eval files on disk, which ``catboost.utils.quantize`` reads block
+    by block, so the raw features are never all in memory. The eval pool
+    reuses the train borders; both pools are saved under ``path`` like
+    ``build_quantized_pools`` and the text files are removed.
+    """
+    from catboost.utils import quantize
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    build_path = Path(tempfile.mkdtemp(dir=path.parent, prefix=".build-"))
+    try:
+        column_description = build_path / "columns.cd"
+        column_description.write_text("0\tLabel\n")
+        text_paths = {SPLIT_TRAIN: build_path / "train.tsv", SPLIT_EVAL: build_path / "eval.tsv"}
+        with open(text_paths[SPLIT_TRAIN], "w") as train_file, open(text_paths[SPLIT_EVAL], "w") as eval_file:
+            for X, y, split in chunks:
+                for code, text_file in ((SPLIT_TRAIN, train_file), (SPLIT_EVAL, eval_file)):
+                    selected = split == code
+                    frame = pd.DataFrame(np.asarray(X)[selected], copy=False)
+                    frame.insert(0, "label", y[selected])
+                    # %.9g round-trips every float32 value CatBoost will parse
+                    frame.to_csv(text_file, sep="\t", header=False, index=False, float_format="%.9g")
+
+        train_pool = quantize(
+            str(text_paths[SPLIT_TRAIN]), column_description=str(column_description), **quantization
+        )
+        train_pool.save(str(build_path / "train.bin"))
+        train_pool.save_quantization_borders(str(build_path / "borders.tsv"))
+        del train_pool
+        text_paths[SPLIT_TRAIN].unlink()
+
+        eval_pool = quantize(
+            str(text_paths[SPLIT_EVAL]),
+            column_description=str(column_description),
+            input_borders=str(build_path / "borders.tsv"),
+        )
+        eval_pool.save(str(build_path / "eval.bin"))
+        del eval_pool
+        text_paths[SPLIT_EVAL].unlink()
+        column_description.unlink()
+
+        try:
+            os.rename(build_path, path)
+        except OSError:
+            # Another process published the same pools first
+            if not (path / "eval.bin").is_file():
+                raise
+    finally:
+        shutil.rmtree(build_path, ignore_errors=True)
+
+    return load_quantized_pools(path=path)
+
+
+def save_pipeline(
+    *,
+    pipeline_to_persist,
+    version: str = _version,
+    lookup_model: "LookupTableModel" = None,
+) -> None:
     """Persist the pipeline.
-    Saves the versioned model, and overwrites any previous
-    saved models. This ensures that when the package is
-    published, there is only one trained model that can be
-    called, and we know exactly how it was built.
+    Saves the versioned model with its native artifact next to the
+    pickle, plus the classifier's compiled lookup tables when given. Only
+    the newest ``registry_config.keep_versions`` model versions are kept,
+    so the registry can roll back to a recent model while older ones are
+    removed.
     """
-    
+
     # Prepare versioned save file name
-    save_file_name = f"{config.app_config.pipeline_save_file}{_version}.pkl"
+    save_file_name = f"{config.app_config.pipeline_save_file}{version}.pkl"
     save_path = TRAINED_MODEL_DIR / save_file_name
 
-    remove_old_pipelines(files_to_keep=[save_file_name])
     joblib.dump(pipeline_to_persist, save_path)
+    save_model_artifact(pipeline=pipeline_to_persist, version=version)
+    lookup_path = TRAINED_MODEL_DIR / lookup_file_name(version)
+    if lookup_model is not None:
+        lookup_model.save(lookup_path)
+    else:
+        # Tables compiled from an earlier model of this version are stale
+        lookup_path.unlink(missing_ok=True)
+
+    versions = sorted(
+        set(available_model_versions()) - {version}, key=version_sort_key, reverse=True
+    )
+    keep = [version, *versions[:max(0, config.registry_config.keep_versions - 1)]]
+    remove_old_pipelines(files_to_keep=[name for kept in keep for name in model_file_names(kept)])
+
+
+def resave_pipeline(*, pipeline, version: str) -> None:
+    """Rewrite the pickle and native artifact of a saved version in place.
+
+    For changes to the steps before the classifier: the lookup tables only
+    depend on the classifier and are kept, as are the other versions.
+    """
+    joblib.dump(pipeline, TRAINED_MODEL_DIR / model_file_names(version)[0])
+    save_model_artifact(pipeline=pipeline, version=version)
+
+
+def version_sort_key(version: str) -> Tuple:
+    """Order versions numerically part by part, so 0.10.0 sorts after 0.9.0."""
+    return tuple((int(part), "") if part.isdigit() else (-1, part) for part in version.split("."))
+
+
+def next_model_version(base_version: str) -> str:
+    """The patch version after both ``base_version`` and every saved version."""
+    latest = max([base_version, *available_model_versions()], key=version_sort_key)
+    major_minor, _, patch = latest.rpartition(".")
+    if not patch.isdigit():
+        raise ValueError(f"Cannot derive a version after {latest!r}; pass one explicitly")
+    return f"{major_minor}.{int(patch) + 1}" if major_minor else str(int(patch) + 1)
+
+
+def model_file_names(version: str = _version) -> Tuple[str, ...]:
+    """Names of every file saved for a model version, the pickle first."""
+    return (
+        f"{config.app_config.pipeline_save_file}{version}.pkl",
+        *artifact_file_names(version),
+        lookup_file_name(version),
+    )
+
+
+def available_model_versions() -> List[str]:
+    """Model versions saved in ``TRAINED_MODEL_DIR``, oldest first."""
+    prefix = config.app_config.pipeline_save_file
+    versions = {
+        path.name[len(prefix):-len(path.suffix)]
+        for path in TRAINED_MODEL_DIR.glob(f"{prefix}*")
+        if path.suffix in (".cbm", ".pkl")
+    }
+    return sorted(versions, key=version_sort_key)
+
+
+def artifact_file_names(version: str = _version) -> Tuple[str, str]:
+    """Names of the ``.cbm`` model and its JSON sidecar for a model version."""
+    stem = f"{config.app_config.pipeline_save_file}{version}"
+    return f"{stem}.cbm", f"{stem}.json"
+
+
+def lookup_file_name(version: str = _version) -> str:
+    """Name of the compiled lookup tables of a model version."""
+    return f"{config.app_config.pipeline_save_file}{version}.lut.npz"
+
+
+def save_model_artifact(*, pipeline, version: str = _version) -> None:
+    """Save the classifier in CatBoost's native format with a JSON sidecar.
+
+    The sidecar holds what inference needs from the other pipeline steps:
+    the feature order, the validator clip ranges and fill medians (``null``
+    for a validator fitted before it learned them) and the scaler
+    parameters (``null`` once the scaler is folded into the model). Loading the pair
+    needs neither sklearn nor unpickling.
+    """
+    model_name, sidecar_name = artifact_file_names(version)
+    scaler = pipeline.named_steps.get("scaler")
+    validator = pipeline.named_steps["data_validator"]
+    feature_ranges = validator.feature_ranges
+    medians = validator.medians_for(config.ml_model_config.features)
+    sidecar = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "model_version": version,
+        "features": list(config.ml_model_config.features),
+        "feature_ranges": {
+            feature: {"min": float(ranges["min"]), "max": float(ranges["max"])}
+            for feature, ranges in feature_ranges.items()
+        },
+        "medians": None if medians is None else medians.tolist(),
+        "scaler": None if scaler is None else {
+            "mean": scaler.mean_.tolist(),
+            "scale": scaler.scale_.tolist(),
+        },
+    }
+    pipeline.steps[-1][1].save_model(str(TRAINED_MODEL_DIR / model_name), format="cbm")
+    (TRAINED_MODEL_DIR / sidecar_name).write_text(json.dumps(sidecar, indent=2))
+
+
+def load_model_artifact(*, version: str = _version) -> Optional[Tuple["CatBoostClassifier", Dict]]:
+    """Load a native model artifact, or None if it was never saved."""
+    from catboost import CatBoostClassifier
+
+    model_name, sidecar_name = artifact_file_names(version)
+    model_path, sidecar_path = TRAINED_MODEL_DIR / model_name, TRAINED_MODEL_DIR / sidecar_name
+    if not (model_path.is_file() and sidecar_path.is_file()):
+        return None
+    sidecar = json.loads(sidecar_path.read_text())
+    if sidecar["format_version"] != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported model artifact format: {sidecar['format_version']}")
+    return CatBoostClassifier().load_model(str(model_path), format="cbm"), sidecar
+
+
+def load_lookup_model(
+    *, version: str = _version, fallback=None, max_rows: int = None
+) -> Optional["LookupTableModel"]:
+    """Load the lookup tables saved for a model version, or None if there are none."""
+    from classification_model.processing.lookup import LOOKUP_MAX_ROWS, LookupTableModel
+
+    path = TRAINED_MODEL_DIR / lookup_file_name(version)
+    if not path.is_file():
+        return None
+    return LookupTableModel.load(
+        path, fallback=fallback, max_rows=LOOKUP_MAX_ROWS if max_rows is None else max_rows
+    )
 
 
 def load_pipeline(*, file_name: str):
@@ -35,12 +717,126 @@ def load_pipeline(*, file_name: str):
 
 def remove_old_pipelines(*, files_to_keep: List[str]) -> None:
     """
-    Remove old model pipelines.
-    This is to ensure there is a simple one-to-one
-    mapping between the package version and the model
-    version to be imported and used by other applications.
+    Remove every saved model file not in ``files_to_keep``.
     """
     do_not_delete = files_to_keep + ["__init__.py"]
     for model_file in TRAINED_MODEL_DIR.iterdir():
         if model_file.name not in do_not_delete:
-            model_file.unlink()
\ No newline at end of file
+            model_file.unlink()
+
+
+class ModelNotFoundError(LookupError):
+    """Raised for a model version with nothing saved in ``TRAINED_MODEL_DIR``."""
+
+
+def _reset_registry_locks(registry_ref: "weakref.ref[ModelRegistry]") -> None:
+    registry = registry_ref()
+    if registry is not None:
+        registry._reset_locks()
+
+
+class ModelRegistry:
+    """Loaded model versions, one of which is active.
+
+    ``loader`` builds a servable model for a version, warm-up included, and
+    raises ``ModelNotFoundError`` for unknown versions. ``activate`` loads
+    the new version first and then swaps it in with a single assignment,
+    so requests already holding the previous model finish on it. At most
+    ``max_loaded`` versions stay in memory: the least recently used one
+    other than the active version is dropped when a new one loads, and is
+    freed once its last in-flight request returns. With ``versions``, a
+    callable listing the saved versions, unknown versions are rejected
+    before waiting for another load.
+    """
+
+    def __init__(
+        self,
+        *,
+        loader: Callable[[str], Any],
+        default_version: str = _version,
+        max_loaded: int = 2,
+        versions: Callable[[], Iterable[str]] = None,
+    ):
+        self._loader = loader
+        self._versions = versions
+        self.default_version = default_version
+        self.max_loaded = max(1, max_loaded)
+        self._models = OrderedDict()
+        # (version, model), replaced as a whole so readers never see a mix
+        self._active = None
+        self._reset_locks()
+        # A fork (gunicorn --preload) can happen while the warm-up thread
+        # holds a lock; that thread does not exist in the child, so the
+        # child gets fresh locks and loads the model itself on first use.
+        os.register_at_fork(after_in_child=partial(_reset_registry_locks, weakref.ref(self)))
+
+    def _reset_locks(self) -> None:
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    @property
+    def active_version(self) -> str:
+        active = self._active
+        return self.default_version if active is None else active[0]
+
+    def loaded_versions(self) -> List[str]:
+        with self._lock:
+            return list(self._models)
+
+    def loaded_models(self) -> Dict[str, Any]:
+        """Models in memory by version, without touching their LRU order."""
+        with self._lock:
+            return dict(self._models)
+
+    def is_loaded(self, version: str = None) -> bool:
+        """Whether ``version`` (by default the active one) is ready to serve."""
+        if version is None:
+            return self._active is not None
+        return version in self._models
+
+    def get(self, version: str = None) -> Any:
+        """The model for ``version``, or the active model, loading it if needed."""
+        active = self._active
+        if active is not None and version in (None, active[0]):
+            return active[1]
+        if version is None:
+            # Another thread may have activated a version while this one waited
+            self._load(self.default_version, activate="if_unset")
+            return self._active[1]
+        with self._lock:
+            model = self._models.get(version)
+            if model is not None:
+                self._models.move_to_end(version)
+                return model
+        return self._load(version)
+
+    def activate(self, version: str, *, reload: bool = False) -> Any:
+        """Load and warm ``version``, then make it the active model.
+
+        With ``reload`` the version is read from disk again even if it is
+        in memory, to pick up a model retrained under the same version.
+        """
+        return self._load(version, activate="always", reload=reload)
+
+    def _load(self, version: str, *, activate: str = "never", reload: bool = False) -> Any:
+        if self._versions is not None and version not in self._versions():
+            raise ModelNotFoundError(f"Model version {version} is not available")
+        # One load at a time; concurrent callers for the same version reuse it
+        with self._load_lock:
+            with self._lock:
+                model = None if reload else self._models.get(version)
+            if model is None:
+                model = self._loader(version)
+            with self._lock:
+                self._models[version] = model
+                self._models.move_to_end(version)
+                if activate == "always" or (activate == "if_unset" and self._active is None):
+                    self._active = (version, model)
+                self._evict()
+                return model
+
+    def _evict(self) -> None:
+        active_version = None if self._active is None else self._active[0]
+        while len(self._models) > self.max_loaded:
+            oldest = next(version for version in self._models if version != active_version)
+            del self._models[oldest]
@@ -0,0 +1,165 @@
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from classification_model.processing import metrics
+
+
+class MissingMediansError(ValueError):
+    """Raised for missing values when a model was saved without fill medians."""
+
+    def __init__(self):
+        super().__init__(
+            "Missing values are filled with medians learned by DataValidator.fit, and this "
+            "model has none; fit them with `python classification_model/train_pipeline.py "
+            "--fit-medians`"
+        )
+
+
+class PipelineEngine:
+    """Single-pass inference over a fitted classification pipeline.
+
+    The pipeline is evaluated once per batch to get the class probabilities,
+    and the labels are derived from them with a decision threshold instead of
+    running the whole pipeline a second time through ``predict``.
+    """
+
+    def __init__(self, pipeline, *, threshold: float = 0.5):
+        self.pipeline = pipeline
+        self.threshold = threshold
+        self.classes_ = np.asarray(pipeline.classes_)
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        """Run the pipeline once and return the class probabilities."""
+        with metrics.stage("pipeline"):
+            return self.pipeline.predict_proba(X)
+
+    def labels_from_proba(self, proba: np.ndarray) -> np.ndarray:
+        """Map positive class probabilities onto class labels."""
+        return self.classes_[(proba[:, 1] > self.threshold).astype(np.intp)]
+
+    def predict(self, X: pd.DataFrame) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Return ``(labels, probabilities)`` from a single pipeline pass."""
+        proba = self.predict_proba(X)
+        return self.labels_from_proba(proba), proba
+
+
+class ArrayEngine:
+    """DataFrame-free inference for small requests.
+
+    The clip bounds, the scaler parameters and the CatBoost model are pulled
+    out of a fitted pipeline once, so a request only costs a few NumPy
+    operations on a float matrix before tree evaluation. Columns of ``X``
+    must follow the order of ``features``.
+    """
+
+    def __init__(
+        self,
+        pipeline,
+        *,
+        features: t.Sequence[str],
+        threshold: float = 0.5,
+        thread_count: int = -1,
+    ):
+        scaler = pipeline.named_steps.get("scaler")
+        validator = pipeline.named_steps["data_validator"]
+        self._set_parts(
+            model=pipeline.steps[-1][1],
+            features=features,
+            feature_ranges=validator.feature_ranges,
+            medians=validator.medians_for(features),
+            mean=None if scaler is None else scaler.mean_,
+            scale=None if scaler is None else scaler.scale_,
+            threshold=threshold,
+            thread_count=thread_count,
+        )
+
+    @classmethod
+    def from_artifact(
+        cls, model, sidecar: t.Dict, *, threshold: float = 0.5, thread_count: int = -1
+    ) -> "ArrayEngine":
+        """Build the engine from a native CatBoost model and its JSON sidecar."""
+        engine = cls.__new__(cls)
+        scaler = sidecar["scaler"]
+        engine._set_parts(
+            model=model,
+            features=sidecar["features"],
+            feature_ranges=sidecar["feature_ranges"],
+            # Absent from sidecars written before the validator learned medians
+            medians=sidecar.get("medians"),
+            mean=None if scaler is None else scaler["mean"],
+            scale=None if scaler is None else scaler["scale"],
+            threshold=threshold,
+            thread_count=thread_count,
+        )
+        return engine
+
+    def _set_parts(
+        self, *, model, features, feature_ranges, medians, mean, scale, threshold, thread_count
+    ) -> None:
+        self.features = list(features)
+        self.threshold = threshold
+        self.thread_count = thread_count
+
+        self.lower_ = np.array(
+            [float(feature_ranges[f]["min"]) if f in feature_ranges else -np.inf
+             for f in self.features]
+        )
+        self.upper_ = np.array(
+            [float(feature_ranges[f]["max"]) if f in feature_ranges else np.inf
+             for f in self.features]
+        )
+
+        # Fill values learned by the validator, or None if it was saved without them
+        self.medians_ = None if medians is None else np.asarray(medians, dtype=np.float64)
+        self.mean_ = None if mean is None else np.asarray(mean, dtype=np.float64)
+        self.scale_ = None if scale is None else np.asarray(scale, dtype=np.float64)
+
+        self.model = model
+        self.classes_ = np.asarray(self.model.classes_)
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Clip, fill missing values and scale a raw feature matrix."""
+        with metrics.stage("data_validator"):
+            X = np.array(X, dtype=np.float64, ndmin=2)
+            # ufuncs with ``out`` are cheaper than np.clip on tiny batches
+            np.maximum(X, self.lower_, out=X)
+            np.minimum(X, self.upper_, out=X)
+
+            # NaN survives the clip and propagates through the sum
+            if np.isnan(X.sum()):
+                # Same semantics as DataValidator: fill with the fitted medians
+                if self.medians_ is None:
+                    raise MissingMediansError()
+                missing = np.isnan(X)
+                X[missing] = np.take(self.medians_, np.nonzero(missing)[1])
+
+        if self.mean_ is not None:
+            with metrics.stage("scale"):
+                X -= self.mean_
+                X /= self.scale_
+        return X
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Class probabilities of an already transformed matrix."""
+        metrics.observe_size(
+            "prediction_model_batch_rows", len(X), help="Rows per model evaluation."
+        )
+        with metrics.stage("model"):
+            return self.model.predict(
+                X, prediction_type="Probability", thread_count=self.thread_count
+            )
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Return the class probabilities for a raw feature matrix."""
+        return self.evaluate(self.transform(X))
+
+    def labels_from_proba(self, proba: np.ndarray) -> np.ndarray:
+        """Map positive class probabilities onto class labels."""
+        return self.classes_[(proba[:, 1] > self.threshold).astype(np.intp)]
+
+    def predict(self, X: np.ndarray) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Return ``(labels, probabilities)`` for a raw feature matrix."""
+        proba = self.predict_proba(X)
+        return self.labels_from_proba(proba), proba
@@ -0,0 +1,213 @@
+import json
+import tempfile
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+# Rows evaluated per block, bounding the (rows, features, trees) gather
+LOOKUP_BLOCK_ROWS = 2048
+
+# Default largest batch scored from the tables when a fallback model is set;
+# CatBoost's vectorised evaluation is faster beyond a few dozen rows
+LOOKUP_MAX_ROWS = 32
+
+
+class BorderIndex:
+    """The CatBoost borders of every feature, indexed for bucketing rows.
+
+    A value's bucket is the number of its feature's borders it exceeds.
+    NumPy orders complex numbers by real then imaginary part, so with the
+    feature index as the real part the borders of every feature form one
+    sorted array and a single ``searchsorted`` finds all buckets.
+    """
+
+    def __init__(self, borders: t.Sequence[np.ndarray]):
+        per_feature = [np.asarray(feature_borders, dtype=np.float32) for feature_borders in borders]
+        self._border_keys = np.concatenate([
+            np.float32(index) + 1j * feature_borders
+            for index, feature_borders in enumerate(per_feature)
+        ]).astype(np.complex64)
+        sizes = np.array([len(feature_borders) for feature_borders in per_feature], dtype=np.int64)
+        self._border_offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        self._feature_index = np.arange(len(per_feature), dtype=np.float32)
+
+    def bucket_codes(self, X: np.ndarray) -> np.ndarray:
+        """Bucket of every value in the ``(rows, features)`` matrix ``X``."""
+        # CatBoost compares float32 values with ``value > border``, which
+        # side="left" reproduces: a value equal to a border stays below it
+        query = np.empty(X.shape, dtype=np.complex64)
+        query.real = self._feature_index
+        query.imag = X
+        return np.searchsorted(self._border_keys, query, side="left") - self._border_offsets
+
+
+class LookupTableModel:
+    """CatBoost oblivious trees compiled into dense NumPy lookup tables.
+
+    A feature value only matters to the trees through its bucket: the
+    number of that feature's borders it exceeds. For every feature, bucket
+    and tree the table stores the bits that feature sets in the tree's
+    leaf index, so a row's leaf in every tree is the sum of one table row
+    per feature. Scoring is then one ``searchsorted`` for all buckets, a
+    gather and sum for the leaf indices and a gather and sum of the leaf
+    values, with no tree traversal.
+
+    ``predict`` takes the arguments ``ArrayEngine`` passes to CatBoost, so
+    the two models are interchangeable there. Batches larger than
+    ``max_rows`` go to ``fallback`` (the CatBoost model) when one is set.
+    Probabilities match CatBoost's up to floating point summation order.
+    """
+
+    def __init__(
+        self,
+        *,
+        borders: t.List[np.ndarray],
+        bucket_bits: np.ndarray,
+        leaf_values: np.ndarray,
+        scale: float,
+        bias: float,
+        classes: np.ndarray,
+        fallback=None,
+        max_rows: int = LOOKUP_MAX_ROWS,
+    ):
+        self.fallback = fallback
+        self.max_rows = max_rows
+        self.borders = [np.asarray(feature_borders, dtype=np.float32) for feature_borders in borders]
+        self.bucket_bits = bucket_bits
+        self.leaf_values = leaf_values
+        self.scale = scale
+        self.bias = bias
+        self.classes_ = np.asarray(classes)
+
+        self._border_index = BorderIndex(self.borders)
+        sizes = np.array([len(feature_borders) for feature_borders in self.borders])
+        # First row of each feature in ``bucket_bits``; feature f has len(borders) + 1 buckets
+        self._row_offsets = np.concatenate([[0], np.cumsum(sizes + 1)[:-1]])
+        self._leaf_offsets = np.arange(leaf_values.shape[0]) * leaf_values.shape[1]
+        self._flat_leaf_values = leaf_values.ravel()
+
+    @classmethod
+    def from_catboost(
+        cls, model, *, fallback=None, max_rows: int = LOOKUP_MAX_ROWS
+    ) -> "LookupTableModel":
+        """Compile a fitted binary ``CatBoostClassifier`` with numeric features only."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = Path(tmp_dir) / "model.json"
+            model.save_model(str(model_path), format="json")
+            exported = json.loads(model_path.read_text())
+
+        float_features = exported["features_info"].get("float_features", [])
+        if set(exported["features_info"]) - {"float_features"}:
+            raise ValueError("Lookup tables only support numeric features")
+        borders = [np.asarray(feature.get("borders", []), dtype=np.float32) for feature in float_features]
+        trees = exported["oblivious_trees"]
+        depth = max(len(tree["splits"]) for tree in trees)
+        if depth > 8:
+            raise ValueError(f"Lookup tables support trees up to depth 8, got {depth}")
+
+        n_buckets = [len(feature_borders) + 1 for feature_borders in borders]
+        row_offsets = np.concatenate([[0], np.cumsum(n_buckets)[:-1]])
+        bucket_bits = np.zeros((sum(n_buckets), len(trees)), dtype=np.uint8)
+        leaf_values = np.zeros((len(trees), 1 << depth), dtype=np.float64)
+        for tree_index, tree in enumerate(trees):
+            values = tree["leaf_values"]
+            if len(values) != 1 << len(tree["splits"]):
+                raise ValueError("Lookup tables support single-dimension (binary) models only")
+            leaf_values[tree_index, :len(values)] = values
+            # CatBoost's first split sets the lowest bit of the leaf index
+            for level, split in enumerate(tree["splits"]):
+                if split["split_type"] != "FloatFeature":
+                    raise ValueError(f"Unsupported split type {split['split_type']}")
+                feature = split["float_feature_index"]
+                border_index = int(np.searchsorted(borders[feature], np.float32(split["border"])))
+                # value > borders[k] exactly when the value's bucket is above k
+                start = row_offsets[feature] + border_index + 1
+                stop = row_offsets[feature] + n_buckets[feature]
+                bucket_bits[start:stop, tree_index] += np.uint8(1 << level)
+
+        scale, bias = exported["scale_and_bias"]
+        return cls(
+            borders=borders,
+            bucket_bits=bucket_bits,
+            leaf_values=leaf_values,
+            scale=float(scale),
+            bias=float(bias[0]),
+            classes=model.classes_,
+            fallback=fallback,
+            max_rows=max_rows,
+        )
+
+    def get_borders(self) -> t.Dict[int, t.List[float]]:
+        """Borders per feature index, like ``CatBoost.get_borders``."""
+        return {index: feature_borders.tolist() for index, feature_borders in enumerate(self.borders)}
+
+    def buckets(self, X: np.ndarray) -> np.ndarray:
+        """Bucket of every value: how many of its feature's borders it exceeds."""
+        return self._border_index.bucket_codes(X)
+
+    def _raw_block(self, X: np.ndarray) -> np.ndarray:
+        rows = self.buckets(X) + self._row_offsets
+        # Leaf indices stay below 256 for trees up to depth 8
+        leaves = self.bucket_bits[rows].sum(axis=1, dtype=np.uint8)
+        return self._flat_leaf_values.take(self._leaf_offsets + leaves).sum(axis=1)
+
+    def raw_formula_val(self, X: np.ndarray) -> np.ndarray:
+        """Sum of leaf values over the trees, scaled and shifted like CatBoost."""
+        X = np.asarray(X, dtype=np.float64)
+        if len(X) <= LOOKUP_BLOCK_ROWS:
+            raw = self._raw_block(X)
+        else:
+            raw = np.concatenate([
+                self._raw_block(X[start:start + LOOKUP_BLOCK_ROWS])
+                for start in range(0, len(X), LOOKUP_BLOCK_ROWS)
+            ])
+        if self.scale != 1.0:
+            raw *= self.scale
+        if self.bias:
+            raw += self.bias
+        return raw
+
+    def predict(self, X: np.ndarray, prediction_type: str = "Probability", thread_count: int = -1):
+        """Class probabilities, or the raw formula value, for a transformed matrix."""
+        if self.fallback is not None and len(X) > self.max_rows:
+            return self.fallback.predict(X, prediction_type=prediction_type, thread_count=thread_count)
+        raw = self.raw_formula_val(X)
+        if prediction_type == "RawFormulaVal":
+            return raw
+        if prediction_type != "Probability":
+            raise ValueError(f"Unsupported prediction_type {prediction_type!r}")
+        proba = np.empty((len(raw), 2), dtype=np.float64)
+        np.negative(raw, out=raw)
+        np.exp(raw, out=raw)
+        raw += 1
+        np.divide(1, raw, out=proba[:, 1])
+        np.subtract(1, proba[:, 1], out=proba[:, 0])
+        return proba
+
+    def save(self, path: Path) -> None:
+        np.savez(
+            path,
+            border_values=np.concatenate(self.borders),
+            border_counts=np.array([len(feature_borders) for feature_borders in self.borders]),
+            bucket_bits=self.bucket_bits,
+            leaf_values=self.leaf_values,
+            scale_and_bias=np.array([self.scale, self.bias]),
+            classes=self.classes_,
+        )
+
+    @classmethod
+    def load(cls, path: Path, *, fallback=None, max_rows: int = LOOKUP_MAX_ROWS) -> "LookupTableModel":
+        with np.load(path) as saved:
+            border_values, border_counts = saved["border_values"], saved["border_counts"]
+            scale, bias = saved["scale_and_bias"]
+            return cls(
+                borders=np.split(border_values, np.cumsum(border_counts)[:-1]),
+                bucket_bits=saved["bucket_bits"],
+                leaf_values=saved["leaf_values"],
+                scale=float(scale),
+                bias=float(bias),
+                classes=saved["classes"],
+                fallback=fallback,
+                max_rows=max_rows,
+            )
@@ -0,0 +1,184 @@
+import bisect
+import threading
+import time
+import typing as t
+
+# Upper bounds of the stage latency buckets, in seconds
+LATENCY_BUCKETS = (
+    10e-6, 25e-6, 50e-6, 100e-6, 250e-6, 500e-6,
+    1e-3, 2.5e-3, 5e-3, 10e-3, 25e-3, 50e-3, 100e-3, 250e-3, 1.0,
+)
+
+# Upper bounds of the batch size buckets, in rows or requests
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384, 65536)
+
+STAGE_METRIC = "prediction_stage_seconds"
+
+# Off by default; every instrumented call site checks this first
+enabled = False
+
+_metrics = {}
+_help = {}
+_collectors = []
+_registry_lock = threading.Lock()
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    kind = "histogram"
+
+    def __init__(self, buckets: t.Sequence[float]):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self, name: str, labels: str) -> t.Iterator[str]:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative = 0
+        separator = "," if labels else ""
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            bound = "+Inf" if bound == float("inf") else repr(float(bound))
+            yield f'{name}_bucket{{{labels}{separator}le="{bound}"}} {cumulative}'
+        yield f"{name}_sum{_braced(labels)} {total!r}"
+        yield f"{name}_count{_braced(labels)} {cumulative}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def samples(self, name: str, labels: str) -> t.Iterator[str]:
+        yield f"{name}{_braced(labels)} {self._value}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+
+def _braced(labels: str) -> str:
+    return f"{{{labels}}}" if labels else ""
+
+
+def _get(factory: t.Callable[[], t.Any], name: str, help: str, labels: t.Dict[str, str]):
+    key = (name, tuple(sorted(labels.items())))
+    metric = _metrics.get(key)
+    if metric is None:
+        with _registry_lock:
+            metric = _metrics.setdefault(key, factory())
+            _help.setdefault(name, help)
+    return metric
+
+
+def histogram(name: str, *, help: str, buckets: t.Sequence[float] = LATENCY_BUCKETS, **labels) -> Histogram:
+    """The histogram for ``name`` and ``labels``, created on first use."""
+    return _get(lambda: Histogram(buckets), name, help, labels)
+
+
+def counter(name: str, *, help: str, **labels) -> Counter:
+    return _get(Counter, name, help, labels)
+
+
+def gauge(name: str, *, help: str, **labels) -> Gauge:
+    return _get(Gauge, name, help, labels)
+
+
+def register_collector(collect: t.Callable[[], t.Iterable[str]]) -> None:
+    """Add a callable that yields extra exposition lines at scrape time."""
+    with _registry_lock:
+        if collect not in _collectors:
+            _collectors.append(collect)
+
+
+class _StageTimer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._histogram.observe(time.perf_counter() - self._start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def stage(name: str):
+    """Context manager timing one prediction stage; a shared no-op when disabled."""
+    if not enabled:
+        return _NULL_TIMER
+    return _StageTimer(histogram(
+        STAGE_METRIC, help="Seconds spent in each stage of serving a prediction.", stage=name
+    ))
+
+
+def observe_size(name: str, value: int, *, help: str, **labels) -> None:
+    """Record a batch size (rows or requests) when metrics are enabled."""
+    if enabled:
+        histogram(name, help=help, buckets=SIZE_BUCKETS, **labels).observe(value)
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def reset() -> None:
+    """Drop every recorded metric and collector."""
+    with _registry_lock:
+        _metrics.clear()
+        _help.clear()
+        _collectors.clear()
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    with _registry_lock:
+        items = sorted(_metrics.items(), key=lambda item: item[0])
+        collectors = list(_collectors)
+    last_name = None
+    for (name, labels), metric in items:
+        if name != last_name:
+            lines.append(f"# HELP {name} {_help[name]}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            last_name = name
+        label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+        lines.extend(metric.samples(name, label_text))
+    for collect in collectors:
+        lines.extend(collect())
+    return "\n".join(lines) + "\n"
@@ -1,54 +1,122 @@
+import warnings
+
 import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from classification_model.processing.engine import MissingMediansError
+
+REQUIRED_FEATURES = ['DV_R', 'DA_R', 'AV_R', 'AA_R', 'PM_R']
+
+# Float64 like ArrayEngine: a StandardScaler after the validator keeps the
+# input dtype, and scaling in float32 would move values across split borders
+MATRIX_DTYPE = np.float64
+
+
 class DataValidator(BaseEstimator, TransformerMixin):
-   """Validates input data ranges and types."""
+   """Validates input data ranges and types.
 
-   def __init__(self, feature_ranges=None): 
+   Values are clipped to ``feature_ranges`` and missing values filled with
+   the medians of the clipped training data learned by ``fit``, so a row is
+   transformed the same way whatever batch it arrives in. Validators that
+   were never fitted (including ones pickled before ``fit`` learned
+   anything) raise on missing values rather than guess a fill.
+   """
+
+   def __init__(self, feature_ranges=None):
       self.feature_ranges = feature_ranges or {}
 
+   def _bounds(self, columns) -> tuple:
+      lower = np.array(
+         [float(self.feature_ranges[c]['min']) if c in self.feature_ranges else -np.inf for c in columns],
+         dtype=MATRIX_DTYPE,
+      )
+      upper = np.array(
+         [float(self.feature_ranges[c]['max']) if c in self.feature_ranges else np.inf for c in columns],
+         dtype=MATRIX_DTYPE,
+      )
+      return lower, upper
+
+   def _clip(self, X: pd.DataFrame) -> np.ndarray:
+      missing_features = set(REQUIRED_FEATURES) - set(X.columns)
+      if missing_features:
+         raise ValueError(f"Missing required features: {missing_features}")
+
+      columns = list(X.columns)
+      if columns == getattr(self, 'columns_', None):
+         lower, upper = self.lower_, self.upper_
+      else:
+         lower, upper = self._bounds(columns)
+      # Always a new matrix, so the caller's frame is never clipped in place
+      values = X.to_numpy(dtype=MATRIX_DTYPE, copy=True)
+      np.clip(values, lower, upper, out=values)
+      return values
+
    def fit(self, X, y=None):
+      values = self._clip(X)
+      self.columns_ = list(X.columns)
+      self.lower_, self.upper_ = self._bounds(self.columns_)
+      with warnings.catch_warnings():
+         # An all-missing column has no median; it stays missing
+         warnings.simplefilter('ignore', category=RuntimeWarning)
+         self.medians_ = np.nanmedian(values, axis=0)
       return self
-   
+
+   def medians_for(self, columns) -> np.ndarray:
+      """Fitted fill values of ``columns``, or None for an unfitted validator."""
+      medians = getattr(self, 'medians_', None)
+      if medians is None:
+         return None
+      fitted = dict(zip(self.columns_, medians))
+      return np.array([fitted.get(c, np.nan) for c in columns], dtype=MATRIX_DTYPE)
+
    def transform(self, X):
       """Validate and clean input data."""
-      X = X.copy()
+      values = self._clip(X)
 
-      # Check for required features
-      required_features = ['DV_R', 'DA_R', 'AV_R', 'AA_R', 'PM_R']
-      missing_features = set(required_features) - set(X.columns)
-      if missing_features: 
-         raise ValueError(f"Missing required features: {missing_features}")
-      
-      #Validate data ranges
-      for feature, ranges in self.feature_ranges.items(): 
-         if feature in X.columns: 
-            # Convert to numeric values in case they're strings
-            min_val = float(ranges['min'])
-            max_val = float(ranges['max'])
-            #Clip values to valid range
-            X[feature] = np.clip(X[feature], min_val, max_val)
-
-      X = X.fillna(X.median())
-
-      return X 
-   
-class FeatureEngineer(BaseEstimator, TransformerMixin): 
+      missing = np.isnan(values)
+      if missing.any():
+         columns = list(X.columns)
+         if columns == getattr(self, 'columns_', None):
+            medians = self.medians_
+         else:
+            medians = self.medians_for(columns)
+         if medians is None:
+            raise MissingMediansError()
+         rows, cols = np.nonzero(missing)
+         values[rows, cols] = medians[cols]
+
+      return pd.DataFrame(values, index=X.index, columns=X.columns, copy=False)
+
+class FeatureEngineer(BaseEstimator, TransformerMixin):
    """Creates additional features from existing ones."""
 
-   def fit(self, X, y=None): 
+   ENGINEERED_FEATURES = ['power_efficiency', 'wire_feed_ratio', 'voltage_current_ratio']
+
+   def fit(self, X, y=None):
       return self
-   
-   def transform(self, X): 
-      """Create engineered features."""
-      X = X.copy()
 
-      #Power efficiency ratio
-      X['power_efficiency'] = X['PM_R'] / (X['DV_R'] * X['DA_R'] / 1000)
+   def transform(self, X):
+      """Create engineered features in one matrix next to the inputs."""
+      columns = list(X.columns)
+      values = X.to_numpy(dtype=MATRIX_DTYPE)
+      n_inputs = values.shape[1]
+      # Column-major, so every column written below is contiguous and the
+      # frame wraps the matrix as its single block without copying
+      out = np.empty(
+         (len(values), n_inputs + len(self.ENGINEERED_FEATURES)), dtype=MATRIX_DTYPE, order='F'
+      )
+      out[:, :n_inputs] = values
+      dv, da, av, aa, pm = (values[:, columns.index(f)] for f in REQUIRED_FEATURES)
+
+      with np.errstate(divide='ignore', invalid='ignore'):
+         #Power efficiency ratio
+         np.multiply(dv, da, out=out[:, n_inputs])
+         out[:, n_inputs] /= 1000
+         np.divide(pm, out[:, n_inputs], out=out[:, n_inputs])
 
-      X['wire_feed_ratio'] = X['AV_R'] / X['AA_R']
+         np.divide(av, aa, out=out[:, n_inputs + 1])
 
-      X['voltage_current_ratio'] = X['DV_R'] / X['DA_R']
+         np.divide(dv, da, out=out[:, n_inputs + 2])
 
-      return X
\ No newline at end of file
+      return pd.DataFrame(out, index=X.index, columns=columns + self.ENGINEERED_FEATURES, copy=False)
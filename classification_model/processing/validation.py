@@ -51,6 +51,40 @@ def validate_inputs(*, input_data: pd.DataFrame) -> Tuple[pd.DataFrame, Optional
     return validated_data, errors
 
 
+def validate_array_inputs(*, input_data: np.ndarray) -> Tuple[np.ndarray, Optional[str]]:
+    """Check a raw feature matrix for unprocessable values.
+
+    Array counterpart of ``validate_inputs`` for matrices whose columns follow
+    ``config.ml_model_config.features``: rows with missing values are dropped
+    and out-of-range values are reported with the same messages.
+    """
+    features = config.ml_model_config.features
+    errors = None
+
+    try:
+        validated_data = np.asarray(input_data, dtype=np.float64)
+    except (TypeError, ValueError):
+        return input_data, "Features must be numeric"
+
+    if validated_data.ndim != 2 or validated_data.shape[1] != len(features):
+        return validated_data, f"Expected {len(features)} features: {features}"
+
+    missing = np.isnan(validated_data).any(axis=1)
+    if missing.any():
+        validated_data = validated_data[~missing]
+
+    for index, feature in enumerate(features):
+        ranges = config.ml_model_config.feature_ranges.get(feature)
+        if ranges is None:
+            continue
+        min_val, max_val = ranges['min'], ranges['max']
+        column = validated_data[:, index]
+        if ((column < min_val) | (column > max_val)).any():
+            errors = f"Feature {feature} has values outside expected range [{min_val}, {max_val}]"
+
+    return validated_data, errors
+
+
 class WeldingDataInputSchema(BaseModel):
     """Schema for validating welding data inputs."""
     DV_R: Optional[float]
@@ -5,50 +5,489 @@ from pathlib import Path
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
 sys.path.append(str(PACKAGE_ROOT))
 
+import argparse
+import tempfile
+import time
+import typing as t
+
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from catboost import CatBoostClassifier, Pool
+from sklearn.base import clone
 from sklearn.metrics import classification_report, roc_auc_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
 
 from classification_model import __version__ as _version
 from classification_model.config.core import config
-from classification_model.processing.data_manager import load_dataset, save_pipeline
-from classification_model.pipeline import classification_pipe
+from classification_model.processing.data_manager import (
+    QUANTIZATION_PARAMS,
+    SPLIT_EVAL,
+    SPLIT_TRAIN,
+    available_model_versions,
+    build_quantized_pools,
+    build_streamed_pools,
+    columnar_train_test_split,
+    iter_streaming_split,
+    load_dataset_cached,
+    load_pipeline,
+    load_quantized_pools,
+    model_file_names,
+    next_model_version,
+    quantized_pool_path,
+    resave_pipeline,
+    save_pipeline,
+)
+from classification_model.processing.engine import PipelineEngine
+from classification_model.processing.lookup import LookupTableModel
+from classification_model.pipeline import (
+    check_pipeline_parity,
+    classification_pipe,
+    fold_scaler,
+)
+
+# Largest probability difference tolerated when folding the scaler
+FOLD_PARITY_TOLERANCE = 1e-9
+
+# Largest probability difference tolerated between lookup tables and CatBoost
+LOOKUP_PARITY_TOLERANCE = 1e-9
+
+# Resident memory of a training process before it holds any data: the
+# interpreter, NumPy, pandas, sklearn and CatBoost (about 220 MiB) plus
+# headroom for one chunk and CatBoost's fixed buffers, in MiB
+OUT_OF_CORE_BASE_MB = 400
+
+# CatBoost's training state per pool row: quantized features, approxes,
+# derivatives and permutations, measured at about 200 bytes per row
+OUT_OF_CORE_BYTES_PER_ROW = 256
+
+# Raw eval rows kept for the lookup table parity check
+OUT_OF_CORE_PARITY_ROWS = 10_000
+
+
+class TrainingData(t.NamedTuple):
+    """Fitted preprocessing steps and the quantized pools built from them."""
+    preprocessor: Pipeline
+    train_pool: Pool
+    eval_pool: Pool
+    pool_path: Path
+    X_train: pd.DataFrame
+    X_test: pd.DataFrame
+    y_test: pd.Series
+    class_names: t.List[int]
+
+
+def prepare_training_data() -> TrainingData:
+    """Split the dataset, fit the preprocessing and load the quantized pools.
+
+    Quantizing hundreds of thousands of rows dominates the set-up cost of a
+    fit, so the pools are quantized once with the configured
+    ``border_count`` and reused from disk by later runs and trials.
+    """
+    # Memory-map the columnar cache of the dataset (built from the CSV on
+    # first use; PIPE_NO is just an identifier and is never parsed)
+    dataset = load_dataset_cached(file_name=config.app_config.training_data_file)
+    X_train, X_test, y_train, y_test = columnar_train_test_split(dataset=dataset)
+
+    # Every step before the classifier, fitted on the training split
+    preprocessor = Pipeline(clone(classification_pipe).steps[:-1]).fit(X_train, y_train)
+
+    catboost_params = config.ml_model_config.catboost_params
+    quantization = {
+        name: catboost_params[name] for name in QUANTIZATION_PARAMS if name in catboost_params
+    }
+    pool_path = quantized_pool_path(dataset=dataset, quantization=quantization)
+    pools = load_quantized_pools(path=pool_path)
+    if pools is None:
+        pools = build_quantized_pools(
+            path=pool_path,
+            X_train=preprocessor.transform(X_train),
+            y_train=y_train.to_numpy(),
+            X_eval=preprocessor.transform(X_test),
+            y_eval=y_test.to_numpy(),
+            quantization=quantization,
+        )
+
+    return TrainingData(
+        preprocessor=preprocessor,
+        train_pool=pools[0],
+        eval_pool=pools[1],
+        pool_path=pool_path,
+        X_train=X_train,
+        X_test=X_test,
+        y_test=y_test,
+        class_names=np.unique(y_train).tolist(),
+    )
+
+
+class OutOfCoreData(t.NamedTuple):
+    """Fitted preprocessing and pools streamed from a dataset larger than memory."""
+    preprocessor: Pipeline
+    train_pool: Pool
+    eval_pool: Pool
+    pool_path: Path
+    # Raw eval rows for the lookup table parity check
+    X_sample: pd.DataFrame
+    class_names: t.List[int]
+    dataset_rows: int
+    max_rows: int
+
+
+def out_of_core_max_rows(*, ram_budget_mb: int) -> int:
+    """Pool rows whose training state fits in ``ram_budget_mb``."""
+    return max(0, (ram_budget_mb - OUT_OF_CORE_BASE_MB) * 2**20 // OUT_OF_CORE_BYTES_PER_ROW)
+
+
+def prepare_out_of_core_data() -> OutOfCoreData:
+    """Stream the dataset into quantized pools without loading it into memory.
+
+    The CSV is converted chunk by chunk into the columnar cache, which is
+    then read back in ``out_of_core_config.chunk_rows`` chunks: once to
+    fit the data validator on an evenly spaced sample of the training
+    rows, and once to write the preprocessed rows for
+    ``catboost.utils.quantize``. The stratified split is drawn as the
+    chunks stream past (``iter_streaming_split``). Should the training state
+    of every row exceed ``ram_budget_mb``, both splits are sampled down
+    by class to the rows that fit. No scaler is fitted, as trees do not
+    need one.
+    """
+    settings = config.out_of_core_config
+    dataset = load_dataset_cached(
+        file_name=config.app_config.training_data_file, chunksize=settings.chunk_rows
+    )
+    max_rows = out_of_core_max_rows(ram_budget_mb=settings.ram_budget_mb)
+    if max_rows == 0:
+        raise ValueError(
+            f"ram_budget_mb must exceed {OUT_OF_CORE_BASE_MB} MiB for out-of-core training"
+        )
+    dataset_rows = len(dataset.y)
+    if dataset_rows > max_rows:
+        print(
+            f"{dataset_rows:,} rows exceed the {settings.ram_budget_mb} MiB budget; "
+            f"training on a stratified sample of {max_rows:,} rows"
+        )
+
+    def stream_split():
+        return iter_streaming_split(
+            dataset=dataset,
+            test_size=config.ml_model_config.test_size,
+            random_state=config.ml_model_config.random_state,
+            max_rows=max_rows,
+            chunksize=settings.chunk_rows,
+        )
+
+    step = max(1, dataset_rows // settings.validator_sample_rows)
+    train_sample, eval_sample, n_eval_sample, labels = [], [], 0, set()
+    for X, y, split in stream_split():
+        train_sample.append(X[split == SPLIT_TRAIN][::step])
+        labels.update(np.unique(y[split == SPLIT_TRAIN]).tolist())
+        if n_eval_sample < OUT_OF_CORE_PARITY_ROWS:
+            eval_sample.append(X[split == SPLIT_EVAL][:OUT_OF_CORE_PARITY_ROWS - n_eval_sample])
+            n_eval_sample += len(eval_sample[-1])
+    features = dataset.features
+    preprocessor = Pipeline([
+        (name, clone(step)) for name, step in classification_pipe.steps[:-1] if name != "scaler"
+    ]).fit(pd.DataFrame(np.concatenate(train_sample), columns=features))
+    del train_sample
+
+    catboost_params = config.ml_model_config.catboost_params
+    quantization = {
+        name: catboost_params[name] for name in QUANTIZATION_PARAMS if name in catboost_params
+    }
+    pool_path = quantized_pool_path(
+        dataset=dataset,
+        quantization=quantization,
+        split={"streaming": True, "max_rows": max_rows, "chunk_rows": settings.chunk_rows},
+    )
+    pools = load_quantized_pools(path=pool_path)
+    if pools is None:
+        pools = build_streamed_pools(
+            path=pool_path,
+            chunks=(
+                (preprocessor.transform(pd.DataFrame(X, columns=features, copy=False)), y, split)
+                for X, y, split in stream_split()
+            ),
+            quantization=quantization,
+        )
+
+    return OutOfCoreData(
+        preprocessor=preprocessor,
+        train_pool=pools[0],
+        eval_pool=pools[1],
+        pool_path=pool_path,
+        X_sample=pd.DataFrame(np.concatenate(eval_sample), columns=features),
+        class_names=sorted(labels),
+        dataset_rows=dataset_rows,
+        max_rows=max_rows,
+    )
+
+
+def fit_classifier(
+    *, train_pool: Pool, eval_pool: Pool, class_names: t.List[int], **params
+) -> CatBoostClassifier:
+    """Fit the configured classifier on the quantized pools.
+
+    The test split is passed as ``eval_set`` so ``early_stopping_rounds``
+    takes effect; ``params`` override ``catboost_params``.
+    """
+    classifier = clone(classification_pipe.named_steps["classifier"])
+    # Labels read back from a quantized pool are floats; keep integer classes
+    classifier.set_params(class_names=class_names, **params)
+    classifier.fit(train_pool, eval_set=eval_pool)
+    return classifier
+
+
+def _preprocess(pipeline: Pipeline, X: pd.DataFrame) -> np.ndarray:
+    """Apply every step before the classifier, one by one.
+
+    A folded pipeline may keep only an unfitted validator, which sklearn's
+    fitted check on ``Pipeline.transform`` rejects.
+    """
+    for _, step in pipeline.steps[:-1]:
+        X = step.transform(X)
+    return np.asarray(X, dtype=np.float64)
+
+
+def compile_lookup_model(*, pipeline: Pipeline, X: pd.DataFrame) -> t.Optional[LookupTableModel]:
+    """Compile the classifier into lookup tables and check them against CatBoost.
+
+    Returns None, so no tables are saved, if the classifier cannot be
+    compiled or its probabilities on ``X`` differ by more than
+    ``LOOKUP_PARITY_TOLERANCE``.
+    """
+    classifier = pipeline.steps[-1][1]
+    try:
+        lookup_model = LookupTableModel.from_catboost(classifier)
+    except ValueError as error:
+        print(f"Lookup tables not built: {error}")
+        return None
+
+    X_model = _preprocess(pipeline, X)
+    max_abs_diff = float(np.abs(
+        lookup_model.predict(X_model) - classifier.predict_proba(X_model)
+    ).max())
+    print(f"Lookup table parity on test data: max_abs_diff={max_abs_diff:.3g}")
+    if max_abs_diff > LOOKUP_PARITY_TOLERANCE:
+        print("Parity check failed, lookup tables not saved.")
+        return None
+    return lookup_model
+
+
+def finish_training(*, data: TrainingData, classifier: CatBoostClassifier) -> Pipeline:
+    """Report on the test split, fold the scaler, compile lookup tables and save.
+
+    Returns the pipeline that was saved.
+    """
+    trained_pipe = Pipeline(data.preprocessor.steps + [("classifier", classifier)])
+
+    engine = PipelineEngine(trained_pipe, threshold=config.ml_model_config.decision_threshold)
+    y_pred, y_pred_proba = engine.predict(data.X_test)
+
+    print(classification_report(data.y_test, y_pred))
+    print(f"ROC AUC Score: {roc_auc_score(data.y_test, y_pred_proba[:, 1]):.4f}")
+    print(f"Trees: {classifier.tree_count_} (best iteration {classifier.get_best_iteration()})")
+
+    # The scaler is redundant for trees: fold it into the split borders
+    folded_pipe = fold_scaler(trained_pipe)
+    parity = check_pipeline_parity(
+        reference=trained_pipe, candidate=folded_pipe, X=data.X_train
+    )
+    print(f"Scaler folding parity on training data: {parity}")
+    if parity["label_mismatches"] == 0 and parity["max_abs_diff"] <= FOLD_PARITY_TOLERANCE:
+        pipeline_to_persist = folded_pipe
+    else:
+        print("Parity check failed, keeping the StandardScaler stage.")
+        pipeline_to_persist = trained_pipe
+
+    lookup_model = compile_lookup_model(pipeline=pipeline_to_persist, X=data.X_test)
+    save_pipeline(pipeline_to_persist=pipeline_to_persist, lookup_model=lookup_model)
+    print(f"Model trained and saved successfully. Version: {_version}")
+    return pipeline_to_persist
+
 
 def run_training() -> None:
     """Train the model."""
 
-    #Read the dataset
-    data = load_dataset(file_name=config.app_config.training_data_file)
+    data = prepare_training_data()
+    classifier = fit_classifier(
+        train_pool=data.train_pool, eval_pool=data.eval_pool, class_names=data.class_names
+    )
+    finish_training(data=data, classifier=classifier)
+
 
-    # Remove PIPE_NO as it's just an identifier 
-    if "PIPE_NO" in data.columns:
-        data = data.drop(columns=["PIPE_NO"], axis=1)
+def run_out_of_core_training() -> None:
+    """Train the model on a dataset larger than memory.
 
-    # Split data into train and test
-    X_train, X_test, y_train, y_test = train_test_split(
-        data[config.ml_model_config.features],
-        data[config.ml_model_config.target],
-        test_size=config.ml_model_config.test_size,
-        random_state=config.ml_model_config.random_state, 
-        stratify=data[config.ml_model_config.target]
+    Like ``run_training``, but the pools are streamed from disk
+    (``prepare_out_of_core_data``) and the model is evaluated on the
+    quantized eval pool rather than on a test frame held in memory.
+    """
+    data = prepare_out_of_core_data()
+    classifier = fit_classifier(
+        train_pool=data.train_pool, eval_pool=data.eval_pool, class_names=data.class_names
     )
 
-    
-    classification_pipe.fit(X_train, y_train)
+    y_eval = np.asarray(data.eval_pool.get_label(), dtype=np.float64).astype(np.int64)
+    proba = classifier.predict_proba(data.eval_pool)[:, 1]
+    y_pred = classifier.classes_[(proba > config.ml_model_config.decision_threshold).astype(np.intp)]
+    print(classification_report(y_eval, y_pred))
+    print(f"ROC AUC Score: {roc_auc_score(y_eval, proba):.4f}")
+    print(f"Trees: {classifier.tree_count_} (best iteration {classifier.get_best_iteration()})")
 
-    
-    y_pred = classification_pipe.predict(X_test)
-    y_pred_proba = classification_pipe.predict_proba(X_test)[:, 1]
+    pipeline = Pipeline(data.preprocessor.steps + [("classifier", classifier)])
+    lookup_model = compile_lookup_model(pipeline=pipeline, X=data.X_sample)
+    save_pipeline(pipeline_to_persist=pipeline, lookup_model=lookup_model)
+    print(f"Model trained out of core and saved successfully. Version: {_version}")
 
-    
-    print(classification_report(y_test, y_pred))
-    print(f"ROC AUC Score: {roc_auc_score(y_test, y_pred_proba):.4f}")
 
+def fit_validator_medians(*, version: str = _version) -> np.ndarray:
+    """Learn the fill medians of a model saved before the validator had them.
+
+    Only the ``data_validator`` step is refitted, on the training split of
+    the configured training data as in ``run_training``; the scaler and
+    classifier are kept as saved. The pickle and the artifact sidecar are
+    rewritten in place. Returns the medians in feature order.
+    """
+    pipeline = load_pipeline(file_name=model_file_names(version)[0])
+    dataset = load_dataset_cached(file_name=config.app_config.training_data_file)
+    X_train = columnar_train_test_split(dataset=dataset)[0]
+    validator = pipeline.named_steps["data_validator"].fit(X_train)
+    resave_pipeline(pipeline=pipeline, version=version)
+    medians = validator.medians_for(config.ml_model_config.features)
+    print(f"Validator medians of version {version} saved: {medians.tolist()}")
+    return medians
+
+
+class IncrementalUpdate(t.NamedTuple):
+    """Outcome of one incremental training run."""
+    base_version: str
+    # The saved version, or None when the update was rejected
+    version: t.Optional[str]
+    rows: int
+    trees_added: int
+    base_auc: float
+    updated_auc: float
+    seconds: float
+
+
+def _quantized_pool(X: np.ndarray, y: np.ndarray, *, borders_path: Path) -> Pool:
+    pool = Pool(np.ascontiguousarray(X, dtype=np.float32), label=y)
+    pool.quantize(input_borders=str(borders_path))
+    return pool
+
+
+def run_incremental_training(
+    *, file_name: str, base_version: str = None, version: str = None
+) -> IncrementalUpdate:
+    """Continue boosting a saved model on a batch of new rows.
+
+    The base version (by default the newest saved one) keeps its fitted
+    preprocessing and its quantization borders; the new rows are quantized
+    on those borders and CatBoost appends at most
+    ``incremental_config.max_new_trees`` trees to the existing ones through
+    ``init_model``, early-stopped on a holdout of the batch. Only the new
+    batch is loaded and quantized, so an update costs time in proportion
+    to its rows rather than to the full history.
+
+    The update is saved as ``version`` (by default the next patch version)
+    unless its holdout ROC AUC falls more than
+    ``incremental_config.max_auc_drop`` below the base model's.
+    """
+    start = time.perf_counter()
+    settings = config.incremental_config
+    if base_version is None:
+        saved_versions = available_model_versions()
+        if not saved_versions:
+            raise FileNotFoundError("No saved model to continue training from")
+        base_version = saved_versions[-1]
+    base_pipe = load_pipeline(file_name=model_file_names(base_version)[0])
+    base_classifier = base_pipe.steps[-1][1]
+
+    dataset = load_dataset_cached(file_name=file_name)
+    X, y = np.asarray(dataset.X), np.asarray(dataset.y)
+    train_index, holdout_index = train_test_split(
+        np.arange(len(y)),
+        test_size=settings.holdout_size,
+        random_state=config.ml_model_config.random_state,
+        stratify=y,
+    )
+    X = _preprocess(base_pipe, pd.DataFrame(X, columns=dataset.features, copy=False))
+    X_holdout, y_holdout = X[holdout_index], y[holdout_index]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        borders_path = Path(tmp_dir) / "borders.tsv"
+        base_classifier.save_borders(str(borders_path))
+        train_pool = _quantized_pool(X[train_index], y[train_index], borders_path=borders_path)
+        holdout_pool = _quantized_pool(X_holdout, y_holdout, borders_path=borders_path)
+
+        classifier = CatBoostClassifier(**{
+            **base_classifier.get_params(),
+            "iterations": settings.max_new_trees,
+            "learning_rate": settings.learning_rate,
+            # Labels read back from a quantized pool are floats; keep the base classes
+            "class_names": base_classifier.classes_.tolist(),
+        })
+        classifier.fit(train_pool, eval_set=holdout_pool, init_model=base_classifier)
+
+    base_auc = roc_auc_score(y_holdout, base_classifier.predict_proba(X_holdout)[:, 1])
+    updated_auc = roc_auc_score(y_holdout, classifier.predict_proba(X_holdout)[:, 1])
+    trees_added = classifier.tree_count_ - base_classifier.tree_count_
+    print(
+        f"Added {trees_added} trees to {base_version} on {len(train_index):,} new rows; "
+        f"holdout ROC AUC {base_auc:.4f} -> {updated_auc:.4f}"
+    )
+
+    saved_version = None
+    if updated_auc < base_auc - settings.max_auc_drop:
+        print("Update rejected: holdout ROC AUC dropped below the base model's.")
+    else:
+        saved_version = version or next_model_version(base_version)
+        updated_pipe = Pipeline(base_pipe.steps[:-1] + [("classifier", classifier)])
+        holdout_frame = pd.DataFrame(
+            np.asarray(dataset.X)[holdout_index], columns=dataset.features, copy=False
+        )
+        lookup_model = compile_lookup_model(pipeline=updated_pipe, X=holdout_frame)
+        save_pipeline(pipeline_to_persist=updated_pipe, version=saved_version, lookup_model=lookup_model)
+        print(f"Model updated and saved as version {saved_version}.")
+
+    return IncrementalUpdate(
+        base_version=base_version,
+        version=saved_version,
+        rows=len(y),
+        trees_added=trees_added,
+        base_auc=base_auc,
+        updated_auc=updated_auc,
+        seconds=time.perf_counter() - start,
+    )
 
-    
-    save_pipeline(pipeline_to_persist=classification_pipe) 
-    print(f"Model trained and saved successfully. Version: {_version}")
 
 if __name__ == "__main__":
-    run_training()
-        
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Train the model, or update a saved one.")
+    parser.add_argument(
+        "--update", metavar="FILE",
+        help="Continue training the newest saved model on the new rows in FILE.",
+    )
+    parser.add_argument("--base-version", help="Model version to continue from (with --update).")
+    parser.add_argument(
+        "--version",
+        help="Version to save the update as (with --update), or to refit (with --fit-medians).",
+    )
+    parser.add_argument(
+        "--out-of-core", action="store_true",
+        help="Stream the training data from disk within out_of_core_config.ram_budget_mb.",
+    )
+    parser.add_argument(
+        "--fit-medians", action="store_true",
+        help="Fit and save the validator fill medians of a model saved without them.",
+    )
+    args = parser.parse_args()
+    if args.fit_medians:
+        fit_validator_medians(version=args.version or _version)
+    elif args.out_of_core:
+        run_out_of_core_training()
+    elif args.update:
+        run_incremental_training(
+            file_name=args.update, base_version=args.base_version, version=args.version
+        )
+    else:
+        run_training()
@@ -0,0 +1,244 @@
+import sys
+from pathlib import Path
+
+# Add the package root to Python path
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PACKAGE_ROOT))
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+
+from classification_model.config.core import TUNING_DIR, config, fetch_config_from_yaml
+from classification_model.pipeline import classification_pipe
+from classification_model.processing.data_manager import (
+    QUANTIZATION_PARAMS,
+    build_quantized_pools,
+    columnar_train_test_split,
+    load_dataset_cached,
+    load_quantized_pools,
+    quantized_pool_path,
+)
+from classification_model.processing.resources import available_cpus
+from classification_model.train_pipeline import fit_classifier
+
+# Eval metrics where a larger value is better; others are minimised
+HIGHER_IS_BETTER = {"AUC", "PRAUC", "Accuracy", "BalancedAccuracy", "F1", "MCC", "Precision", "Recall"}
+
+# Quantized pools, loaded once per worker process by the pool initializer
+_worker_pools = None
+
+
+def sample_candidates(
+    *, search_space: t.Dict[str, t.List], strategy: str, n_trials: int, random_state: int
+) -> t.List[t.Dict]:
+    """Parameter sets to try: the full grid, or ``n_trials`` distinct samples of it."""
+    names = sorted(search_space)
+    grid = [
+        dict(zip(names, values))
+        for values in itertools.product(*(search_space[name] for name in names))
+    ]
+    if strategy == "grid":
+        return grid
+    rng = np.random.default_rng(random_state)
+    picks = rng.choice(len(grid), size=min(n_trials, len(grid)), replace=False)
+    return [grid[index] for index in picks]
+
+
+def prepare_tuning_pools(*, quantization: t.Dict) -> t.Tuple[Path, t.List[int]]:
+    """Quantized pools of a validation split carved from the training rows.
+
+    Candidates are fitted on the rest of the training split and early-stop
+    and are scored on the validation split (``test_size`` of the training
+    rows), so the test split that ``run_training`` reports on plays no part
+    in the search. The preprocessing and the borders are fitted on the
+    fitting rows, and the pools are cached next to the dataset cache.
+    Returns the pool directory and the class names.
+    """
+    model_config = config.ml_model_config
+    dataset = load_dataset_cached(file_name=config.app_config.training_data_file)
+    X_train, _, y_train, _ = columnar_train_test_split(dataset=dataset)
+    y_train = y_train.to_numpy()
+    fit_index, validation_index = train_test_split(
+        np.arange(len(y_train)),
+        test_size=model_config.test_size,
+        random_state=model_config.random_state,
+        stratify=y_train,
+    )
+    pool_path = quantized_pool_path(
+        dataset=dataset, quantization=quantization, split={"tuning": "validation_of_train"}
+    )
+    if load_quantized_pools(path=pool_path) is None:
+        X_fit, X_validation = X_train.iloc[fit_index], X_train.iloc[validation_index]
+        preprocessor = Pipeline(clone(classification_pipe).steps[:-1]).fit(X_fit, y_train[fit_index])
+        build_quantized_pools(
+            path=pool_path,
+            X_train=preprocessor.transform(X_fit),
+            y_train=y_train[fit_index],
+            X_eval=preprocessor.transform(X_validation),
+            y_eval=y_train[validation_index],
+            quantization=quantization,
+        )
+    return pool_path, np.unique(y_train).tolist()
+
+
+def _init_worker(pool_path: str, class_names: t.List[int]) -> None:
+    """Load the shared quantized pools from disk instead of receiving them pickled."""
+    global _worker_pools
+    train_pool, eval_pool = load_quantized_pools(path=Path(pool_path))
+    _worker_pools = (train_pool, eval_pool, class_names)
+
+
+def _run_trial(trial: t.Dict) -> t.Dict:
+    """Fit one candidate in a worker and score it on the validation pool."""
+    train_pool, eval_pool, class_names = _worker_pools
+    start = time.perf_counter()
+    classifier = fit_classifier(
+        train_pool=train_pool,
+        eval_pool=eval_pool,
+        class_names=class_names,
+        allow_writing_files=False,
+        **trial["params"],
+    )
+    eval_metric = trial["params"]["eval_metric"]
+    return {
+        **trial,
+        "score": classifier.get_best_score()["validation"][eval_metric],
+        "trees": classifier.tree_count_,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def _ranked(results: t.List[t.Dict], *, eval_metric: str) -> t.List[t.Dict]:
+    reverse = eval_metric in HIGHER_IS_BETTER
+    return sorted(results, key=lambda result: result["score"], reverse=reverse)
+
+
+def write_candidate_config(*, params: t.Dict, path: Path) -> None:
+    """Write config.yml with the tuned ``catboost_params`` as a candidate file.
+
+    The update goes through the strictyaml document, so the candidate is
+    validated against the same schema and keeps the original comments.
+    """
+    parsed_config = fetch_config_from_yaml()
+    for name, value in params.items():
+        parsed_config["model_config"]["catboost_params"][name] = value
+    path.write_text(parsed_config.as_yaml())
+
+
+def run_tuning(
+    *,
+    strategy: str = None,
+    n_trials: int = None,
+    n_workers: int = None,
+) -> t.List[t.Dict]:
+    """Search ``tuning_config.search_space`` across a pool of worker processes.
+
+    Every trial trains on the same quantized pools from
+    ``prepare_tuning_pools``, which workers load from disk once when they
+    start; the test split is left for reporting the retrained model. CPUs are split evenly between the workers
+    and each trial gets its share as ``thread_count``, so concurrent trials
+    do not oversubscribe the machine the way ``thread_count: -1`` would.
+    ``halving`` runs successive halving: all candidates start with
+    ``min_iterations`` and the best ``1 / halving_factor`` move on with
+    ``halving_factor`` times the iterations, up to ``catboost_params``.
+
+    The leaderboard goes to ``TUNING_DIR/leaderboard.json`` and the best
+    parameters to ``TUNING_DIR/config_candidate.yml``.
+    """
+    tuning = config.tuning_config
+    strategy = strategy or tuning.strategy
+    base_params = dict(config.ml_model_config.catboost_params)
+    eval_metric = base_params["eval_metric"]
+    fixed = set(tuning.search_space) & set(QUANTIZATION_PARAMS)
+    if fixed:
+        raise ValueError(f"Quantization parameters cannot be tuned on shared pools: {fixed}")
+
+    candidates = sample_candidates(
+        search_space=tuning.search_space,
+        strategy=strategy,
+        n_trials=n_trials or tuning.n_trials,
+        random_state=config.ml_model_config.random_state,
+    )
+    max_iterations = base_params["iterations"]
+    iterations = min(tuning.min_iterations, max_iterations) if strategy == "halving" else max_iterations
+
+    cpus = available_cpus()
+    n_workers = max(1, min(n_workers or tuning.n_workers, cpus, len(candidates)))
+    thread_budget = max(1, cpus // n_workers)
+
+    pool_path, class_names = prepare_tuning_pools(
+        quantization={name: base_params[name] for name in QUANTIZATION_PARAMS if name in base_params}
+    )
+    leaderboard = []
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(str(pool_path), class_names),
+    ) as executor:
+        rung = 0
+        while True:
+            trials = [
+                {
+                    "rung": rung,
+                    "candidate": candidate,
+                    "params": {
+                        **base_params,
+                        **candidate,
+                        "iterations": iterations,
+                        "thread_count": thread_budget,
+                    },
+                }
+                for candidate in candidates
+            ]
+            results = _ranked(list(executor.map(_run_trial, trials)), eval_metric=eval_metric)
+            leaderboard.extend(results)
+            print(
+                f"Rung {rung}: {len(results)} trials x {iterations} iterations, "
+                f"best {eval_metric} {results[0]['score']:.5f} with {results[0]['candidate']}"
+            )
+            if strategy != "halving" or len(candidates) <= 1 or iterations >= max_iterations:
+                break
+            survivors = max(1, len(candidates) // tuning.halving_factor)
+            candidates = [result["candidate"] for result in results[:survivors]]
+            iterations = min(iterations * tuning.halving_factor, max_iterations)
+            rung += 1
+
+    # Later rungs had the larger budget, so they rank first
+    leaderboard = sorted(
+        _ranked(leaderboard, eval_metric=eval_metric),
+        key=lambda result: result["rung"],
+        reverse=True,
+    )
+    TUNING_DIR.mkdir(parents=True, exist_ok=True)
+    (TUNING_DIR / "leaderboard.json").write_text(json.dumps({
+        "strategy": strategy,
+        "eval_metric": eval_metric,
+        "workers": n_workers,
+        "threads_per_trial": thread_budget,
+        "trials": leaderboard,
+    }, indent=2))
+    write_candidate_config(
+        params=leaderboard[0]["candidate"], path=TUNING_DIR / "config_candidate.yml"
+    )
+    print(f"Best parameters: {leaderboard[0]['candidate']} ({eval_metric} {leaderboard[0]['score']:.5f})")
+    return leaderboard
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hyperparameter search over tuning_config.")
+    parser.add_argument("--strategy", choices=["grid", "random", "halving"])
+    parser.add_argument("--n-trials", type=int)
+    parser.add_argument("--n-workers", type=int)
+    args = parser.parse_args()
+    run_tuning(strategy=args.strategy, n_trials=args.n_trials, n_workers=args.n_workers)
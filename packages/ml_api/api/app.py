@@ -1,18 +1,55 @@
 from flask import Flask
 
+from catboost_ml.packages.ml_api.api.batching import MicroBatcher
 from catboost_ml.packages.ml_api.api.config import get_logger 
-from catboost_ml.packages.ml_api.api.controller import prediction_app
+from catboost_ml.packages.ml_api.api.controller import (
+    cache_metric_lines,
+    metrics,
+    prediction_app,
+)
+# After the controller, which puts the repository root on sys.path
+from classification_model.predict import enable_prediction_cache, make_batch_prediction, warm_up
 
 _logger = get_logger(logger_name=__name__)  
 
+
+def _score_batch(inputs):
+    metrics.observe_size(
+        "prediction_microbatch_requests", len(inputs), help="Requests coalesced per micro-batch."
+    )
+    return make_batch_prediction(inputs=inputs, as_numpy=True)
+
+
 def create_app(*, config_object) -> Flask:
     """Create a flask app instance."""
 
     flask_app = Flask(__name__)
     flask_app.config.from_object(config_object)
 
+    if flask_app.config.get("METRICS_ENABLED"):
+        metrics.enable()
+        metrics.register_collector(cache_metric_lines)
+
+    if flask_app.config.get("PREDICTION_CACHE"):
+        enable_prediction_cache(
+            max_size=flask_app.config["PREDICTION_CACHE_SIZE"],
+            ttl_seconds=flask_app.config["PREDICTION_CACHE_TTL_S"],
+            key=flask_app.config["PREDICTION_CACHE_KEY"],
+        )
+
+    if flask_app.config.get("PREDICTION_BATCHING"):
+        flask_app.extensions["prediction_batcher"] = MicroBatcher(
+            _score_batch,
+            max_batch_size=flask_app.config["PREDICTION_MAX_BATCH_SIZE"],
+            max_wait_us=flask_app.config["PREDICTION_MAX_WAIT_US"],
+            timeout_s=flask_app.config["PREDICTION_BATCH_TIMEOUT_S"],
+        )
+
     #Register blueprints
     flask_app.register_blueprint(prediction_app)
     _logger.debug("Application instance created")
 
+    if flask_app.config.get("MODEL_WARM_UP"):
+        warm_up(background=True)
+
     return flask_app
@@ -0,0 +1,288 @@
+import asyncio
+import os
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from catboost_ml.packages.ml_api.api import serialization
+from catboost_ml.packages.ml_api.api.config import get_logger
+from catboost_ml.packages.ml_api.api.controller import (
+    METRICS_MIMETYPE,
+    VERSION_HEADER,
+    ModelNotFoundError,
+    activate_model,
+    activation_denied,
+    api_version,
+    cache_metric_lines,
+    cache_stats,
+    count_request,
+    in_flight_gauge,
+    is_model_loaded,
+    make_prediction,
+    metrics,
+    model_version,
+    models_status,
+    registry,
+    requested_version,
+)
+from catboost_ml.packages.ml_api.api.validation import validate_inputs
+# After the controller, which puts the repository root on sys.path
+from classification_model.predict import enable_prediction_cache, warm_up
+
+_logger = get_logger(logger_name=__name__)
+
+Response = t.Tuple[int, bytes, bytes]
+
+# Paths served by ``PredictionApp._route``; requests to any other path are
+# counted under "other" so scanners cannot grow the metric label set
+ROUTES = frozenset({
+    "/health",
+    "/ready",
+    "/version",
+    "/v1/predict/classification",
+    "/v1/models",
+    "/v1/models/active",
+    "/v1/cache",
+})
+
+
+class ClientDisconnected(Exception):
+    """The client went away before sending the whole request body."""
+
+
+def _json_response(status: int, payload: dict) -> Response:
+    with metrics.stage("serialize"):
+        body = serialization.dumps(payload)
+    return status, body, serialization.JSON_MIMETYPE.encode()
+
+
+def _error_response(status: int, errors: str) -> Response:
+    return _json_response(status, {"predictions": None, "version": model_version, "errors": errors})
+
+
+def _predict(body: bytes, header_version: t.Optional[str]) -> Response:
+    """Parse, validate and score one request; runs on the inference pool."""
+    try:
+        with metrics.stage("parse"):
+            json_data = serialization.loads(body)
+    except ValueError:
+        return _error_response(400, "Request body is not valid JSON")
+
+    json_data, requested, errors = requested_version(json_data, header_version)
+    if not errors:
+        with metrics.stage("validate_inputs"):
+            input_data, errors = validate_inputs(input_data=json_data)
+    if errors:
+        return _error_response(400, errors)
+
+    try:
+        result = make_prediction(input_data=input_data, as_numpy=True, version=requested)
+    except ModelNotFoundError as error:
+        return _json_response(404, {"predictions": None, "version": requested, "errors": str(error)})
+    if result.get("errors"):
+        return _json_response(400, {
+            "predictions": None, "version": result.get("version"), "errors": result["errors"],
+        })
+    return _json_response(200, {
+        "predictions": result.get("predictions"),
+        "prediction_probabilities": result.get("prediction_probabilities"),
+        "version": result.get("version"),
+        "errors": errors,
+    })
+
+
+def _activate(body: bytes) -> Response:
+    """Load, warm and activate a model version; runs on the inference pool."""
+    try:
+        json_data = serialization.loads(body or b"{}")
+    except ValueError:
+        return _json_response(400, {"errors": "Request body is not valid JSON"})
+    version = json_data.get("version") if isinstance(json_data, dict) else None
+    if not isinstance(version, str):
+        return _json_response(400, {"errors": "Body must contain the model version to activate"})
+    try:
+        activate_model(version, reload=bool(json_data.get("reload", False)))
+    except ModelNotFoundError as error:
+        return _json_response(404, {"errors": str(error)})
+    _logger.info("Activated model version %s", version)
+    return _json_response(200, models_status())
+
+
+def _header(scope, name: str) -> t.Optional[str]:
+    name = name.lower().encode()
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class PredictionApp:
+    """ASGI counterpart of the Flask app with the same endpoints.
+
+    The event loop only receives requests and sends responses. Parsing,
+    validation and CatBoost inference run on a bounded thread pool, and
+    CatBoost releases the GIL while it evaluates trees, so one process can
+    use every core. Once ``ASGI_MAX_PENDING`` predictions are queued or
+    running, further requests get ``503`` right away instead of waiting in
+    an unbounded queue.
+    """
+
+    def __init__(self, *, config_object):
+        self.inference_threads = config_object.ASGI_INFERENCE_THREADS or os.cpu_count() or 1
+        self.max_pending = config_object.ASGI_MAX_PENDING
+        self.max_body_size = config_object.ASGI_MAX_BODY_SIZE
+        self.warm_up_on_start = config_object.MODEL_WARM_UP
+        self.admin_token = config_object.MODEL_ADMIN_TOKEN
+        if config_object.METRICS_ENABLED:
+            metrics.enable()
+            metrics.register_collector(cache_metric_lines)
+        if config_object.PREDICTION_CACHE:
+            enable_prediction_cache(
+                max_size=config_object.PREDICTION_CACHE_SIZE,
+                ttl_seconds=config_object.PREDICTION_CACHE_TTL_S,
+                key=config_object.PREDICTION_CACHE_KEY,
+            )
+        self._executor = None
+        self._pending = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # Created on first use so each server worker process gets its own pool
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.inference_threads, thread_name_prefix="inference"
+            )
+        return self._executor
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            tracked = metrics.enabled
+            if tracked:
+                in_flight_gauge().inc()
+            try:
+                response = await self._route(scope, receive)
+            except ClientDisconnected:
+                # Nobody is left to answer, and a partial body is not scored
+                return
+            finally:
+                if tracked:
+                    in_flight_gauge().dec()
+            if tracked and scope["path"] != "/metrics":
+                path = scope["path"]
+                count_request(path if path in ROUTES else "other", response[0])
+            await self._send(send, *response)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if self.warm_up_on_start:
+                    # Loads off the event loop, so /health answers meanwhile
+                    self.executor.submit(warm_up)
+                _logger.debug("ASGI application started with %s inference threads", self.inference_threads)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                    self._executor = None
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _route(self, scope, receive) -> Response:
+        path, method = scope["path"], scope["method"]
+        if path == "/health":
+            if method != "GET":
+                return 405, b"Method not allowed", b"text/plain"
+            _logger.info("Health status OK")
+            return 200, b"ok", b"text/html; charset=utf-8"
+        if path == "/ready":
+            if method != "GET":
+                return 405, b"Method not allowed", b"text/plain"
+            ready = is_model_loaded()
+            return _json_response(
+                200 if ready else 503, {"ready": ready, "model_version": registry.active_version}
+            )
+        if path == "/version":
+            if method != "GET":
+                return 405, b"Method not allowed", b"text/plain"
+            return _json_response(200, {"model_version": model_version, "api_version": api_version})
+        if path == "/v1/predict/classification":
+            if method != "POST":
+                return 405, b"Method not allowed", b"text/plain"
+            return await self._predict(receive, _header(scope, VERSION_HEADER) or None)
+        if path == "/v1/models":
+            if method != "GET":
+                return 405, b"Method not allowed", b"text/plain"
+            return _json_response(200, models_status())
+        if path == "/metrics":
+            if method != "GET":
+                return 405, b"Method not allowed", b"text/plain"
+            if not metrics.enabled:
+                return 404, b"Metrics are disabled\n", b"text/plain"
+            return 200, metrics.render().encode(), METRICS_MIMETYPE.encode()
+        if path == "/v1/cache":
+            if method != "GET":
+                return 405, b"Method not allowed", b"text/plain"
+            return _json_response(200, {"models": cache_stats()})
+        if path == "/v1/models/active":
+            if method != "PUT":
+                return 405, b"Method not allowed", b"text/plain"
+            denied = activation_denied(_header(scope, "Authorization"), self.admin_token)
+            if denied is not None:
+                return _json_response(denied[0], {"errors": denied[1]})
+            body = await self._read_body(receive)
+            if body is None:
+                return _error_response(413, f"Request body exceeds {self.max_body_size} bytes")
+            # Loading takes a while, so it stays off the event loop
+            return await asyncio.get_running_loop().run_in_executor(self.executor, _activate, body)
+        return 404, b"Not found", b"text/plain"
+
+    async def _predict(self, receive, header_version: t.Optional[str]) -> Response:
+        if self._pending >= self.max_pending:
+            return _error_response(503, "Server is at capacity, retry later")
+
+        # Only the event loop thread touches the counter, so no lock is needed
+        self._pending += 1
+        try:
+            body = await self._read_body(receive)
+            if body is None:
+                return _error_response(413, f"Request body exceeds {self.max_body_size} bytes")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _predict, body, header_version)
+        finally:
+            self._pending -= 1
+
+    async def _read_body(self, receive) -> t.Optional[bytes]:
+        """The request body, or None if it exceeds ``max_body_size``.
+
+        Raises ``ClientDisconnected`` if the client disconnects first.
+        """
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnected()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _send(send, status: int, body: bytes, content_type: bytes) -> None:
+        headers = [(b"content-type", content_type), (b"content-length", str(len(body)).encode())]
+        if status == 503:
+            headers.append((b"retry-after", b"1"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def create_asgi_app(*, config_object) -> PredictionApp:
+    """Create the ASGI application instance."""
+    asgi_app = PredictionApp(config_object=config_object)
+    _logger.debug("ASGI application instance created")
+    return asgi_app
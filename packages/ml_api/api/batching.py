@@ -0,0 +1,118 @@
+import os
+import queue
+import threading
+import time
+import typing as t
+from concurrent import futures
+from concurrent.futures import Future
+
+
+class _Request(t.NamedTuple):
+    payload: t.Any
+    rows: int
+    future: Future
+
+
+class MicroBatcher:
+    """Coalesces concurrent prediction requests into one vectorised call.
+
+    Requests are queued and a background thread drains the queue into one
+    batch until it holds ``max_batch_size`` rows or ``max_wait_us``
+    microseconds have passed since the first request arrived. The batch
+    goes through ``batch_fn`` (a list of payloads in, one result per
+    payload out) and every waiting caller gets its own result back.
+    Requests that alone exceed ``max_batch_size`` bypass the queue.
+
+    If ``batch_fn`` raises, or returns the wrong number of results, every
+    caller in the batch gets the error. A caller that has waited
+    ``timeout_s`` gets ``TimeoutError`` and its request is dropped if it has
+    not been picked up yet.
+    """
+
+    def __init__(
+        self,
+        batch_fn: t.Callable[[t.List[t.Any]], t.List[t.Any]],
+        *,
+        max_batch_size: int,
+        max_wait_us: int,
+        timeout_s: float = 30.0,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_us / 1e6
+        self.timeout = timeout_s
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def _ensure_started(self) -> None:
+        # Threads do not survive a fork (e.g. gunicorn --preload), so the
+        # worker is started lazily in the process that serves requests.
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                if self._pid != os.getpid():
+                    # Requests queued by the parent process belong to it
+                    self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, name="prediction-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, payload: t.Any, *, rows: int) -> t.Any:
+        """Block until the batch holding ``payload`` has been scored."""
+        if rows >= self.max_batch_size:
+            return self.batch_fn([payload])[0]
+        self._ensure_started()
+        future = Future()
+        self._queue.put(_Request(payload, rows, future))
+        try:
+            return future.result(timeout=self.timeout)
+        # Not the builtin TimeoutError before Python 3.11
+        except futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Prediction batch did not finish within {self.timeout}s") from None
+
+    def _collect(self) -> t.List[_Request]:
+        batch = [self._queue.get()]
+        rows = batch[0].rows
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            rows += request.rows
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            # Callers that timed out cancelled their futures; the rest can
+            # no longer be cancelled once marked running
+            batch = [
+                request for request in self._collect()
+                if request.future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                continue
+            try:
+                results = list(self.batch_fn([request.payload for request in batch]))
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"Batch function returned {len(results)} results for {len(batch)} requests"
+                    )
+            except BaseException as error:
+                # Whatever batch_fn raised, its callers get it and the
+                # batcher keeps serving the next batch
+                for request in batch:
+                    request.future.set_exception(error)
+            else:
+                for request, result in zip(batch, results):
+                    request.future.set_result(result)
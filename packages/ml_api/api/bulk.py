@@ -0,0 +1,168 @@
+import struct
+import typing as t
+
+import numpy as np
+
+from classification_model.config.core import config
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - Arrow bodies are rejected without it
+    pa = None
+
+RAW_MIMETYPE = "application/octet-stream"
+ARROW_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+# Raw bodies: b"WLD1", the number of columns as uint32, then row-major
+# little-endian float32 values until the end of the body
+RAW_MAGIC = b"WLD1"
+RAW_HEADER = struct.Struct("<4sI")
+RAW_DTYPE = np.dtype("<f4")
+
+
+class BulkFormatError(ValueError):
+    """Raised when a bulk request body cannot be decoded."""
+
+
+def _read_exactly(stream, size: int) -> bytes:
+    """Read ``size`` bytes, or fewer only at the end of the stream."""
+    parts, remaining = [], size
+    while remaining:
+        part = stream.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b"".join(parts)
+
+
+class RawCodec:
+    """Raw float32 matrices in, raw float32 probability matrices out."""
+
+    mimetype = RAW_MIMETYPE
+
+    def __init__(self, stream, *, chunk_rows: int, content_length: t.Optional[int] = None):
+        self.features = config.ml_model_config.features
+        self.stream = stream
+        self.chunk_rows = chunk_rows
+        self.row_bytes = len(self.features) * RAW_DTYPE.itemsize
+
+        header = _read_exactly(stream, RAW_HEADER.size)
+        if len(header) != RAW_HEADER.size:
+            raise BulkFormatError("Body is too short for the raw header")
+        magic, n_columns = RAW_HEADER.unpack(header)
+        if magic != RAW_MAGIC:
+            raise BulkFormatError(f"Raw bodies must start with {RAW_MAGIC!r}")
+        if n_columns != len(self.features):
+            raise BulkFormatError(
+                f"Expected {len(self.features)} features per row: {self.features}, got {n_columns}"
+            )
+        if content_length is not None and (content_length - RAW_HEADER.size) % self.row_bytes:
+            raise BulkFormatError("Body length is not a whole number of rows")
+
+    def chunks(self) -> t.Iterator[np.ndarray]:
+        while True:
+            data = _read_exactly(self.stream, self.chunk_rows * self.row_bytes)
+            if not data:
+                return
+            if len(data) % self.row_bytes:
+                raise BulkFormatError("Body ends in the middle of a row")
+            yield np.frombuffer(data, dtype=RAW_DTYPE).reshape(-1, len(self.features))
+
+    def encode(self, proba_chunks: t.Iterable[np.ndarray]) -> t.Iterator[bytes]:
+        yield RAW_HEADER.pack(RAW_MAGIC, 2)
+        for proba in proba_chunks:
+            yield proba.astype(RAW_DTYPE).tobytes()
+
+
+class _ChunkSink:
+    """File-like sink that hands back whatever Arrow wrote since the last call."""
+
+    closed = False
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+class ArrowCodec:
+    """Arrow IPC streams in and out; feature columns are matched by name."""
+
+    mimetype = ARROW_MIMETYPE
+
+    def __init__(self, stream, *, chunk_rows: int):
+        if pa is None:
+            raise BulkFormatError("Arrow bodies require pyarrow to be installed")
+        self.features = config.ml_model_config.features
+        self.chunk_rows = chunk_rows
+        try:
+            self.reader = pa.ipc.open_stream(stream)
+        except pa.ArrowInvalid as error:
+            raise BulkFormatError(f"Body is not an Arrow IPC stream: {error}")
+
+        schema = self.reader.schema
+        missing = [feature for feature in self.features if feature not in schema.names]
+        if missing:
+            raise BulkFormatError(f"Missing features: {missing}")
+        for feature in self.features:
+            field_type = schema.field(feature).type
+            if not (pa.types.is_integer(field_type) or pa.types.is_floating(field_type)):
+                raise BulkFormatError(f"Feature {feature} must be numeric, got {field_type}")
+
+    def _batches(self) -> t.Iterator["pa.RecordBatch"]:
+        batches = iter(self.reader)
+        while True:
+            try:
+                yield next(batches)
+            except StopIteration:
+                return
+            except pa.ArrowInvalid as error:
+                # A truncated or corrupt batch after a valid schema
+                raise BulkFormatError(f"Body is not a valid Arrow IPC stream: {error}") from None
+
+    def chunks(self) -> t.Iterator[np.ndarray]:
+        for batch in self._batches():
+            # Producers choose the batch size, so large batches are re-sliced
+            for offset in range(0, batch.num_rows, self.chunk_rows):
+                chunk = batch.slice(offset, self.chunk_rows)
+                matrix = np.empty((chunk.num_rows, len(self.features)), dtype=np.float64)
+                for index, feature in enumerate(self.features):
+                    matrix[:, index] = chunk.column(feature).to_numpy(zero_copy_only=False)
+                yield matrix
+
+    def encode(self, proba_chunks: t.Iterable[np.ndarray]) -> t.Iterator[bytes]:
+        schema = pa.schema([("probability_0", pa.float64()), ("probability_1", pa.float64())])
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for proba in proba_chunks:
+                writer.write_batch(
+                    pa.record_batch([np.ascontiguousarray(proba[:, i]) for i in range(2)], schema=schema)
+                )
+                yield sink.take()
+        yield sink.take()
+
+
+def open_bulk_codec(
+    *, stream, mimetype: str, chunk_rows: int, content_length: t.Optional[int] = None
+) -> t.Union[RawCodec, ArrowCodec, None]:
+    """Pick the codec for a request body, or None if the media type is unsupported.
+
+    The header or schema is read here, so malformed bodies are rejected
+    before a streamed response starts.
+    """
+    if mimetype == RAW_MIMETYPE:
+        return RawCodec(stream, chunk_rows=chunk_rows, content_length=content_length)
+    if mimetype == ARROW_MIMETYPE:
+        return ArrowCodec(stream, chunk_rows=chunk_rows)
+    return None
@@ -1,4 +1,5 @@
 import logging
+import random
 import sys
 from typing import List
 import os
@@ -10,6 +11,47 @@ class Config:
     SECRET_KEY = os.environ.get("0775f88cb42061d8955f56f17560ff4b5d3a882f8e9e91e1e5e9517d071aeda8")
     SERVER_PORT = 5000
 
+    # Load and warm the model on a background thread at startup; otherwise
+    # the first prediction request loads it. /ready reports when it is done.
+    MODEL_WARM_UP = os.environ.get("MODEL_WARM_UP", "true").lower() == "true"
+
+    # Coalesce concurrent prediction requests into vectorised batches
+    PREDICTION_BATCHING = os.environ.get("PREDICTION_BATCHING", "false").lower() == "true"
+    PREDICTION_MAX_BATCH_SIZE = int(os.environ.get("PREDICTION_MAX_BATCH_SIZE", 256))
+    PREDICTION_MAX_WAIT_US = int(os.environ.get("PREDICTION_MAX_WAIT_US", 2000))
+    # Seconds a request waits for its batch before failing with 503
+    PREDICTION_BATCH_TIMEOUT_S = float(os.environ.get("PREDICTION_BATCH_TIMEOUT_S", 30))
+
+    # In-process LRU cache of prediction results per loaded model, keyed on
+    # CatBoost border buckets ("buckets") or clipped feature values ("values")
+    PREDICTION_CACHE = os.environ.get("PREDICTION_CACHE", "false").lower() == "true"
+    PREDICTION_CACHE_SIZE = int(os.environ.get("PREDICTION_CACHE_SIZE", 100_000))
+    PREDICTION_CACHE_TTL_S = float(os.environ.get("PREDICTION_CACHE_TTL_S", 3600))
+    PREDICTION_CACHE_KEY = os.environ.get("PREDICTION_CACHE_KEY", "buckets")
+
+    # Prometheus metrics on /metrics: per-stage timings, batch sizes and
+    # in-flight requests. Disabled, instrumentation is a flag check.
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "false").lower() == "true"
+
+    # Share of prediction requests whose input and output payloads are
+    # logged at debug level; 0 formats nothing
+    PAYLOAD_LOG_SAMPLE_RATE = float(os.environ.get("PAYLOAD_LOG_SAMPLE_RATE", 0.0))
+
+    # ASGI serving mode: inference thread pool size (0 uses every CPU),
+    # predictions queued or running before new ones get 503, and body limit
+    ASGI_INFERENCE_THREADS = int(os.environ.get("ASGI_INFERENCE_THREADS", 0))
+    ASGI_MAX_PENDING = int(os.environ.get("ASGI_MAX_PENDING", 256))
+    ASGI_MAX_BODY_SIZE = int(os.environ.get("ASGI_MAX_BODY_SIZE", 64 * 1024 * 1024))
+
+    # Bearer token required by PUT /v1/models/active; unset, switching the
+    # active model over HTTP is disabled
+    MODEL_ADMIN_TOKEN = os.environ.get("MODEL_ADMIN_TOKEN", "")
+
+    # Binary bulk endpoint: rows scored per chunk, and response size kept in
+    # memory before the encoded probabilities spill to a temporary file
+    BULK_CHUNK_ROWS = int(os.environ.get("BULK_CHUNK_ROWS", 65536))
+    BULK_SPOOL_BYTES = int(os.environ.get("BULK_SPOOL_BYTES", 8 * 1024 * 1024))
+
 class ProductionConfig(Config): 
     DEBUG = False
     SERVER_PORT = 5000
@@ -38,4 +80,14 @@ def get_logger(*, logger_name: str) -> logging.Logger:
 
         logger.addHandler(handler)
 
-    return logger
\ No newline at end of file
+    return logger
+
+
+def log_payload(logger: logging.Logger, label: str, payload, *, sample_rate: float) -> None:
+    """Log a request or response body at debug level for a sample of requests.
+
+    The payload is only formatted when it is actually logged, so with a
+    rate of 0 the hot path pays for a single comparison.
+    """
+    if sample_rate and random.random() < sample_rate and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", label, payload)
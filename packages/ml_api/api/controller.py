@@ -1,45 +1,31 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, g, request, jsonify
+import hmac
 import sys
-import os
+import tempfile
 from pathlib import Path
 
-# Add the classification model to the path - more robust approach
-current_file = Path(__file__).resolve()
-api_dir = current_file.parent  # api directory
-ml_api_dir = api_dir.parent    # ml_api directory
-packages_dir = ml_api_dir.parent  # packages directory
-project_root = packages_dir.parent  # project root directory
-
-# Add both project root and packages directory to path
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(packages_dir))
-
-print(f"Current file: {current_file}")
-print(f"Project root: {project_root}")
-print(f"Looking for classification_model in: {project_root / 'classification_model'}")
-
-try:
-    from classification_model.predict import make_prediction
-    from classification_model import __version__ as model_version
-    print("✓ Successfully imported classification_model")
-except ImportError as e:
-    print(f"✗ Failed to import classification_model: {e}")
-    print(f"Python path: {sys.path}")
-    # Try alternative path
-    alt_path = project_root.parent / "classification_model"
-    if alt_path.exists():
-        sys.path.insert(0, str(project_root.parent))
-        try:
-            from classification_model.predict import make_prediction
-            from classification_model import __version__ as model_version
-            print(f"✓ Successfully imported from alternative path: {alt_path}")
-        except ImportError as e2:
-            print(f"✗ Alternative import also failed: {e2}")
-            raise e
-    else:
-        raise e
-
-from catboost_ml.packages.ml_api.api.config import get_logger
+from werkzeug.wsgi import wrap_file
+
+# The model package lives at the project root, next to ``packages``
+project_root = Path(__file__).resolve().parents[3]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from classification_model import __version__ as model_version
+from classification_model.predict import (
+    activate_model,
+    cache_stats,
+    is_model_loaded,
+    make_bulk_prediction,
+    make_prediction,
+    registry,
+)
+from classification_model.processing import metrics
+from classification_model.processing.data_manager import ModelNotFoundError, available_model_versions
+from classification_model.processing.engine import MissingMediansError
+
+from catboost_ml.packages.ml_api.api import bulk, serialization
+from catboost_ml.packages.ml_api.api.config import get_logger, log_payload
 from catboost_ml.packages.ml_api.api.validation import validate_inputs
 
 # Import version directly to avoid circular import
@@ -47,8 +33,62 @@ api_version = "0.1.0"
 
 _logger = get_logger(logger_name=__name__)
 
+# Request header that selects a model version, like the body's ``version`` field
+VERSION_HEADER = "X-Model-Version"
+
 prediction_app = Blueprint('prediction_app', __name__)
 
+# Prometheus text exposition content type
+METRICS_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def count_request(endpoint: str, status: int) -> None:
+    metrics.counter(
+        "http_requests_total", help="Requests served, by endpoint and status.",
+        endpoint=endpoint, status=str(status),
+    ).inc()
+
+
+def in_flight_gauge() -> metrics.Gauge:
+    return metrics.gauge("http_requests_in_flight", help="Requests currently being served.")
+
+
+def cache_metric_lines():
+    """Prediction cache statistics per loaded model version, at scrape time."""
+    stats = cache_stats()
+    for name, key, kind, help_text in (
+        ("prediction_cache_hits_total", "hits", "counter", "Rows answered from the prediction cache."),
+        ("prediction_cache_misses_total", "misses", "counter", "Rows the prediction cache had to score."),
+        ("prediction_cache_entries", "size", "gauge", "Rows held in the prediction cache."),
+        ("prediction_cache_saved_seconds_total", "seconds_saved", "counter",
+         "Estimated model time saved by prediction cache hits."),
+    ):
+        if stats:
+            yield f"# HELP {name} {help_text}"
+            yield f"# TYPE {name} {kind}"
+        for version, version_stats in stats.items():
+            yield f'{name}{{version="{version}"}} {version_stats[key]}'
+
+
+@prediction_app.before_request
+def _track_request():
+    if metrics.enabled:
+        g.metrics_tracked = True
+        in_flight_gauge().inc()
+
+
+@prediction_app.after_request
+def _count_response(response):
+    if metrics.enabled and request.endpoint != "prediction_app.prometheus_metrics":
+        count_request(request.path, response.status_code)
+    return response
+
+
+@prediction_app.teardown_request
+def _untrack_request(exc):
+    if g.pop("metrics_tracked", False):
+        in_flight_gauge().dec()
+
 
 @prediction_app.route("/health", methods=['GET'])
 def health():
@@ -58,6 +98,14 @@ def health():
         return 'ok'
 
 
+@prediction_app.route("/ready", methods=['GET'])
+def ready():
+    """Readiness check: 200 once the model is loaded, 503 until then."""
+    if is_model_loaded():
+        return jsonify({"ready": True, "model_version": registry.active_version})
+    return jsonify({"ready": False, "model_version": registry.active_version}), 503
+
+
 @prediction_app.route('/version', methods=['GET'])
 def version():
     """Version information endpoint."""
@@ -68,32 +116,209 @@ def version():
         })
 
 
+def _json_response(payload: dict, status: int = 200) -> Response:
+    with metrics.stage("serialize"):
+        body = serialization.dumps(payload)
+    return Response(body, status=status, mimetype=serialization.JSON_MIMETYPE)
+
+
+def requested_version(json_data, header: str = None):
+    """Split the optional model ``version`` out of a request body.
+
+    Returns ``(json_data, version, errors)``. The body field wins over the
+    ``X-Model-Version`` header; without either the active model is used.
+    """
+    version = header or None
+    if isinstance(json_data, dict) and "version" in json_data:
+        json_data = dict(json_data)
+        version = json_data.pop("version")
+    if version is not None and not isinstance(version, str):
+        return json_data, None, "Model version must be a string"
+    return json_data, version, None
+
+
+def activation_denied(authorization: str, token: str):
+    """``(status, error)`` when a model switch lacks the admin token, else None.
+
+    Without a configured ``MODEL_ADMIN_TOKEN`` the switch is disabled.
+    """
+    if not token:
+        return 403, "Switching the active model is disabled; set MODEL_ADMIN_TOKEN to enable it"
+    if not hmac.compare_digest((authorization or "").encode(), f"Bearer {token}".encode()):
+        return 401, "Missing or invalid bearer token"
+    return None
+
+
+def models_status() -> dict:
+    return {
+        "active": registry.active_version,
+        "available": available_model_versions(),
+        "loaded": registry.loaded_versions(),
+    }
+
+
 @prediction_app.route("/v1/predict/classification", methods=['POST'])
 def predict():
-    """Make predictions on welding quality."""
+    """Make predictions on welding quality.
+
+    Accepts ``{"inputs": [row, ...]}``, a single row object, or the columnar
+    ``{"DV_R": [...], "DA_R": [...], ...}`` format. An optional ``version``
+    field or ``X-Model-Version`` header picks a model other than the
+    active one.
+    """
     if request.method == 'POST':
-        json_data = request.get_json()
-        _logger.debug(f"Inputs: {json_data}")
+        try:
+            with metrics.stage("parse"):
+                json_data = serialization.loads(request.get_data())
+        except ValueError:
+            return _json_response({
+                "predictions": None,
+                "version": model_version,
+                "errors": "Request body is not valid JSON"
+            }, 400)
+        sample_rate = current_app.config.get("PAYLOAD_LOG_SAMPLE_RATE", 0.0)
+        log_payload(_logger, "Inputs", json_data, sample_rate=sample_rate)
+
+        json_data, requested, errors = requested_version(json_data, request.headers.get(VERSION_HEADER))
+        if not errors:
+            with metrics.stage("validate_inputs"):
+                input_data, errors = validate_inputs(input_data=json_data)
 
-        input_data, errors = validate_inputs(input_data=json_data)
-        
         if errors:
-            return jsonify({
+            return _json_response({
                 "predictions": None,
                 "version": model_version,
                 "errors": errors
-            }), 400
+            }, 400)
 
-        result = make_prediction(input_data=input_data)
-        _logger.debug(f"Outputs: {result}")
+        # Batches are scored by the active model, so pinned requests skip them
+        batcher = current_app.extensions.get("prediction_batcher")
+        try:
+            if batcher is not None and requested is None:
+                result = batcher.submit(input_data, rows=len(input_data))
+            else:
+                result = make_prediction(input_data=input_data, as_numpy=True, version=requested)
+        except ModelNotFoundError as error:
+            return _json_response({"predictions": None, "version": requested, "errors": str(error)}, 404)
+        except TimeoutError as error:
+            return _json_response({"predictions": None, "version": model_version, "errors": str(error)}, 503)
+        log_payload(_logger, "Outputs", result, sample_rate=sample_rate)
+        if result.get("errors"):
+            # Rows the model package rejects after the API validator passed them
+            return _json_response({
+                "predictions": None,
+                "version": result.get("version"),
+                "errors": result["errors"],
+            }, 400)
 
         predictions = result.get('predictions')
         prediction_probs = result.get('prediction_probabilities')
         version = result.get('version')
 
-        return jsonify({
+        return _json_response({
             "predictions": predictions,
             "prediction_probabilities": prediction_probs,
             "version": version,
             "errors": errors
-        })
\ No newline at end of file
+        })
+
+
+@prediction_app.route("/v1/predict/classification/bulk", methods=['POST'])
+def predict_bulk():
+    """Score a binary stream of welding readings chunk by chunk.
+
+    The body is an Arrow IPC stream with the feature columns, or a raw
+    little-endian float32 matrix (see ``api.bulk``), chosen by Content-Type.
+    Chunks are scored as they arrive and the probabilities, in the same
+    format, are spooled to a temporary file that only stays in memory while
+    it is small. The ``X-Model-Version`` header selects the model. Missing
+    values are filled with the validator's fitted medians; for models saved
+    without them, a body with missing values is rejected with 400.
+
+    The response is sent once the whole body has been read: most HTTP
+    clients do not read a response while they are still uploading, so
+    answering earlier can deadlock on full socket buffers.
+    """
+    try:
+        codec = bulk.open_bulk_codec(
+            stream=request.stream,
+            mimetype=request.mimetype,
+            chunk_rows=current_app.config["BULK_CHUNK_ROWS"],
+            content_length=request.content_length,
+        )
+    except bulk.BulkFormatError as error:
+        return _json_response({"predictions": None, "version": model_version, "errors": str(error)}, 400)
+    if codec is None:
+        return _json_response({
+            "predictions": None,
+            "version": model_version,
+            "errors": f"Content-Type must be {bulk.RAW_MIMETYPE} or {bulk.ARROW_MIMETYPE}"
+        }, 415)
+
+    requested = request.headers.get(VERSION_HEADER) or None
+    spool = tempfile.SpooledTemporaryFile(max_size=current_app.config["BULK_SPOOL_BYTES"])
+    try:
+        for part in codec.encode(make_bulk_prediction(chunks=codec.chunks(), version=requested)):
+            spool.write(part)
+    except (bulk.BulkFormatError, MissingMediansError) as error:
+        spool.close()
+        return _json_response({"predictions": None, "version": model_version, "errors": str(error)}, 400)
+    except ModelNotFoundError as error:
+        spool.close()
+        return _json_response({"predictions": None, "version": requested, "errors": str(error)}, 404)
+
+    content_length = spool.tell()
+    spool.seek(0)
+    return Response(
+        wrap_file(request.environ, spool),
+        mimetype=codec.mimetype,
+        headers={"Content-Length": str(content_length)},
+        direct_passthrough=True,
+    )
+
+
+@prediction_app.route("/v1/models", methods=['GET'])
+def models():
+    """Saved model versions, those loaded in this process and the active one."""
+    return jsonify(models_status())
+
+
+@prediction_app.route("/v1/models/active", methods=['PUT'])
+def activate():
+    """Switch this process to ``{"version": ..., "reload": false}``.
+
+    The version is loaded and warmed before it takes traffic; requests
+    already running finish on the previous model. ``reload`` reads a
+    version that is already in memory from disk again. Requests must carry
+    ``Authorization: Bearer <MODEL_ADMIN_TOKEN>``.
+    """
+    denied = activation_denied(
+        request.headers.get("Authorization"), current_app.config.get("MODEL_ADMIN_TOKEN", "")
+    )
+    if denied is not None:
+        status, errors = denied
+        return jsonify({"errors": errors}), status
+    json_data = request.get_json(silent=True) or {}
+    version = json_data.get("version")
+    if not isinstance(version, str):
+        return jsonify({"errors": "Body must contain the model version to activate"}), 400
+    try:
+        activate_model(version, reload=bool(json_data.get("reload", False)))
+    except ModelNotFoundError as error:
+        return jsonify({"errors": str(error)}), 404
+    _logger.info("Activated model version %s", version)
+    return jsonify(models_status())
+
+
+@prediction_app.route("/v1/cache", methods=['GET'])
+def cache():
+    """Prediction cache size, hit rate and estimated time saved per loaded model."""
+    return jsonify({"models": cache_stats()})
+
+
+@prediction_app.route("/metrics", methods=['GET'])
+def prometheus_metrics():
+    """Stage timings, batch sizes and request gauges in Prometheus text format."""
+    if not metrics.enabled:
+        return Response("Metrics are disabled\n", status=404, mimetype="text/plain")
+    return Response(metrics.render(), mimetype=METRICS_MIMETYPE)
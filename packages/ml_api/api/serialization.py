@@ -0,0 +1,38 @@
+import json
+import typing as t
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the stdlib encoder is the fallback
+    orjson = None
+
+JSON_MIMETYPE = "application/json"
+
+
+def _default(value: t.Any) -> t.Any:
+    """Encode NumPy values the JSON encoders do not handle natively."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def loads(body: t.Union[bytes, str]) -> t.Any:
+    """Decode a JSON request body; raises ``ValueError`` if it is malformed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def dumps(payload: t.Any) -> bytes:
+    """Encode a response, writing NumPy arrays without boxing every float.
+
+    With orjson the arrays are serialised straight from their buffers;
+    otherwise they go through ``tolist`` and the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_default).encode()
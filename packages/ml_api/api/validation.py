@@ -1,7 +1,10 @@
 from typing import List, Optional, Tuple
 from marshmallow import Schema, fields, ValidationError
+import numpy as np
 import pandas as pd
 
+from classification_model.config.core import config
+
 
 class WeldingDataRequestSchema(Schema):
     """Schema for validating welding data prediction requests."""
@@ -20,8 +23,102 @@ def _filter_error_rows(errors: dict, validated_input: pd.DataFrame) -> pd.DataFr
     return validated_input
 
 
+# Marshmallow schemas are reusable; loading does not mutate them
+_schema = WeldingDataRequestSchema()
+
+# Value types the fast path converts exactly as ``fields.Float`` would
+_NUMERIC_TYPES = {int, float}
+
+
+def _fast_validate(inputs: list) -> Optional[np.ndarray]:
+    """Convert rows to a float matrix in one pass, or None if any row is not plain.
+
+    Only rows the schema would accept unchanged take this path: dicts with
+    exactly the feature keys and finite ``int``/``float`` values (``bool``
+    is its own type, so it is excluded like in marshmallow). Anything else
+    returns None and goes through the schema to get its exact error.
+    """
+    features = config.ml_model_config.features
+    n_features = len(features)
+    try:
+        if not all(type(row) is dict and len(row) == n_features for row in inputs):
+            return None
+        values = [row[feature] for row in inputs for feature in features]
+    except (KeyError, TypeError):
+        return None
+    if not set(map(type, values)) <= _NUMERIC_TYPES:
+        return None
+    try:
+        matrix = np.array(values, dtype=np.float64).reshape(-1, n_features)
+    except OverflowError:
+        return None
+    if not np.isfinite(matrix).all():
+        return None
+    return matrix
+
+
+def _fast_validate_columns(columns: dict) -> Optional[np.ndarray]:
+    """Columnar counterpart of ``_fast_validate`` for ``{"DV_R": [...], ...}``."""
+    features = config.ml_model_config.features
+    if len(columns) != len(features) or not all(type(columns.get(f)) is list for f in features):
+        return None
+    n_rows = len(columns[features[0]])
+    if any(len(columns[f]) != n_rows for f in features):
+        return None
+    if not all(set(map(type, columns[f])) <= _NUMERIC_TYPES for f in features):
+        return None
+    # Filled column by column so the matrix is C-contiguous without a transpose copy
+    matrix = np.empty((n_rows, len(features)), dtype=np.float64)
+    try:
+        for index, feature in enumerate(features):
+            matrix[:, index] = columns[feature]
+    except OverflowError:
+        return None
+    if not np.isfinite(matrix).all():
+        return None
+    return matrix
+
+
+def _range_errors(matrix: np.ndarray) -> Optional[str]:
+    """Report the first row with a value outside ``feature_ranges``, or None.
+
+    Every value is compared against the bound vectors in one pass; the
+    message names the row index and its offending features, like the
+    schema errors.
+    """
+    features = config.ml_model_config.features
+    ranges = config.ml_model_config.feature_ranges
+    lower = np.array([ranges[f]['min'] if f in ranges else -np.inf for f in features], dtype=np.float64)
+    upper = np.array([ranges[f]['max'] if f in ranges else np.inf for f in features], dtype=np.float64)
+    outside = (matrix < lower) | (matrix > upper)
+    rows = np.flatnonzero(outside.any(axis=1))
+    if not len(rows):
+        return None
+    row = rows[0]
+    messages = {
+        features[column]: [f"Must be between {lower[column]} and {upper[column]}."]
+        for column in np.flatnonzero(outside[row])
+    }
+    return f"Input {row}: {messages}"
+
+
+def _columns_to_rows(columns: dict) -> list:
+    """Turn a columnar request into rows so the schema can report errors by index."""
+    if not all(isinstance(values, list) for values in columns.values()):
+        raise ValueError("Columnar inputs must map every feature to a list of values")
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("Columnar inputs must have the same number of values for every feature")
+    n_rows = lengths.pop() if lengths else 0
+    return [{key: values[i] for key, values in columns.items()} for i in range(n_rows)]
+
+
 def validate_inputs(*, input_data):
-    """Check prediction request inputs."""
+    """Check prediction request inputs.
+
+    Returns ``(matrix, errors)``; ``errors`` names the first row that fails
+    the schema or falls outside ``feature_ranges``.
+    """
     
     errors = None
     validated_input = None
@@ -31,27 +128,43 @@ def validate_inputs(*, input_data):
             if 'inputs' in input_data:
                 # Multiple inputs format
                 inputs = input_data['inputs']
+            elif any(isinstance(value, list) for value in input_data.values()):
+                # Columnar format: {"DV_R": [...], "DA_R": [...], ...}
+                validated_input = _fast_validate_columns(input_data)
+                if validated_input is not None:
+                    return validated_input, _range_errors(validated_input)
+                inputs = _columns_to_rows(input_data)
             else:
                 # Single input format
                 inputs = [input_data]
         else:
             inputs = input_data
-            
-        # Validate each input
-        schema = WeldingDataRequestSchema()
+
+        validated_input = _fast_validate(inputs)
+        if validated_input is not None:
+            return validated_input, _range_errors(validated_input)
+
+        # Validate each input to report the first invalid row
         validated_inputs = []
         
         for i, input_item in enumerate(inputs):
             try:
-                validated_item = schema.load(input_item)
+                validated_item = _schema.load(input_item)
                 validated_inputs.append(validated_item)
             except ValidationError as exc:
                 errors = f"Input {i}: {exc.messages}"
                 break
                 
         if not errors:
-            validated_input = pd.DataFrame(validated_inputs)
-            
+            # Rows go to the model as a float matrix in feature order,
+            # which lets make_prediction skip DataFrame construction.
+            features = config.ml_model_config.features
+            validated_input = np.array(
+                [[item[feature] for feature in features] for item in validated_inputs],
+                dtype=np.float64,
+            ).reshape(-1, len(features))
+            errors = _range_errors(validated_input)
+
     except Exception as error:
         errors = str(error)
 
@@ -0,0 +1,18 @@
+from api.asgi import create_asgi_app
+from api.config import DevelopmentConfig, ProductionConfig
+import os
+
+application = create_asgi_app(
+    config_object=ProductionConfig if os.getenv("FLASK_ENV") == 'production' else DevelopmentConfig
+)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    # A single process: the inference pool spreads work over the cores
+    uvicorn.run(
+        application,
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        log_level='warning',
+    )
@@ -1,6 +1,13 @@
+import sys
+from pathlib import Path
+
+import numpy as np
 import pytest
 import pandas as pd
 
+# The API imports itself as ``catboost_ml``, the directory the package is checked out as
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
 
 @pytest.fixture
 def sample_input_data():
@@ -27,4 +34,63 @@ def sample_dataframe():
         "AV_R": [365, 380, 351],
         "AA_R": [7177, 8846, 5726],
         "PM_R": [9507, 9484, 9840]
-    })
\ No newline at end of file
+    })
+
+
+@pytest.fixture
+def training_csv(tmp_path):
+    """Small synthetic training file with the Dataset.csv layout."""
+    rng = np.random.default_rng(0)
+    n_rows = 2000
+    data = pd.DataFrame({
+        "PIPE_NO": [f"P{i:05d}" for i in range(n_rows)],
+        "DV_R": rng.integers(280, 360, n_rows),
+        "DA_R": rng.integers(6000, 9000, n_rows),
+        "AV_R": rng.integers(330, 400, n_rows),
+        "AA_R": rng.integers(5000, 9000, n_rows),
+        "PM_R": rng.integers(9000, 10000, n_rows),
+    })
+    data["FIN_JGMT"] = ((data["DV_R"] - 320) / 40 + rng.normal(size=n_rows) > -0.8).astype(int)
+    file_path = tmp_path / "Dataset.csv"
+    data.to_csv(file_path, index=False)
+    return file_path
+
+
+@pytest.fixture
+def training_config(training_csv, tmp_path, monkeypatch):
+    """Point the training pipeline at the synthetic file and a scratch cache."""
+    from classification_model.config.core import config
+    from classification_model.processing import data_manager
+    monkeypatch.setattr(config.app_config, "training_data_file", str(training_csv))
+    monkeypatch.setattr(data_manager, "DATASET_CACHE_DIR", tmp_path / "cache")
+    return config
+
+
+@pytest.fixture
+def enabled_metrics():
+    from classification_model.processing import metrics
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.enable(False)
+    metrics.reset()
+
+
+@pytest.fixture
+def api_config():
+    """API config without the warm-up thread, batching, prediction cache or metrics."""
+    api_config_module = pytest.importorskip("catboost_ml.packages.ml_api.api.config")
+
+    class ApiTestConfig(api_config_module.TestingConfig):
+        MODEL_WARM_UP = False
+        PREDICTION_BATCHING = False
+        PREDICTION_CACHE = False
+        METRICS_ENABLED = False
+
+    return ApiTestConfig
+
+
+@pytest.fixture
+def flask_client(api_config):
+    from catboost_ml.packages.ml_api.api.app import create_app
+    return create_app(config_object=api_config).test_client()
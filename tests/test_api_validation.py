@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from marshmallow import ValidationError
+
+from packages.ml_api.api import serialization
+from packages.ml_api.api.validation import WeldingDataRequestSchema, validate_inputs
+
+ROW = {"DV_R": 318, "DA_R": 7798.5, "AV_R": 365, "AA_R": 7177, "PM_R": 9507}
+
+
+def _schema_loop(inputs):
+    """Reference behaviour: one marshmallow load per row."""
+    schema = WeldingDataRequestSchema()
+    for i, item in enumerate(inputs):
+        try:
+            schema.load(item)
+        except ValidationError as exc:
+            return f"Input {i}: {exc.messages}"
+    return None
+
+
+def test_validate_inputs_returns_feature_matrix():
+    # When
+    validated, errors = validate_inputs(input_data={"inputs": [ROW, dict(ROW, DV_R=400.0)]})
+
+    # Then
+    assert errors is None
+    assert validated.dtype == np.float64
+    np.testing.assert_array_equal(
+        validated, [[318, 7798.5, 365, 7177, 9507], [400, 7798.5, 365, 7177, 9507]]
+    )
+
+
+@pytest.mark.parametrize(
+    "bad_row",
+    [
+        {key: value for key, value in ROW.items() if key != "PM_R"},
+        dict(ROW, DV_R=None),
+        dict(ROW, DV_R=True),
+        dict(ROW, DV_R="abc"),
+        dict(ROW, DV_R=float("nan")),
+        dict(ROW, extra=1),
+        [1, 2, 3, 4, 5],
+    ],
+)
+def test_validate_inputs_keeps_schema_errors(bad_row):
+    # Given
+    inputs = [ROW, ROW, bad_row, bad_row]
+
+    # When
+    validated, errors = validate_inputs(input_data={"inputs": inputs})
+
+    # Then
+    assert validated is None
+    assert errors == _schema_loop(inputs)
+    assert errors.startswith("Input 2: ")
+
+
+def test_validate_inputs_accepts_numeric_strings():
+    # Given: marshmallow coerces numeric strings, so they stay valid
+    validated, errors = validate_inputs(input_data=dict(ROW, DV_R="318"))
+
+    # Then
+    assert errors is None
+    np.testing.assert_array_equal(validated, [[318, 7798.5, 365, 7177, 9507]])
+
+
+def test_validate_inputs_accepts_columnar_format():
+    # Given
+    rows = [ROW, dict(ROW, DV_R=400)]
+    columns = {key: [row[key] for row in rows] for key in ROW}
+
+    # When
+    from_columns, column_errors = validate_inputs(input_data=columns)
+    from_rows, row_errors = validate_inputs(input_data={"inputs": rows})
+
+    # Then
+    assert column_errors is None and row_errors is None
+    assert from_columns.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(from_columns, from_rows)
+
+
+def test_validate_inputs_reports_columnar_errors_by_row():
+    # Given
+    columns = {key: [value, value, value] for key, value in ROW.items()}
+    columns["AV_R"][1] = None
+
+    # When
+    validated, errors = validate_inputs(input_data=columns)
+
+    # Then
+    assert validated is None
+    assert errors == "Input 1: {'AV_R': ['Field may not be null.']}"
+
+
+@pytest.mark.parametrize(
+    "input_data",
+    [
+        {"inputs": [ROW, ROW, dict(ROW, DV_R=900, PM_R=1), dict(ROW, DV_R=900)]},
+        {key: [value, value, 1 if key in ("DV_R", "PM_R") else value] for key, value in ROW.items()},
+        {"inputs": [ROW, dict(ROW, DV_R="318"), dict(ROW, DV_R="900", PM_R=1)]},
+    ],
+    ids=["rows", "columns", "schema"],
+)
+def test_validate_inputs_reports_out_of_range_rows(input_data):
+    # When
+    _, errors = validate_inputs(input_data=input_data)
+
+    # Then
+    assert errors == (
+        "Input 2: {'DV_R': ['Must be between 200.0 and 500.0.'], "
+        "'PM_R': ['Must be between 7000.0 and 12000.0.']}"
+    )
+
+
+def test_serialization_round_trips_numpy_arrays():
+    # Given
+    payload = {
+        "predictions": np.array([0, 1]),
+        "prediction_probabilities": np.array([[0.25, 0.75], [0.5, 0.5]]),
+    }
+
+    # When
+    decoded = serialization.loads(serialization.dumps(payload))
+
+    # Then
+    assert decoded == {
+        "predictions": [0, 1],
+        "prediction_probabilities": [[0.25, 0.75], [0.5, 0.5]],
+    }
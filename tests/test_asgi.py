@@ -0,0 +1,216 @@
+import asyncio
+import json
+
+import pytest
+
+from classification_model import __version__ as _version
+
+
+def _request(app, method, path, *, body=b"", headers=(), messages=None):
+    """Drive the ASGI callable once and return the status, headers and body sent."""
+    if messages is None:
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+    messages = list(messages)
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers],
+    }
+    asyncio.run(app(scope, receive, send))
+    if not sent:
+        return None
+    return sent[0]["status"], dict(sent[0]["headers"]), sent[1]["body"]
+
+
+@pytest.fixture
+def asgi_app(api_config):
+    from catboost_ml.packages.ml_api.api.asgi import create_asgi_app
+
+    class AsgiTestConfig(api_config):
+        ASGI_INFERENCE_THREADS = 2
+        ASGI_MAX_BODY_SIZE = 1024
+
+    return create_asgi_app(config_object=AsgiTestConfig)
+
+
+def test_health(asgi_app):
+    # When
+    status, _, body = _request(asgi_app, "GET", "/health")
+
+    # Then
+    assert (status, body) == (200, b"ok")
+    assert _request(asgi_app, "POST", "/health")[0] == 405
+    assert _request(asgi_app, "GET", "/nowhere")[0] == 404
+
+
+def test_predict(asgi_app, sample_input_data):
+    # When
+    status, headers, body = _request(
+        asgi_app, "POST", "/v1/predict/classification", body=json.dumps(sample_input_data).encode()
+    )
+
+    # Then
+    assert status == 200
+    assert headers[b"content-type"].startswith(b"application/json")
+    response = json.loads(body)
+    assert response["version"] == _version
+    assert len(response["predictions"]) == 1
+    assert response["errors"] is None
+
+
+def test_predict_rejects_invalid_json(asgi_app):
+    # When
+    status, _, body = _request(asgi_app, "POST", "/v1/predict/classification", body=b"{not json")
+
+    # Then
+    assert status == 400
+    assert json.loads(body)["errors"] == "Request body is not valid JSON"
+
+
+def test_oversized_body_is_rejected(asgi_app):
+    # Given
+    chunk = {"type": "http.request", "body": b" " * 600, "more_body": True}
+
+    # When
+    status, _, body = _request(asgi_app, "POST", "/v1/predict/classification", messages=[chunk, chunk])
+
+    # Then
+    assert status == 413
+    assert "exceeds 1024 bytes" in json.loads(body)["errors"]
+
+
+def test_backpressure_returns_503(asgi_app, sample_input_data):
+    # Given
+    asgi_app.max_pending = 0
+
+    # When
+    status, headers, _ = _request(
+        asgi_app, "POST", "/v1/predict/classification", body=json.dumps(sample_input_data).encode()
+    )
+
+    # Then
+    assert status == 503
+    assert headers[b"retry-after"] == b"1"
+
+
+def test_disconnect_aborts_the_request(asgi_app, monkeypatch):
+    # Given
+    from catboost_ml.packages.ml_api.api import asgi
+    scored = []
+    monkeypatch.setattr(asgi, "_predict", lambda *args: scored.append(args))
+    partial = {"type": "http.request", "body": b'{"inputs": [', "more_body": True}
+
+    # When
+    response = _request(
+        asgi_app, "POST", "/v1/predict/classification",
+        messages=[partial, {"type": "http.disconnect"}],
+    )
+
+    # Then
+    assert response is None
+    assert scored == []
+    assert asgi_app._pending == 0
+
+
+def test_lifespan_warms_up_and_shuts_down(api_config):
+    # Given
+    from catboost_ml.packages.ml_api.api.asgi import create_asgi_app
+    from catboost_ml.packages.ml_api.api.controller import is_model_loaded
+
+    class WarmConfig(api_config):
+        MODEL_WARM_UP = True
+
+    app = create_asgi_app(config_object=WarmConfig)
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    # When
+    asyncio.run(app({"type": "lifespan"}, receive, send))
+
+    # Then
+    assert [message["type"] for message in sent] == [
+        "lifespan.startup.complete", "lifespan.shutdown.complete",
+    ]
+    # Shutdown waits for the warm-up submitted at startup
+    assert is_model_loaded()
+    assert app._executor is None
+
+
+def test_activation_requires_the_admin_token(asgi_app):
+    # Given
+    body = json.dumps({"version": _version}).encode()
+
+    # When
+    disabled = _request(asgi_app, "PUT", "/v1/models/active", body=body)[0]
+    asgi_app.admin_token = "secret"
+    unauthorized = _request(asgi_app, "PUT", "/v1/models/active", body=body)[0]
+    status, _, response = _request(
+        asgi_app, "PUT", "/v1/models/active", body=body, headers=[("Authorization", "Bearer secret")]
+    )
+
+    # Then
+    assert (disabled, unauthorized, status) == (403, 401, 200)
+    assert json.loads(response)["active"] == _version
+
+
+def test_metrics_collapse_unknown_paths(enabled_metrics, asgi_app):
+    # When
+    _request(asgi_app, "GET", "/health")
+    for path in ("/nowhere", "/wp-login.php", "/health/../etc/passwd"):
+        _request(asgi_app, "GET", path)
+    status, _, body = _request(asgi_app, "GET", "/metrics")
+
+    # Then
+    assert status == 200
+    lines = body.decode().splitlines()
+    assert 'http_requests_total{endpoint="/health",status="200"} 1' in lines
+    assert 'http_requests_total{endpoint="other",status="404"} 3' in lines
+    assert "http_requests_in_flight 1" in lines
+    assert not any("/metrics" in line for line in lines)
+
+
+def test_predict_rejects_out_of_range_rows(asgi_app, sample_input_data):
+    # Given
+    row = dict(sample_input_data["inputs"][0], PM_R=1)
+
+    # When
+    status, _, body = _request(
+        asgi_app, "POST", "/v1/predict/classification", body=json.dumps({"inputs": [row]}).encode()
+    )
+
+    # Then
+    assert status == 400
+    assert json.loads(body)["errors"] == "Input 0: {'PM_R': ['Must be between 7000.0 and 12000.0.']}"
+
+
+def test_predict_returns_model_errors_as_400(asgi_app, sample_input_data, monkeypatch):
+    # Given
+    from catboost_ml.packages.ml_api.api import asgi
+    monkeypatch.setattr(
+        asgi, "make_prediction",
+        lambda **kwargs: {"predictions": None, "version": _version, "errors": "Rejected by the model"},
+    )
+
+    # When
+    status, _, body = _request(
+        asgi_app, "POST", "/v1/predict/classification", body=json.dumps(sample_input_data).encode()
+    )
+
+    # Then
+    assert status == 400
+    assert json.loads(body)["errors"] == "Rejected by the model"
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from classification_model import batch_score
+from classification_model.config.core import config
+from classification_model.predict import make_bulk_prediction
+
+
+def test_score_file_writes_predictions_in_order(training_csv, tmp_path):
+    # Given
+    output_path = tmp_path / "scored.csv"
+    data = pd.read_csv(training_csv)
+
+    # When
+    summary = batch_score.score_file(
+        input_path=training_csv,
+        output_path=output_path,
+        chunksize=300,
+        n_workers=2,
+        id_columns=["PIPE_NO"],
+    )
+
+    # Then
+    scored = pd.read_csv(output_path)
+    expected = next(make_bulk_prediction(chunks=[data[config.ml_model_config.features].to_numpy(np.float64)]))
+    assert summary["rows"] == len(data)
+    assert scored["PIPE_NO"].tolist() == data["PIPE_NO"].tolist()
+    np.testing.assert_allclose(scored[["probability_0", "probability_1"]], expected)
+    assert not batch_score.checkpoint_path_for(output_path).exists()
+
+
+def test_score_file_resumes_after_crash(training_csv, tmp_path, monkeypatch):
+    # Given: a run that dies after a few chunks
+    expected_path = tmp_path / "expected.csv"
+    batch_score.score_file(input_path=training_csv, output_path=expected_path, chunksize=300, n_workers=1)
+    output_path = tmp_path / "scored.csv"
+    iter_input_chunks = batch_score.iter_input_chunks
+
+    def crashing_chunks(**kwargs):
+        for index, chunk in enumerate(iter_input_chunks(**kwargs)):
+            if index == 4:
+                raise RuntimeError("worker node lost")
+            yield chunk
+
+    monkeypatch.setattr(batch_score, "iter_input_chunks", crashing_chunks)
+    with pytest.raises(RuntimeError):
+        batch_score.score_file(input_path=training_csv, output_path=output_path, chunksize=300, n_workers=1)
+    monkeypatch.setattr(batch_score, "iter_input_chunks", iter_input_chunks)
+
+    # When
+    summary = batch_score.score_file(
+        input_path=training_csv, output_path=output_path, chunksize=300, n_workers=1, resume=True
+    )
+
+    # Then
+    assert 0 < summary["rows_scored"] < summary["rows"]
+    assert output_path.read_bytes() == expected_path.read_bytes()
+
+
+@pytest.mark.parametrize("settings", [{"chunksize": 500}, {"id_columns": ["PIPE_NO"]}])
+def test_score_file_refuses_to_resume_with_other_settings(training_csv, tmp_path, monkeypatch, settings):
+    # Given: a checkpoint left by an interrupted run
+    output_path = tmp_path / "scored.csv"
+    iter_input_chunks = batch_score.iter_input_chunks
+
+    def crashing_chunks(**kwargs):
+        for index, chunk in enumerate(iter_input_chunks(**kwargs)):
+            if index == 2:
+                raise RuntimeError("worker node lost")
+            yield chunk
+
+    monkeypatch.setattr(batch_score, "iter_input_chunks", crashing_chunks)
+    with pytest.raises(RuntimeError):
+        batch_score.score_file(input_path=training_csv, output_path=output_path, chunksize=300, n_workers=1)
+    monkeypatch.setattr(batch_score, "iter_input_chunks", iter_input_chunks)
+
+    # When / Then
+    with pytest.raises(ValueError, match="chunksize or id_columns"):
+        batch_score.score_file(
+            input_path=training_csv, output_path=output_path,
+            **{"chunksize": 300, "n_workers": 1, **settings}, resume=True,
+        )
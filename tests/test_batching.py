@@ -0,0 +1,128 @@
+import threading
+
+import numpy as np
+import pytest
+
+from classification_model.predict import make_batch_prediction, make_prediction
+from packages.ml_api.api.batching import MicroBatcher
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    # Given
+    batch_sizes = []
+
+    def batch_fn(payloads):
+        batch_sizes.append(len(payloads))
+        return [payload * 2 for payload in payloads]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=64, max_wait_us=200_000)
+    results = {}
+
+    def client(value):
+        results[value] = batcher.submit(value, rows=1)
+
+    # When
+    threads = [threading.Thread(target=client, args=(value,)) for value in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Then
+    assert results == {value: value * 2 for value in range(8)}
+    assert sum(batch_sizes) == 8
+    assert len(batch_sizes) < 8
+
+
+def test_micro_batcher_propagates_errors():
+    # Given
+    def batch_fn(payloads):
+        raise ValueError("boom")
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=64, max_wait_us=1000)
+
+    # When / Then
+    with pytest.raises(ValueError, match="boom"):
+        batcher.submit(1, rows=1)
+
+
+def test_micro_batcher_fails_every_request_on_short_results():
+    # Given
+    batcher = MicroBatcher(lambda payloads: payloads[:1], max_batch_size=64, max_wait_us=200_000)
+    errors = []
+
+    def client(value):
+        try:
+            batcher.submit(value, rows=1)
+        except RuntimeError as error:
+            errors.append(error)
+
+    # When
+    threads = [threading.Thread(target=client, args=(value,)) for value in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # Then
+    assert not any(thread.is_alive() for thread in threads)
+    assert len(errors) == 4
+
+
+def test_micro_batcher_times_out_and_recovers():
+    # Given
+    release = threading.Event()
+
+    def batch_fn(payloads):
+        release.wait()
+        return payloads
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=64, max_wait_us=1000, timeout_s=0.1)
+
+    # When / Then
+    with pytest.raises(TimeoutError):
+        batcher.submit(1, rows=1)
+    release.set()
+    assert batcher.submit(2, rows=1) == 2
+
+
+def test_micro_batcher_resolves_requests_on_base_exception():
+    # Given
+    class Stop(BaseException):
+        pass
+
+    calls = []
+
+    def batch_fn(payloads):
+        calls.append(payloads)
+        if len(calls) == 1:
+            raise Stop()
+        return payloads
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=64, max_wait_us=1000, timeout_s=5)
+
+    # When / Then
+    with pytest.raises(Stop):
+        batcher.submit(1, rows=1)
+    assert batcher.submit(2, rows=1) == 2
+
+
+def test_make_batch_prediction_matches_make_prediction(sample_dataframe):
+    # Given
+    X = sample_dataframe.to_numpy(dtype=np.float64)
+    invalid = np.array([[318, 7798, 365, 7177]], dtype=np.float64)
+    inputs = [X[:1], invalid, X[1:]]
+
+    # When
+    results = make_batch_prediction(inputs=inputs)
+
+    # Then
+    assert len(results) == 3
+    assert results[1]["predictions"] is None
+    assert results[1]["errors"]
+    for result, matrix in ((results[0], X[:1]), (results[2], X[1:])):
+        expected = make_prediction(input_data=matrix)
+        assert result["predictions"] == expected["predictions"]
+        np.testing.assert_allclose(
+            result["prediction_probabilities"], expected["prediction_probabilities"]
+        )
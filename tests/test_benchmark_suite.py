@@ -0,0 +1,46 @@
+from benchmarks.suite import compare_results, main, measure
+
+
+def _report(**medians):
+    return {"results": {name: {"median_s": median} for name, median in medians.items()}}
+
+
+def test_compare_results_flags_regressions():
+    """Only slowdowns beyond the threshold count as regressions."""
+    # Given
+    base = _report(slower=1.0, noisy=1.0, faster=1.0, dropped=1.0)
+    head = _report(slower=1.2, noisy=1.1, faster=0.5, new=1.0)
+
+    # When
+    rows = {row["name"]: row for row in compare_results(base, head, threshold=0.15)}
+
+    # Then
+    assert rows["slower"]["status"] == "regression"
+    assert rows["noisy"]["status"] == "ok"
+    assert rows["faster"]["status"] == "improvement"
+    assert rows["dropped"]["status"] == "removed"
+    assert rows["new"]["status"] == "added"
+
+
+def test_compare_exits_non_zero_on_regression(tmp_path):
+    # Given
+    base, head = tmp_path / "base.json", tmp_path / "head.json"
+    base.write_text('{"results": {"case": {"median_s": 1.0}}}')
+    head.write_text('{"results": {"case": {"median_s": 2.0}}}')
+
+    # When / Then
+    assert main(["compare", str(base), str(head)]) == 1
+    assert main(["compare", str(base), str(head), "--threshold", "1.5"]) == 0
+
+
+def test_measure_reaches_min_repeats():
+    # Given
+    calls = []
+
+    # When
+    timing = measure(lambda: calls.append(1), min_time=0.0, min_repeats=3)
+
+    # Then
+    assert timing["repeats"] == 3
+    assert len(calls) == 4  # one warm-up call
+    assert timing["min_s"] <= timing["median_s"]
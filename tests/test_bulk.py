@@ -0,0 +1,146 @@
+import io
+
+import numpy as np
+import pytest
+
+from classification_model.config.core import config
+from classification_model.predict import make_bulk_prediction, make_prediction
+from packages.ml_api.api import bulk
+
+
+def _raw_body(X: np.ndarray) -> bytes:
+    return bulk.RAW_HEADER.pack(bulk.RAW_MAGIC, X.shape[1]) + X.astype("<f4").tobytes()
+
+
+def test_raw_codec_scores_in_chunks(sample_dataframe):
+    # Given
+    X = np.repeat(sample_dataframe[config.ml_model_config.features].to_numpy(np.float32), 5, axis=0)
+    codec = bulk.RawCodec(io.BytesIO(_raw_body(X)), chunk_rows=4)
+
+    # When
+    chunks = list(codec.chunks())
+    body = b"".join(codec.encode(make_bulk_prediction(chunks=iter(chunks))))
+
+    # Then
+    assert [len(chunk) for chunk in chunks] == [4, 4, 4, 3]
+    magic, n_columns = bulk.RAW_HEADER.unpack(body[:bulk.RAW_HEADER.size])
+    assert (magic, n_columns) == (bulk.RAW_MAGIC, 2)
+    proba = np.frombuffer(body[bulk.RAW_HEADER.size:], dtype="<f4").reshape(-1, 2)
+    expected = make_prediction(input_data=X.astype(np.float64))["prediction_probabilities"]
+    np.testing.assert_allclose(proba, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        (b"WLD", "too short"),
+        (bulk.RAW_HEADER.pack(b"NOPE", 5), "must start with"),
+        (bulk.RAW_HEADER.pack(bulk.RAW_MAGIC, 4), "Expected 5 features"),
+    ],
+)
+def test_raw_codec_rejects_bad_headers(body, message):
+    with pytest.raises(bulk.BulkFormatError, match=message):
+        bulk.RawCodec(io.BytesIO(body), chunk_rows=4)
+
+
+def test_raw_codec_rejects_partial_rows():
+    # Given
+    body = _raw_body(np.ones((2, 5)))[:-4]
+    codec = bulk.RawCodec(io.BytesIO(body), chunk_rows=4)
+
+    # When / Then
+    with pytest.raises(bulk.BulkFormatError, match="middle of a row"):
+        list(codec.chunks())
+
+
+def test_arrow_codec_round_trip(sample_dataframe):
+    # Given
+    pa = pytest.importorskip("pyarrow")
+    table = pa.Table.from_pandas(sample_dataframe, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    codec = bulk.ArrowCodec(pa.BufferReader(sink.getvalue()), chunk_rows=2)
+
+    # When
+    body = b"".join(codec.encode(make_bulk_prediction(chunks=codec.chunks())))
+
+    # Then
+    result = pa.ipc.open_stream(body).read_all()
+    assert result.column_names == ["probability_0", "probability_1"]
+    expected = make_prediction(input_data=sample_dataframe)["prediction_probabilities"]
+    np.testing.assert_allclose(result.to_pandas().to_numpy(), expected)
+
+
+def _arrow_body(frame, *, batches: int = 1) -> bytes:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for _ in range(batches):
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_bulk_route_scores_raw_bodies(flask_client, sample_dataframe):
+    # Given
+    X = sample_dataframe[config.ml_model_config.features].to_numpy(np.float32)
+
+    # When
+    response = flask_client.post(
+        "/v1/predict/classification/bulk", data=_raw_body(X), content_type=bulk.RAW_MIMETYPE
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.mimetype == bulk.RAW_MIMETYPE
+    proba = np.frombuffer(response.data[bulk.RAW_HEADER.size:], dtype="<f4").reshape(-1, 2)
+    expected = make_prediction(input_data=X.astype(np.float64))["prediction_probabilities"]
+    np.testing.assert_allclose(proba, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "body, content_type, status",
+    [
+        (b"WLD", bulk.RAW_MIMETYPE, 400),
+        (b"{}", "application/json", 415),
+    ],
+)
+def test_bulk_route_rejects_bad_requests(flask_client, body, content_type, status):
+    # When
+    response = flask_client.post("/v1/predict/classification/bulk", data=body, content_type=content_type)
+
+    # Then
+    assert response.status_code == status
+    assert response.get_json()["errors"]
+
+
+def test_bulk_route_rejects_arrow_streams_broken_mid_stream(flask_client, sample_dataframe):
+    # Given: a valid schema and first batch, then a truncated second batch
+    single = _arrow_body(sample_dataframe)
+    body = _arrow_body(sample_dataframe, batches=2)[:len(single) + 20]
+
+    # When
+    response = flask_client.post(
+        "/v1/predict/classification/bulk", data=body, content_type=bulk.ARROW_MIMETYPE
+    )
+
+    # Then
+    assert response.status_code == 400
+    assert "Arrow IPC stream" in response.get_json()["errors"]
+
+
+def test_bulk_route_rejects_missing_values_without_fitted_medians(flask_client, sample_dataframe):
+    """The shipped model has no fill medians, so missing values are a 400, not a guess."""
+    # Given
+    X = sample_dataframe[config.ml_model_config.features].to_numpy(np.float32, copy=True)
+    X[0, 0] = np.nan
+
+    # When
+    response = flask_client.post(
+        "/v1/predict/classification/bulk", data=_raw_body(X), content_type=bulk.RAW_MIMETYPE
+    )
+
+    # Then
+    assert response.status_code == 400
+    assert "--fit-medians" in response.get_json()["errors"]
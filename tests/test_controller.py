@@ -0,0 +1,139 @@
+import pytest
+
+from classification_model import __version__ as _version
+from classification_model.predict import registry, warm_up
+
+
+def test_ready_reports_503_until_the_model_is_loaded(flask_client, monkeypatch):
+    """/health answers straight away; /ready only once a model is warmed."""
+    # Given
+    monkeypatch.setattr(registry, "_active", None)
+
+    # When
+    health = flask_client.get("/health")
+    before = flask_client.get("/ready")
+    warm_up()
+    after = flask_client.get("/ready")
+
+    # Then
+    assert health.status_code == 200
+    assert before.status_code == 503
+    assert before.get_json() == {"ready": False, "model_version": _version}
+    assert after.status_code == 200
+    assert after.get_json() == {"ready": True, "model_version": _version}
+
+
+class _UnusableLock:
+    def __enter__(self):
+        raise AssertionError("unknown versions must not wait for the load lock")
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def admin_client(api_config):
+    from catboost_ml.packages.ml_api.api.app import create_app
+
+    class AdminConfig(api_config):
+        MODEL_ADMIN_TOKEN = "secret"
+
+    return create_app(config_object=AdminConfig).test_client()
+
+
+@pytest.mark.parametrize(
+    "header, body_version, status",
+    [
+        ("missing", _version, 200),
+        (_version, "missing", 404),
+        ("missing", None, 404),
+    ],
+)
+def test_predict_body_version_overrides_header(flask_client, sample_input_data, header, body_version, status):
+    # Given
+    body = dict(sample_input_data)
+    if body_version is not None:
+        body["version"] = body_version
+
+    # When
+    response = flask_client.post(
+        "/v1/predict/classification", json=body, headers={"X-Model-Version": header}
+    )
+
+    # Then
+    assert response.status_code == status
+    assert response.get_json()["version"] == (header if body_version is None else body_version)
+
+
+def test_unknown_version_is_rejected_without_the_load_lock(flask_client, sample_input_data, monkeypatch):
+    # Given
+    monkeypatch.setattr(registry, "_load_lock", _UnusableLock())
+
+    # When
+    response = flask_client.post(
+        "/v1/predict/classification", json={**sample_input_data, "version": "9.9.9"}
+    )
+
+    # Then
+    assert response.status_code == 404
+    assert response.get_json()["errors"] == "Model version 9.9.9 is not available"
+
+
+def test_activation_is_disabled_without_an_admin_token(flask_client):
+    # When
+    response = flask_client.put("/v1/models/active", json={"version": _version})
+
+    # Then
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize(
+    "authorization, version, status",
+    [
+        (None, _version, 401),
+        ("Bearer wrong", _version, 401),
+        ("Bearer secret", "9.9.9", 404),
+        ("Bearer secret", _version, 200),
+    ],
+)
+def test_activation_requires_the_admin_token(admin_client, authorization, version, status):
+    # Given
+    headers = {} if authorization is None else {"Authorization": authorization}
+
+    # When
+    response = admin_client.put("/v1/models/active", json={"version": version}, headers=headers)
+
+    # Then
+    assert response.status_code == status
+    if status == 200:
+        assert response.get_json()["active"] == _version
+
+
+def test_predict_rejects_out_of_range_rows(flask_client, sample_input_data):
+    # Given
+    row = dict(sample_input_data["inputs"][0], DV_R=900)
+
+    # When
+    response = flask_client.post("/v1/predict/classification", json={"inputs": [row]})
+
+    # Then
+    assert response.status_code == 400
+    assert response.get_json()["predictions"] is None
+    assert response.get_json()["errors"] == "Input 0: {'DV_R': ['Must be between 200.0 and 500.0.']}"
+
+
+def test_predict_returns_model_errors_as_400(flask_client, sample_input_data, monkeypatch):
+    """Errors raised by the model package are returned, not dropped."""
+    # Given
+    from catboost_ml.packages.ml_api.api import controller
+    monkeypatch.setattr(
+        controller, "make_prediction",
+        lambda **kwargs: {"predictions": None, "version": _version, "errors": "Rejected by the model"},
+    )
+
+    # When
+    response = flask_client.post("/v1/predict/classification", json=sample_input_data)
+
+    # Then
+    assert response.status_code == 400
+    assert response.get_json()["errors"] == "Rejected by the model"
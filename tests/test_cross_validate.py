@@ -0,0 +1,67 @@
+import json
+import math
+
+import numpy as np
+from sklearn.metrics import f1_score, precision_score, recall_score
+
+from classification_model.cross_validate import run_cross_validation, threshold_curve
+
+
+def test_threshold_curve_matches_sklearn():
+    # Given
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 500)
+    proba = np.clip(y_true * 0.3 + rng.random(500) * 0.7, 0, 1)
+    thresholds = np.linspace(0.0, 1.0, 11)
+
+    # When
+    curve = threshold_curve(y_true=y_true, proba=proba, positive=1, thresholds=thresholds)
+
+    # Then
+    for point, threshold in zip(curve, thresholds):
+        y_pred = (proba > threshold).astype(int)
+        assert np.isclose(point["precision"], precision_score(y_true, y_pred, zero_division=0))
+        assert np.isclose(point["recall"], recall_score(y_true, y_pred))
+        assert np.isclose(point["f1"], f1_score(y_true, y_pred, zero_division=0))
+
+
+def test_run_cross_validation_report(training_config, tmp_path, monkeypatch):
+    """Every row is held out once and the report is written as JSON."""
+    # Given
+    monkeypatch.setitem(training_config.ml_model_config.catboost_params, "iterations", 20)
+    monkeypatch.setattr(training_config.cv_config, "threshold_steps", 11)
+    output = tmp_path / "cv_report.json"
+
+    # When
+    report = run_cross_validation(n_folds=3, n_workers=2, output=output)
+
+    # Then
+    assert [fold["fold"] for fold in report["folds"]] == [0, 1, 2]
+    assert sum(fold["test_rows"] for fold in report["folds"]) == 2000
+    for fold in report["folds"]:
+        # Early stopping watches a split of the training rows, never the held-out ones
+        assert fold["train_rows"] + fold["validation_rows"] + fold["test_rows"] == 2000
+        test_size = training_config.ml_model_config.test_size
+        assert fold["validation_rows"] == math.ceil(test_size * (2000 - fold["test_rows"]))
+    assert all(fold["trees"] <= 20 for fold in report["folds"])
+    assert all(0.5 < fold["roc_auc"] <= 1.0 for fold in report["folds"])
+    assert len(report["threshold_curve"]) == 11
+    assert report["threads_per_fold"] >= 1
+    saved = json.loads(output.read_text())
+    assert saved["summary"]["roc_auc"]["mean"] == report["summary"]["roc_auc"]["mean"]
+
+
+def test_run_cross_validation_reuses_fold_pools(training_config, tmp_path, monkeypatch):
+    """Each fold's pools are quantized once and give the same report when reused."""
+    # Given
+    monkeypatch.setitem(training_config.ml_model_config.catboost_params, "iterations", 10)
+    first = run_cross_validation(n_folds=2, n_workers=1, output=tmp_path / "first.json")
+    pool_dirs = sorted(path.name for path in (tmp_path / "cache").glob("*/pool-*"))
+
+    # When
+    second = run_cross_validation(n_folds=2, n_workers=1, output=tmp_path / "second.json")
+
+    # Then
+    assert len(pool_dirs) == 2
+    assert sorted(path.name for path in (tmp_path / "cache").glob("*/pool-*")) == pool_dirs
+    assert second["out_of_fold"] == first["out_of_fold"]
@@ -0,0 +1,236 @@
+import os
+import shutil
+import signal
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import train_test_split
+
+from classification_model.config.core import config
+from classification_model.processing.data_manager import (
+    load_dataset_chunked,
+    stream_train_test_split,
+)
+
+
+def test_load_dataset_chunked(training_csv):
+    """Only the model columns are parsed, with compact dtypes."""
+    # When
+    data = load_dataset_chunked(file_name=str(training_csv), chunksize=300)
+
+    # Then
+    assert "PIPE_NO" not in data.columns
+    assert len(data) == 2000
+    assert all(data[feature].dtype == np.float32 for feature in config.ml_model_config.features)
+    assert data[config.ml_model_config.target].dtype == np.int8
+
+
+def test_stream_train_test_split_matches_sklearn(training_csv):
+    """The streamed split reproduces train_test_split row for row."""
+    # Given
+    features = config.ml_model_config.features
+    target = config.ml_model_config.target
+    data = pd.read_csv(training_csv)
+    expected = train_test_split(
+        data[features],
+        data[target],
+        test_size=config.ml_model_config.test_size,
+        random_state=config.ml_model_config.random_state,
+        stratify=data[target],
+    )
+
+    # When
+    result = stream_train_test_split(file_name=str(training_csv), chunksize=300)
+
+    # Then
+    for actual, reference in zip(result, expected):
+        np.testing.assert_array_equal(actual.to_numpy(), reference.to_numpy())
+
+
+def test_load_dataset_cached(training_csv, tmp_path, monkeypatch):
+    """The columnar cache is built once, memory-mapped and keyed on the source."""
+    # Given
+    from classification_model.processing import data_manager
+    monkeypatch.setattr(data_manager, "DATASET_CACHE_DIR", tmp_path / "cache")
+    expected = load_dataset_chunked(file_name=str(training_csv))
+
+    # When
+    first = data_manager.load_dataset_cached(file_name=str(training_csv), chunksize=300)
+    second = data_manager.load_dataset_cached(file_name=str(training_csv))
+
+    # Then
+    assert isinstance(first.X, np.memmap)
+    assert first.path == second.path
+    np.testing.assert_array_equal(first.X, expected[config.ml_model_config.features].to_numpy())
+    np.testing.assert_array_equal(first.y, expected[config.ml_model_config.target].to_numpy())
+
+    # A modified source file gets a fresh cache and the stale one is dropped
+    training_csv.write_text(training_csv.read_text() + "P99999,300,7000,350,6000,9500,1\n")
+    third = data_manager.load_dataset_cached(file_name=str(training_csv))
+    assert third.path != first.path
+    assert len(third.y) == len(first.y) + 1
+    assert not first.path.exists()
+
+
+def test_load_dataset_cached_keeps_other_datasets(training_csv, tmp_path, monkeypatch):
+    """Only older caches of the same file are dropped, and a removed cache is rebuilt."""
+    # Given
+    from classification_model.processing import data_manager
+    monkeypatch.setattr(data_manager, "DATASET_CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "other").mkdir()
+    other_csv = tmp_path / "other" / training_csv.name
+    other_csv.write_text(training_csv.read_text())
+    longer_csv = tmp_path / f"{training_csv.stem}-2023.csv"
+    longer_csv.write_text(training_csv.read_text())
+    other = data_manager.load_dataset_cached(file_name=str(other_csv))
+    longer = data_manager.load_dataset_cached(file_name=str(longer_csv))
+
+    # When
+    first = data_manager.load_dataset_cached(file_name=str(training_csv))
+    shutil.rmtree(first.path)
+    second = data_manager.load_dataset_cached(file_name=str(training_csv))
+
+    # Then
+    assert other.path.exists() and longer.path.exists()
+    assert len({other.path, longer.path, first.path}) == 3
+    assert second.path == first.path
+    assert len(second.y) == 2000
+
+
+def test_columnar_split_matches_stream_split(training_csv, tmp_path, monkeypatch):
+    """Splitting the cache gives the same rows as splitting the CSV, cold or warm."""
+    # Given
+    from classification_model.processing import data_manager
+    monkeypatch.setattr(data_manager, "DATASET_CACHE_DIR", tmp_path / "cache")
+    expected = stream_train_test_split(file_name=str(training_csv))
+    dataset = data_manager.load_dataset_cached(file_name=str(training_csv))
+
+    for _ in range(2):
+        # When
+        result = data_manager.columnar_train_test_split(dataset=dataset)
+
+        # Then
+        for actual, reference in zip(result, expected):
+            np.testing.assert_array_equal(actual.to_numpy(), reference.to_numpy())
+
+
+def test_streaming_split_is_stratified_and_capped(training_config):
+    """Quotas are met exactly per class, sampled to max_rows, the same on every pass."""
+    # Given
+    from classification_model.processing import data_manager
+    dataset = data_manager.load_dataset_cached(file_name=config.app_config.training_data_file)
+    class_counts = np.bincount(dataset.y)
+
+    def split_codes():
+        return np.concatenate([
+            split for _, _, split in data_manager.iter_streaming_split(
+                dataset=dataset, test_size=0.2, random_state=0, max_rows=1000, chunksize=300,
+            )
+        ])
+
+    # When
+    first, second = split_codes(), split_codes()
+
+    # Then
+    np.testing.assert_array_equal(first, second)
+    quotas = data_manager.streaming_split_quotas(
+        class_counts=class_counts, test_size=0.2, max_rows=1000
+    )
+    for label in range(len(class_counts)):
+        codes = first[np.asarray(dataset.y) == label]
+        assert (codes == data_manager.SPLIT_TRAIN).sum() == quotas[label, 0]
+        assert (codes == data_manager.SPLIT_EVAL).sum() == quotas[label, 2]
+    assert 990 <= (first != data_manager.SPLIT_DROPPED).sum() <= 1000
+
+
+def test_model_artifact_round_trip(sample_dataframe, tmp_path, monkeypatch):
+    """The .cbm + sidecar artifact scores exactly like the pickled pipeline."""
+    # Given
+    from classification_model.predict import load_pipeline_model
+    from classification_model.processing import data_manager
+    from classification_model.processing.engine import ArrayEngine
+    pipeline = load_pipeline_model().pipeline
+    monkeypatch.setattr(data_manager, "TRAINED_MODEL_DIR", tmp_path)
+    X = sample_dataframe[config.ml_model_config.features].to_numpy(dtype=np.float64)
+
+    # When
+    assert data_manager.load_model_artifact() is None
+    data_manager.save_model_artifact(pipeline=pipeline)
+    model, sidecar = data_manager.load_model_artifact()
+
+    # Then
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(data_manager.artifact_file_names())
+    expected = ArrayEngine(pipeline, features=config.ml_model_config.features).predict_proba(X)
+    np.testing.assert_array_equal(ArrayEngine.from_artifact(model, sidecar).predict_proba(X), expected)
+
+
+def test_save_pipeline_keeps_recent_versions(tmp_path, monkeypatch):
+    """Saving a model keeps the newest ``keep_versions`` versions on disk."""
+    # Given
+    from classification_model.predict import load_pipeline_model
+    from classification_model.processing import data_manager
+    pipeline = load_pipeline_model().pipeline
+    monkeypatch.setattr(data_manager, "TRAINED_MODEL_DIR", tmp_path)
+    monkeypatch.setattr(config.registry_config, "keep_versions", 2)
+
+    # When
+    for version in ("0.9.0", "0.10.0", "0.11.0"):
+        data_manager.save_pipeline(pipeline_to_persist=pipeline, version=version)
+
+    # Then
+    assert data_manager.available_model_versions() == ["0.10.0", "0.11.0"]
+    assert len(list(tmp_path.iterdir())) == 6
+
+
+def test_model_registry_activation_and_eviction():
+    """Activation swaps the served model; inactive versions are evicted LRU."""
+    # Given
+    from classification_model.processing.data_manager import ModelNotFoundError, ModelRegistry
+    loads = []
+
+    def loader(version):
+        if version == "missing":
+            raise ModelNotFoundError(version)
+        loads.append(version)
+        return {"version": version}
+
+    registry = ModelRegistry(loader=loader, default_version="1", max_loaded=2)
+
+    # When / Then
+    assert not registry.is_loaded()
+    assert registry.get() == {"version": "1"}
+    assert registry.get("2") == {"version": "2"}
+    in_flight = registry.get()
+    assert registry.activate("3") == {"version": "3"}
+    assert registry.get() == {"version": "3"}
+    assert in_flight == {"version": "1"}
+    # "1" was used least recently, "3" is active
+    assert registry.loaded_versions() == ["2", "3"]
+    registry.get("1")
+    assert registry.loaded_versions() == ["3", "1"]
+    assert loads == ["1", "2", "3", "1"]
+
+    with pytest.raises(ModelNotFoundError):
+        registry.activate("missing")
+    assert registry.active_version == "3"
+
+
+def test_model_registry_locks_are_fresh_after_fork():
+    """A child forked while a load holds the lock can still load models."""
+    # Given
+    from classification_model.processing.data_manager import ModelRegistry
+    registry = ModelRegistry(loader=lambda version: {"version": version}, default_version="1")
+    registry._load_lock.acquire()
+
+    # When
+    pid = os.fork()
+    if pid == 0:
+        # A deadlocked child is killed by the alarm instead of hanging the test
+        signal.alarm(10)
+        os._exit(0 if registry.get() == {"version": "1"} else 1)
+    _, status = os.waitpid(pid, 0)
+    registry._load_lock.release()
+
+    # Then
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
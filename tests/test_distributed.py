@@ -0,0 +1,22 @@
+from classification_model import distributed
+from classification_model.processing import data_manager
+from classification_model.processing.data_manager import available_model_versions
+
+
+def test_distributed_training_averages_shard_models(training_config, tmp_path, monkeypatch):
+    """Local workers each train a shard and the saved model holds all their trees."""
+    # Given
+    monkeypatch.setattr(data_manager, "TRAINED_MODEL_DIR", tmp_path / "models")
+    (tmp_path / "models").mkdir()
+    monkeypatch.setitem(training_config.ml_model_config.catboost_params, "iterations", 30)
+    monkeypatch.setattr(training_config.distributed_config, "timeout_s", 120)
+
+    # When
+    run = distributed.run_distributed_training(n_workers=2, launch="local")
+
+    # Then
+    assert [worker.shard for worker in run.workers] == [0, 1]
+    assert sum(worker.rows for worker in run.workers) == 1600
+    assert run.classifier.tree_count_ == sum(worker.trees for worker in run.workers)
+    assert run.classifier.classes_.tolist() == [0, 1]
+    assert available_model_versions()
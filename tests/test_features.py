@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 import pandas as pd
+from classification_model.processing.engine import MissingMediansError
 from classification_model.processing.preprocessors import DataValidator, FeatureEngineer
 
 
@@ -34,4 +36,73 @@ def test_feature_engineer(sample_dataframe):
     assert 'power_efficiency' in result.columns
     assert 'wire_feed_ratio' in result.columns
     assert 'voltage_current_ratio' in result.columns
-    assert len(result) == len(sample_dataframe)
\ No newline at end of file
+    assert len(result) == len(sample_dataframe)
+
+
+def test_data_validator_fills_with_fitted_medians(sample_dataframe):
+    """Missing values get the clipped training medians, even in a one-row batch."""
+    # Given
+    validator = DataValidator(feature_ranges={'DV_R': {'min': 200, 'max': 310}})
+    validator.fit(sample_dataframe)
+    row = sample_dataframe.iloc[[0]].astype(float)
+    row.loc[:, 'DV_R'] = np.nan
+    row.loc[:, 'DA_R'] = np.nan
+    original = row.copy()
+
+    # When
+    result = validator.transform(row)
+
+    # Then
+    assert result['DV_R'].iloc[0] == 310  # median of the clipped 318, 316, 309
+    assert result['DA_R'].iloc[0] == 7798
+    pd.testing.assert_frame_equal(row, original)
+
+
+def test_unfitted_data_validator_rejects_missing_values(sample_dataframe):
+    """Without fitted medians there is no fill that does not depend on the batch."""
+    # Given
+    data = sample_dataframe.astype(float)
+    data.loc[0, 'PM_R'] = np.nan
+
+    # When / Then
+    with pytest.raises(MissingMediansError, match='--fit-medians'):
+        DataValidator().transform(data)
+    pd.testing.assert_frame_equal(
+        DataValidator().transform(sample_dataframe), sample_dataframe.astype(float)
+    )
+
+
+def test_array_engine_matches_fitted_validator(sample_dataframe):
+    """ArrayEngine clips and fills exactly like a fitted DataValidator."""
+    # Given
+    from sklearn.dummy import DummyClassifier
+    from sklearn.pipeline import Pipeline
+
+    from classification_model.processing.engine import ArrayEngine
+    features = list(sample_dataframe.columns)
+    validator = DataValidator(feature_ranges={'DV_R': {'min': 200, 'max': 310}})
+    validator.fit(sample_dataframe)
+    classifier = DummyClassifier().fit(sample_dataframe, [0, 1, 1])
+    engine = ArrayEngine(
+        Pipeline([('data_validator', validator), ('classifier', classifier)]), features=features
+    )
+    X = np.array([[np.nan, 9000, np.nan, 6000, 9500], [400, np.nan, 360, 7000, 9600]])
+
+    # When
+    transformed = engine.transform(X)
+
+    # Then
+    expected = validator.transform(pd.DataFrame(X, columns=features)).to_numpy()
+    np.testing.assert_array_equal(transformed, expected)
+
+
+def test_feature_engineer_keeps_inputs(sample_dataframe):
+    # When
+    result = FeatureEngineer().transform(sample_dataframe)
+
+    # Then
+    np.testing.assert_allclose(
+        result['power_efficiency'],
+        sample_dataframe['PM_R'] / (sample_dataframe['DV_R'] * sample_dataframe['DA_R'] / 1000),
+    )
+    np.testing.assert_allclose(result[list(sample_dataframe.columns)], sample_dataframe)
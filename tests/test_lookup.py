@@ -0,0 +1,83 @@
+import numpy as np
+
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.processing.lookup import LookupTableModel
+
+
+def _model_inputs(n_rows: int) -> np.ndarray:
+    from classification_model.predict import _array_engine
+    frame = make_welding_frame(n_rows, seed=1)[config.ml_model_config.features]
+    return _array_engine.transform(frame.to_numpy(dtype=np.float64))
+
+
+def test_lookup_tables_match_catboost():
+    """Compiled tables give CatBoost's probabilities, also on border values."""
+    # Given
+    from classification_model.predict import _array_engine
+    catboost_model = _array_engine.model
+    lookup_model = LookupTableModel.from_catboost(catboost_model)
+    X = _model_inputs(2000)
+    # Values exactly on a border go left of the split, as in CatBoost
+    for feature, borders in enumerate(lookup_model.borders):
+        X[:len(borders), feature] = borders
+
+    # When
+    proba = lookup_model.predict(X, prediction_type="Probability")
+
+    # Then
+    expected = catboost_model.predict(X, prediction_type="Probability")
+    np.testing.assert_allclose(proba, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(
+        lookup_model.predict(X, prediction_type="RawFormulaVal"),
+        catboost_model.predict(X, prediction_type="RawFormulaVal"),
+        rtol=0, atol=1e-12,
+    )
+
+
+def test_lookup_tables_round_trip_and_fallback(tmp_path):
+    """Saved tables load back identically; large batches go to the fallback."""
+    # Given
+    from classification_model.predict import _array_engine
+    catboost_model = _array_engine.model
+    LookupTableModel.from_catboost(catboost_model).save(tmp_path / "model.lut.npz")
+    X = _model_inputs(20)
+
+    class Fallback:
+        calls = 0
+
+        def predict(self, X, prediction_type, thread_count):
+            self.calls += 1
+            return catboost_model.predict(X, prediction_type=prediction_type)
+
+    # When
+    fallback = Fallback()
+    loaded = LookupTableModel.load(tmp_path / "model.lut.npz", fallback=fallback, max_rows=10)
+    small, large = loaded.predict(X[:10]), loaded.predict(X)
+
+    # Then
+    assert fallback.calls == 1
+    np.testing.assert_allclose(small, catboost_model.predict(X[:10], prediction_type="Probability"), atol=1e-12)
+    np.testing.assert_array_equal(large, catboost_model.predict(X, prediction_type="Probability"))
+    assert loaded.classes_.tolist() == catboost_model.classes_.tolist()
+
+
+def test_compile_lookup_model_on_folded_pipeline():
+    """The scaler-free pipeline that training saves compiles and passes the parity check."""
+    # Given
+    from classification_model.pipeline import fold_scaler
+    from classification_model.predict import _classification_pipe
+    from classification_model.train_pipeline import compile_lookup_model
+    folded = fold_scaler(_classification_pipe)
+    X = make_welding_frame(500)[config.ml_model_config.features]
+
+    # When
+    lookup_model = compile_lookup_model(pipeline=folded, X=X)
+
+    # Then
+    assert lookup_model is not None
+    classifier = folded.named_steps["classifier"]
+    X_model = X.to_numpy(dtype=np.float64)
+    np.testing.assert_allclose(
+        lookup_model.predict(X_model), classifier.predict_proba(X_model), atol=1e-9
+    )
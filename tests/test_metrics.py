@@ -0,0 +1,83 @@
+import numpy as np
+
+from classification_model.processing import metrics
+
+
+def test_disabled_metrics_record_nothing():
+    """With metrics off, stage timers are a shared no-op and nothing is stored."""
+    # Given
+    metrics.reset()
+
+    # When
+    with metrics.stage("parse") as first, metrics.stage("model") as second:
+        metrics.observe_size("rows", 3, help="Rows.")
+
+    # Then
+    assert first is second
+    assert metrics.render() == "\n"
+
+
+def test_render_prometheus_text(enabled_metrics):
+    """Histograms render cumulative buckets with +Inf, sum and count."""
+    # Given
+    hist = metrics.histogram("latency_seconds", help="Latency.", buckets=(0.1, 1.0), stage="model")
+
+    # When
+    for value in (0.05, 0.5, 5.0):
+        hist.observe(value)
+    metrics.counter("requests_total", help="Requests.", status="200").inc()
+    with metrics.stage("parse"):
+        pass
+
+    # Then
+    lines = metrics.render().splitlines()
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{stage="model",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{stage="model",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{stage="model",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{stage="model"} 3' in lines
+    assert 'requests_total{status="200"} 1' in lines
+    assert 'prediction_stage_seconds_count{stage="parse"} 1' in lines
+
+
+def test_make_prediction_records_stages(enabled_metrics):
+    """A prediction times the engine stages and records its batch size."""
+    # Given
+    from classification_model.predict import make_prediction
+
+    # When
+    make_prediction(input_data=np.array([[318, 7798, 365, 7177, 9507]], dtype=np.float64))
+
+    # Then
+    text = metrics.render()
+    for stage in ("data_validator", "model"):
+        assert f'prediction_stage_seconds_count{{stage="{stage}"}}' in text
+    assert "prediction_request_rows_count 1" in text
+
+
+def test_flask_metrics_endpoint(enabled_metrics, flask_client):
+    """/metrics counts blueprint requests by path and shows itself in flight."""
+    # When
+    flask_client.get("/health")
+    flask_client.get("/health")
+    flask_client.get("/nowhere")
+    response = flask_client.get("/metrics")
+
+    # Then
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    lines = response.get_data(as_text=True).splitlines()
+    assert 'http_requests_total{endpoint="/health",status="200"} 2' in lines
+    assert "http_requests_in_flight 1" in lines
+    assert not any("/nowhere" in line or "/metrics" in line for line in lines)
+
+
+def test_flask_metrics_endpoint_is_404_when_disabled(flask_client):
+    # Given
+    metrics.reset()
+
+    # When
+    response = flask_client.get("/metrics")
+
+    # Then
+    assert response.status_code == 404
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import pandas as pd
 from classification_model.predict import make_prediction
@@ -37,4 +38,70 @@ def test_make_prediction_with_invalid_data():
     # Then
     assert result is not None
     # Should still work due to clipping in preprocessor
-    assert result["predictions"] is not None
\ No newline at end of file
+    assert result["predictions"] is not None
+
+
+def test_single_pass_engine_matches_pipeline(sample_dataframe):
+    """Labels derived from one probability pass match the pipeline's predict."""
+    # Given
+    from classification_model.predict import _classification_pipe, _engine
+
+    # When
+    labels, proba = _engine.predict(sample_dataframe)
+
+    # Then
+    assert (labels == _classification_pipe.predict(sample_dataframe)).all()
+    assert (proba == _classification_pipe.predict_proba(sample_dataframe)).all()
+
+
+def test_array_engine_matches_pipeline():
+    """The DataFrame-free engine reproduces classification_pipe exactly."""
+    # Given
+    from classification_model.config.core import config
+    from classification_model.predict import _array_engine, _classification_pipe
+    features = config.ml_model_config.features
+    rng = np.random.default_rng(0)
+    lower = np.array([config.ml_model_config.feature_ranges[f]["min"] for f in features])
+    upper = np.array([config.ml_model_config.feature_ranges[f]["max"] for f in features])
+    # Cover the clipping branch with values up to 20% outside the valid range
+    values = rng.uniform(lower * 0.8, upper * 1.2, size=(500, len(features))).round()
+
+    # When
+    labels, proba = _array_engine.predict(values)
+
+    # Then
+    frame = pd.DataFrame(values, columns=features)
+    assert (labels == _classification_pipe.predict(frame)).all()
+    np.testing.assert_allclose(proba, _classification_pipe.predict_proba(frame), rtol=0, atol=1e-12)
+
+
+def test_make_prediction_with_array(sample_dataframe):
+    """A float matrix in feature order takes the fast path with the same output."""
+    # When
+    from_frame = make_prediction(input_data=sample_dataframe)
+    from_array = make_prediction(input_data=sample_dataframe.to_numpy(dtype=float))
+
+    # Then
+    assert from_array["errors"] is None
+    assert from_array["predictions"] == from_frame["predictions"]
+    np.testing.assert_allclose(
+        from_array["prediction_probabilities"], from_frame["prediction_probabilities"]
+    )
+
+
+def test_fold_scaler_matches_pipeline(sample_dataframe):
+    """Folding the scaler into the tree borders does not change predictions."""
+    # Given
+    from classification_model.pipeline import check_pipeline_parity, fold_scaler
+    from classification_model.predict import _classification_pipe
+
+    # When
+    folded_pipe = fold_scaler(_classification_pipe)
+    parity = check_pipeline_parity(
+        reference=_classification_pipe, candidate=folded_pipe, X=sample_dataframe
+    )
+
+    # Then
+    assert "scaler" not in folded_pipe.named_steps
+    assert parity["label_mismatches"] == 0
+    assert parity["max_abs_diff"] < 1e-9
@@ -0,0 +1,98 @@
+import threading
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import make_welding_frame
+from classification_model.config.core import config
+from classification_model.processing.cache import CachedEngine, PredictionCache
+from classification_model.processing.engine import MissingMediansError
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_prediction_cache_lru_and_ttl():
+    """Entries expire after the TTL and the least recently used go first."""
+    # Given
+    clock = _Clock()
+    cache = PredictionCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put_many([b"a", b"b"], np.array([[0.1, 0.9], [0.2, 0.8]]))
+
+    # When
+    cache.get_many([b"a"])
+    cache.put_many([b"c"], np.array([[0.3, 0.7]]))
+
+    # Then
+    assert [row is not None for row in cache.get_many([b"a", b"b", b"c"])] == [True, False, True]
+    clock.now = 11
+    assert cache.get_many([b"a", b"c"]) == [None, None]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (3, 3, 1, 0)
+
+
+def test_prediction_cache_call_timing_is_thread_safe():
+    """Concurrent model-call timings are all counted, as are the savings."""
+    # Given
+    cache = PredictionCache(max_size=10, ttl_seconds=10)
+
+    def record():
+        for _ in range(2000):
+            cache.record_call(0.5)
+            cache.record_saved()
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+
+    # When
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Then
+    assert cache.model_calls == 16_000
+    assert cache.mean_call_seconds == 0.5
+    assert cache.stats()["seconds_saved"] == pytest.approx(8000.0)
+
+
+@pytest.mark.parametrize("key", ["buckets", "values"])
+def test_cached_engine_matches_engine(key):
+    """Cached results are identical to scoring every row, including bucket mates."""
+    # Given
+    from classification_model.predict import _array_engine
+    engine = CachedEngine(
+        _array_engine, cache=PredictionCache(max_size=10_000, ttl_seconds=60), key=key
+    )
+    X = make_welding_frame(500)[config.ml_model_config.features].to_numpy(dtype=np.float64)
+    # Nudged rows stay in the same CatBoost buckets unless they cross a border
+    nudged = X + 0.01
+
+    # When
+    engine.predict_proba(X)
+    cached = engine.predict_proba(np.concatenate([X, nudged]))
+
+    # Then
+    expected = _array_engine.predict_proba(np.concatenate([X, nudged]))
+    np.testing.assert_array_equal(cached, expected)
+    assert engine.cache.stats()["hits"] >= len(X)
+    if key == "buckets":
+        assert engine.cache.stats()["hits"] > len(X)
+
+
+def test_cached_engine_rejects_missing_values_without_fitted_medians():
+    """The shipped model has no fill medians, so rows with missing values are refused."""
+    # Given
+    from classification_model.predict import _array_engine
+    engine = CachedEngine(_array_engine, cache=PredictionCache(max_size=100, ttl_seconds=60))
+    X = np.array(make_welding_frame(4)[config.ml_model_config.features], dtype=np.float64)
+    X[0, 0] = np.nan
+
+    # When / Then
+    with pytest.raises(MissingMediansError):
+        engine.predict_proba(X)
+    assert len(engine.cache) == 0
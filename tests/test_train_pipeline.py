@@ -0,0 +1,156 @@
+import json
+import shutil
+
+from sklearn.pipeline import Pipeline
+
+from benchmarks.synthetic import make_welding_dataset
+from classification_model import __version__ as _version
+from classification_model.processing import data_manager
+from classification_model.train_pipeline import (
+    compile_lookup_model,
+    fit_classifier,
+    fit_validator_medians,
+    prepare_out_of_core_data,
+    prepare_training_data,
+    run_incremental_training,
+)
+
+
+def test_quantized_pools_are_reused(training_config):
+    """Pools are quantized once and loaded back on the next run."""
+    # When
+    first = prepare_training_data()
+    second = prepare_training_data()
+
+    # Then
+    assert first.train_pool.is_quantized()
+    assert second.eval_pool.is_quantized()
+    assert second.train_pool.num_row() == len(first.X_train)
+    assert second.eval_pool.num_row() == len(first.X_test)
+
+
+def test_fit_classifier_uses_early_stopping(training_config):
+    """The eval split drives early stopping and labels stay integers."""
+    # Given
+    data = prepare_training_data()
+
+    # When
+    classifier = fit_classifier(
+        train_pool=data.train_pool,
+        eval_pool=data.eval_pool,
+        class_names=data.class_names,
+        iterations=500, learning_rate=0.5, early_stopping_rounds=5,
+        allow_writing_files=False,
+    )
+
+    # Then
+    assert classifier.tree_count_ < 500
+    assert classifier.classes_.tolist() == [0, 1]
+
+
+def test_compile_lookup_model_passes_parity(training_config):
+    """A freshly trained classifier compiles into tables that pass the parity check."""
+    # Given
+    data = prepare_training_data()
+    classifier = fit_classifier(
+        train_pool=data.train_pool,
+        eval_pool=data.eval_pool,
+        class_names=data.class_names,
+        iterations=50,
+        allow_writing_files=False,
+    )
+    pipeline = Pipeline(data.preprocessor.steps + [("classifier", classifier)])
+
+    # When
+    lookup_model = compile_lookup_model(pipeline=pipeline, X=data.X_test)
+
+    # Then
+    assert lookup_model is not None
+    assert lookup_model.leaf_values.shape[0] == classifier.tree_count_
+
+
+def test_incremental_training_appends_trees(training_config, tmp_path, monkeypatch):
+    """An update keeps the base borders, adds bounded trees and saves a new version."""
+    # Given
+    monkeypatch.setattr(data_manager, "TRAINED_MODEL_DIR", tmp_path / "models")
+    (tmp_path / "models").mkdir()
+    monkeypatch.setattr(training_config.incremental_config, "max_new_trees", 20)
+    monkeypatch.setattr(training_config.incremental_config, "max_auc_drop", 1.0)
+    data = prepare_training_data()
+    base = fit_classifier(
+        train_pool=data.train_pool,
+        eval_pool=data.eval_pool,
+        class_names=data.class_names,
+        iterations=50,
+        allow_writing_files=False,
+    )
+    data_manager.save_pipeline(
+        pipeline_to_persist=Pipeline(data.preprocessor.steps + [("classifier", base)]),
+        version="0.1.0",
+    )
+    batch_path = tmp_path / "batch.csv"
+    make_welding_dataset(1000, seed=1).to_csv(batch_path, index=False)
+
+    # When
+    update = run_incremental_training(file_name=str(batch_path))
+
+    # Then
+    assert (update.base_version, update.version) == ("0.1.0", "0.1.1")
+    assert 0 < update.trees_added <= 20
+    saved = data_manager.load_pipeline(file_name=data_manager.model_file_names("0.1.1")[0])
+    classifier = saved.steps[-1][1]
+    assert classifier.tree_count_ == base.tree_count_ + update.trees_added
+    assert classifier.get_borders() == base.get_borders()
+    assert data_manager.available_model_versions() == ["0.1.0", "0.1.1"]
+
+
+def test_out_of_core_pools_fit_the_budget(training_config, monkeypatch):
+    """Streamed pools hold the rows the RAM budget allows and train like in-memory ones."""
+    # Given
+    from classification_model import train_pipeline
+    monkeypatch.setattr(train_pipeline, "OUT_OF_CORE_BYTES_PER_ROW", 1024)
+    monkeypatch.setattr(training_config.out_of_core_config, "ram_budget_mb", train_pipeline.OUT_OF_CORE_BASE_MB + 1)
+    monkeypatch.setattr(training_config.out_of_core_config, "chunk_rows", 300)
+
+    # When
+    data = prepare_out_of_core_data()
+    classifier = fit_classifier(
+        train_pool=data.train_pool,
+        eval_pool=data.eval_pool,
+        class_names=data.class_names,
+        iterations=50,
+        allow_writing_files=False,
+    )
+
+    # Then
+    assert data.max_rows == 1024
+    assert 1000 <= data.train_pool.num_row() + data.eval_pool.num_row() <= 1024
+    assert data.train_pool.is_quantized()
+    assert list(data.preprocessor.named_steps) == ["data_validator"]
+    assert classifier.classes_.tolist() == [0, 1]
+    pipeline = Pipeline(data.preprocessor.steps + [("classifier", classifier)])
+    assert compile_lookup_model(pipeline=pipeline, X=data.X_sample) is not None
+
+
+def test_fit_validator_medians_migrates_a_saved_model(training_config, tmp_path, monkeypatch):
+    """A model saved without medians gets them in its pickle and sidecar."""
+    # Given
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    for file_name in data_manager.model_file_names(_version):
+        shutil.copy(data_manager.TRAINED_MODEL_DIR / file_name, models_dir)
+    monkeypatch.setattr(data_manager, "TRAINED_MODEL_DIR", models_dir)
+    sidecar_name = data_manager.artifact_file_names(_version)[1]
+    assert json.loads((models_dir / sidecar_name).read_text()).get("medians") is None
+
+    # When
+    medians = fit_validator_medians(version=_version)
+
+    # Then
+    data = prepare_training_data()
+    expected = data.X_train[training_config.ml_model_config.features].median().to_numpy()
+    assert medians.tolist() == expected.tolist()
+    assert json.loads((models_dir / sidecar_name).read_text())["medians"] == expected.tolist()
+    pipeline = data_manager.load_pipeline(file_name=data_manager.model_file_names(_version)[0])
+    assert pipeline.named_steps["data_validator"].medians_ is not None
+    assert (models_dir / data_manager.lookup_file_name(_version)).is_file()
@@ -0,0 +1,63 @@
+import json
+import math
+
+from classification_model import tune
+from classification_model.processing.data_manager import load_quantized_pools
+
+
+def test_sample_candidates():
+    """Grid returns the full product, random draws distinct samples from it."""
+    # Given
+    search_space = {"depth": [4, 6], "learning_rate": [0.05, 0.1, 0.2]}
+
+    # When
+    grid = tune.sample_candidates(search_space=search_space, strategy="grid", n_trials=2, random_state=0)
+    sampled = tune.sample_candidates(search_space=search_space, strategy="random", n_trials=4, random_state=0)
+
+    # Then
+    assert len(grid) == 6
+    assert len(sampled) == 4
+    assert all(candidate in grid for candidate in sampled)
+    assert len({tuple(sorted(candidate.items())) for candidate in sampled}) == 4
+
+
+def test_run_tuning_halving(training_config, tmp_path, monkeypatch):
+    """Successive halving narrows the candidates and writes its outputs."""
+    # Given
+    monkeypatch.setattr(tune, "TUNING_DIR", tmp_path / "tuning")
+    monkeypatch.setitem(training_config.ml_model_config.catboost_params, "iterations", 40)
+    monkeypatch.setattr(training_config.tuning_config, "min_iterations", 10)
+    monkeypatch.setattr(training_config.tuning_config, "halving_factor", 2)
+    monkeypatch.setattr(
+        training_config.tuning_config, "search_space", {"depth": [2, 4], "l2_leaf_reg": [1, 5]}
+    )
+
+    # When
+    leaderboard = tune.run_tuning(strategy="halving", n_trials=4, n_workers=2)
+
+    # Then
+    assert [result["rung"] for result in leaderboard] == [2, 1, 1, 0, 0, 0, 0]
+    assert all(result["params"]["thread_count"] >= 1 for result in leaderboard)
+    saved = json.loads((tmp_path / "tuning" / "leaderboard.json").read_text())
+    assert saved["trials"][0]["candidate"] == leaderboard[0]["candidate"]
+    candidate_config = (tmp_path / "tuning" / "config_candidate.yml").read_text()
+    assert f"depth: {leaderboard[0]['candidate']['depth']}" in candidate_config
+
+
+def test_tuning_pools_leave_out_the_test_split(training_config):
+    """Candidates fit and score on a split of the training rows only."""
+    # Given
+    from classification_model.train_pipeline import prepare_training_data
+    data = prepare_training_data()
+
+    # When
+    pool_path, class_names = tune.prepare_tuning_pools(quantization={"border_count": 254})
+    fit_pool, validation_pool = load_quantized_pools(path=pool_path)
+
+    # Then
+    assert class_names == [0, 1]
+    assert fit_pool.num_row() + validation_pool.num_row() == len(data.X_train)
+    assert validation_pool.num_row() == math.ceil(
+        training_config.ml_model_config.test_size * len(data.X_train)
+    )
+    assert pool_path != data.pool_path